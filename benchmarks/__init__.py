@@ -0,0 +1,9 @@
+"""
+NanoWait Benchmarks
+-------------------
+Suíte offline para medir overhead por chamada, escalabilidade e precisão.
+
+Uso:
+    python -m benchmarks run -o results.json
+    python -m benchmarks compare base.json results.json --threshold 0.15
+"""
@@ -0,0 +1,93 @@
+"""
+CLI da suíte de benchmarks.
+
+    python -m benchmarks run [-o results.json] [--iterations N] [--only NAME ...]
+    python -m benchmarks compare BASE NEW [--threshold 0.15] [--stat p50]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import nano_wait
+from nano_wait.learning import AdaptiveLearning
+
+from .compare import compare, format_rows, load_results
+from .suite import BENCHMARKS, summarize
+
+
+def run(args) -> int:
+    names = args.only or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Isola o estado de aprendizado do usuário
+        AdaptiveLearning._storage_path = Path(tmp) / "learning.json"
+        for name in names:
+            print(f"running {name}...", file=sys.stderr)
+            for metric, samples in BENCHMARKS[name](args.iterations).items():
+                results[f"{name}.{metric}"] = summarize(samples)
+
+    payload = {
+        "schema": 1,
+        "created": datetime.utcnow().isoformat(),
+        "nano_wait_version": nano_wait.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    print(f"results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+def compare_cmd(args) -> int:
+    rows = compare(
+        load_results(args.base),
+        load_results(args.new),
+        stat=args.stat,
+        threshold=args.threshold,
+        min_delta=args.min_delta,
+    )
+    print(format_rows(rows))
+    regressions = [r for r in rows if r[4]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Executa a suíte e grava JSON")
+    p_run.add_argument("-o", "--output", default="bench_results.json")
+    p_run.add_argument("--iterations", type=int, default=50)
+    p_run.add_argument("--only", nargs="+", metavar="NAME")
+    p_run.set_defaults(func=run)
+
+    p_cmp = sub.add_parser("compare", help="Compara dois arquivos de resultados")
+    p_cmp.add_argument("base")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--threshold", type=float, default=0.15, help="Regressão relativa tolerada")
+    p_cmp.add_argument("--stat", default="p50", choices=["mean", "p50", "p95", "min", "max"])
+    p_cmp.add_argument("--min-delta", type=float, default=50e-6, help="Piso de ruído em segundos")
+    p_cmp.set_defaults(func=compare_cmd)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
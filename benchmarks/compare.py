@@ -0,0 +1,41 @@
+"""
+Comparação entre dois arquivos de resultados de benchmark.
+
+Uma métrica é considerada regressão quando o valor novo excede o valor base
+em mais de `threshold` (relativo) e em mais de `min_delta` segundos (piso de ruído).
+"""
+
+import json
+from typing import Dict, List, Tuple
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    base: Dict[str, dict],
+    new: Dict[str, dict],
+    *,
+    stat: str = "p50",
+    threshold: float = 0.15,
+    min_delta: float = 50e-6,
+) -> List[Tuple[str, float, float, float, bool]]:
+    """Retorna linhas (métrica, base, novo, razão, regressão)."""
+    rows = []
+    for name in sorted(set(base) & set(new)):
+        old_v = base[name][stat]
+        new_v = new[name][stat]
+        ratio = new_v / old_v if old_v > 0 else float("inf") if new_v > 0 else 1.0
+        regressed = ratio > 1 + threshold and (new_v - old_v) > min_delta
+        rows.append((name, old_v, new_v, ratio, regressed))
+    return rows
+
+
+def format_rows(rows) -> str:
+    lines = [f"{'metric':<36} {'base':>12} {'new':>12} {'ratio':>8}"]
+    for name, old_v, new_v, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        lines.append(f"{name:<36} {old_v * 1e3:>10.3f}ms {new_v * 1e3:>10.3f}ms {ratio:>8.2f}{flag}")
+    return "\n".join(lines)
@@ -0,0 +1,186 @@
+"""
+Benchmarks da API pública do NanoWait.
+
+Cada benchmark retorna um dicionário {métrica: [amostras em segundos]}.
+O estado de aprendizado é isolado em um diretório temporário para não
+alterar ~/.nano_wait_learning.json.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from typing import Callable, Dict, List
+
+from nano_wait.core import NanoWait, finalize_wait
+from nano_wait.nano_wait import wait
+from nano_wait.nano_wait_async import wait_async
+from nano_wait.nano_wait_auto import wait_auto
+from nano_wait.nano_wait_pool import wait_pool
+from nano_wait.execution import execute
+from nano_wait.pipeline import Pipeline
+
+BENCHMARKS: Dict[str, Callable[[int], Dict[str, List[float]]]] = {}
+
+SCALING_LEVELS = (1, 10, 100, 1000)
+BATCH_SIZE = 1_000_000
+OVERSHOOT_TARGETS = (0.001, 0.01, 0.05)
+
+
+def benchmark(name: str):
+    """Registra uma função de benchmark."""
+    def decorator(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return decorator
+
+
+def _timed(fn: Callable[[], object]):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Resume amostras em estatísticas comparáveis entre execuções."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "unit": "s",
+        "n": n,
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[n // 2],
+        "p95": ordered[min(n - 1, int(n * 0.95))],
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+# --------------------------
+# Overhead por chamada
+# --------------------------
+
+@benchmark("wait_time")
+def bench_wait_time(iterations: int):
+    """Overhead de wait(t): tempo real menos o tempo efetivamente dormido."""
+    samples = []
+    for _ in range(iterations):
+        elapsed, slept = _timed(lambda: wait(0.001))
+        samples.append(max(0.0, elapsed - slept))
+    return {"overhead": samples}
+
+
+@benchmark("wait_condition")
+def bench_wait_condition(iterations: int):
+    """Overhead de wait(cond) com condição já verdadeira."""
+    return {"overhead": [_timed(lambda: wait(lambda: True))[0] for _ in range(iterations)]}
+
+
+@benchmark("wait_auto")
+def bench_wait_auto(iterations: int):
+    samples = []
+    for _ in range(max(1, iterations // 10)):
+        elapsed, slept = _timed(lambda: wait_auto(0.001))
+        samples.append(max(0.0, elapsed - slept))
+    return {"overhead": samples}
+
+
+@benchmark("wait_async")
+def bench_wait_async(iterations: int):
+    async def run():
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            slept = await wait_async(0.001)
+            samples.append(max(0.0, time.perf_counter() - start - slept))
+        return samples
+    return {"overhead": asyncio.run(run())}
+
+
+@benchmark("wait_pool")
+def bench_wait_pool(iterations: int):
+    samples = []
+    for _ in range(max(1, iterations // 10)):
+        elapsed, results = _timed(lambda: wait_pool([0.001]))
+        samples.append(max(0.0, elapsed - max(r or 0.0 for r in results)))
+    return {"overhead": samples}
+
+
+@benchmark("execute")
+def bench_execute(iterations: int):
+    return {"overhead": [_timed(lambda: execute(lambda: True))[0] for _ in range(iterations)]}
+
+
+@benchmark("pipeline")
+def bench_pipeline(iterations: int):
+    def run():
+        return Pipeline().add(lambda: True).add(lambda: True).add(lambda: True).run()
+    return {"overhead_3_steps": [_timed(run)[0] for _ in range(max(1, iterations // 3))]}
+
+
+# --------------------------
+# Planejamento em lote
+# --------------------------
+
+@benchmark("plan_waits")
+def bench_plan_waits(iterations: int):
+    """plan_waits() com 1e6 tempos base contra o laço escalar equivalente."""
+    nw = NanoWait()
+    context = {"pc_score": 7.0, "wifi_score": None, "net_score": None}
+    bases = [0.001 * (i % 1000 + 1) for i in range(BATCH_SIZE)]
+    rounds = max(1, iterations // 50)
+
+    def scalar():
+        return [finalize_wait(nw.compute_wait(b, 1.5, context), b, 1.0, True) for b in bases]
+
+    out = {"batch_1e6": [_timed(lambda: nw.plan_waits(bases, 1.5, context))[0] for _ in range(rounds)]}
+    out["scalar_1e6"] = [_timed(scalar)[0] for _ in range(rounds)]
+    return out
+
+
+# --------------------------
+# Escalabilidade
+# --------------------------
+
+@benchmark("scaling_pool")
+def bench_scaling_pool(iterations: int):
+    """Tempo total de wait_pool com N esperas concorrentes."""
+    out = {}
+    for n in SCALING_LEVELS:
+        out[f"n{n}"] = [_timed(lambda: wait_pool([0.01] * n))[0] for _ in range(3)]
+    return out
+
+
+@benchmark("scaling_threads")
+def bench_scaling_threads(iterations: int):
+    """Tempo total de N threads executando wait(0.01) simultaneamente."""
+    out = {}
+    for n in SCALING_LEVELS:
+        samples = []
+        for _ in range(3):
+            threads = [threading.Thread(target=wait, args=(0.01,)) for _ in range(n)]
+            start = time.perf_counter()
+            for th in threads:
+                th.start()
+            for th in threads:
+                th.join()
+            samples.append(time.perf_counter() - start)
+        out[f"n{n}"] = samples
+    return out
+
+
+# --------------------------
+# Precisão (overshoot)
+# --------------------------
+
+@benchmark("overshoot")
+def bench_overshoot(iterations: int):
+    """Quanto o sleep real excede o tempo calculado pelo motor."""
+    out = {}
+    for target in OVERSHOOT_TARGETS:
+        samples = []
+        for _ in range(max(1, iterations // 5)):
+            elapsed, slept = _timed(lambda: wait(target))
+            samples.append(abs(elapsed - slept))
+        out[f"t{target}"] = samples
+    return out
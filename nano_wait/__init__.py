@@ -1,37 +1,63 @@
 """
 🚀 NanoWait — Adaptive Execution Engine for Python
 -------------------------------------------------
-Uma biblioteca para automação inteligente que substitui o time.sleep() estático 
+Uma biblioteca para automação inteligente que substitui o time.sleep() estático
 por um motor de execução adaptativo baseado em telemetria de hardware e rede.
+
+Os submódulos são carregados sob demanda (PEP 562): `import nano_wait` não
+importa asyncio, tkinter, psutil, pywifi nem pyautogui.
 """
 
 __version__ = "6.0.0"
 __author__ = "NanoWait Team"
 
-from .nano_wait import wait, NanoWait
-from .nano_wait_async import wait_async
-from .nano_wait_pool import wait_pool, wait_pool_async
-from .nano_wait_auto import wait_auto
-
-# Camada de Execução e Retentativa
-from .execution import execute, ExecutionResult
-from .decorators import retry
-
-# Camada de Agente (Experimental)
-try:
-    from .agent import Agent
-except ImportError:
-    Agent = None
-
-__all__ = [
-    "wait",
-    "wait_auto",
-    "NanoWait",
-    "wait_async",
-    "wait_pool",
-    "wait_pool_async",
-    "execute",
-    "ExecutionResult",
-    "retry",
-    "Agent",
-]
+# nome público -> (submódulo, atributo)
+_LAZY_ATTRS = {
+    "wait": (".nano_wait", "wait"),
+    "NanoWait": (".nano_wait", "NanoWait"),
+    "wait_async": (".nano_wait_async", "wait_async"),
+    "wait_pool": (".nano_wait_pool", "wait_pool"),
+    "wait_pool_async": (".nano_wait_pool", "wait_pool_async"),
+    "wait_auto": (".nano_wait_auto", "wait_auto"),
+    "WaitConfig": (".core", "WaitConfig"),
+    "MonotonicClock": (".clock", "MonotonicClock"),
+    "VirtualClock": (".clock", "VirtualClock"),
+    "use_clock": (".clock", "use_clock"),
+    "CancelToken": (".cancel", "CancelToken"),
+    "CANCELLED": (".cancel", "CANCELLED"),
+    "install_sigterm_hook": (".cancel", "install_sigterm_hook"),
+    "PhaseReport": (".hooks", "PhaseReport"),
+    "PhaseStats": (".hooks", "PhaseStats"),
+    "add_hook": (".hooks", "add_hook"),
+    "remove_hook": (".hooks", "remove_hook"),
+    # Camada de Execução e Retentativa
+    "execute": (".execution", "execute"),
+    "ExecutionResult": (".execution", "ExecutionResult"),
+    "retry": (".decorators", "retry"),
+    # Camada de Agente (Experimental)
+    "Agent": (".agent", "Agent"),
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+    try:
+        value = getattr(import_module(module_name, __name__), attr)
+    except ImportError:
+        if name != "Agent":
+            raise
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
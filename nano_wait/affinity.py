@@ -0,0 +1,172 @@
+"""
+NanoWait Affinity CPU
+---------------------
+Score de CPU restrito aos núcleos em que o processo pode rodar.
+
+Processos fixados com `taskset`/cpusets não se importam com um núcleo
+ocupado em outro lugar, mas sofrem quando os *seus* núcleos saturam. Aqui o
+uso vem dos contadores por CPU de /proc/stat, filtrados por
+os.sched_getaffinity(0), e é calculado por delta entre leituras (sem sleep).
+
+Opcionalmente combina o uso de CPU e a memória residente (RSS) do próprio
+processo, via psutil.Process quando disponível ou /proc/self como fallback.
+A memória do processo nunca substitui a pressão de memória do sistema: o
+score é o pior dos dois.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, Optional, Tuple
+
+PROC_STAT = "/proc/stat"
+PROC_MEMINFO = "/proc/meminfo"
+
+
+def _clamp(score: float) -> float:
+    return max(0.0, min(10.0, score))
+
+
+def allowed_cpus() -> FrozenSet[int]:
+    try:
+        return frozenset(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return frozenset(range(os.cpu_count() or 1))
+
+
+def read_cpu_times(path: str = PROC_STAT) -> Dict[int, Tuple[float, float]]:
+    """{cpu: (ocupado, total)} em ticks, a partir das linhas cpuN de /proc/stat."""
+    times: Dict[int, Tuple[float, float]] = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                if not line.startswith("cpu") or line[3] == " ":
+                    continue
+                fields = line.split()
+                values = [float(v) for v in fields[1:9]]
+                total = sum(values)
+                idle = values[3] + (values[4] if len(values) > 4 else 0.0)  # idle + iowait
+                times[int(fields[0][3:])] = (total - idle, total)
+    except (OSError, ValueError, IndexError):
+        return {}
+    return times
+
+
+def system_memory_share(meminfo_path: str = PROC_MEMINFO) -> Optional[float]:
+    """Fração (0-1) da memória do sistema em uso (psutil ou MemAvailable de /proc/meminfo)."""
+    try:
+        import psutil
+        return psutil.virtual_memory().percent / 100
+    except Exception:
+        pass
+    fields = {}
+    try:
+        with open(meminfo_path) as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                if name in ("MemTotal", "MemAvailable"):
+                    fields[name] = float(rest.split()[0])
+        return 1 - fields["MemAvailable"] / fields["MemTotal"]
+    except (OSError, ValueError, IndexError, KeyError, ZeroDivisionError):
+        return None
+
+
+class AffinityCPU:
+    """Uso incremental dos núcleos permitidos (e, opcionalmente, do processo)."""
+
+    def __init__(self, cpus: Optional[FrozenSet[int]] = None, *, include_process: bool = False,
+                 stat_path: str = PROC_STAT, meminfo_path: str = PROC_MEMINFO):
+        self.cpus = frozenset(cpus) if cpus is not None else allowed_cpus()
+        self.include_process = include_process
+        self.stat_path = stat_path
+        self.meminfo_path = meminfo_path
+        self._lock = threading.Lock()
+        self._last = self._sample()
+        self._process = _ProcessUsage() if include_process else None
+
+    def _sample(self) -> Tuple[float, float]:
+        busy = total = 0.0
+        for cpu, (b, t) in read_cpu_times(self.stat_path).items():
+            if cpu in self.cpus:
+                busy += b
+                total += t
+        return busy, total
+
+    def utilisation(self) -> Optional[float]:
+        """Fração (0-1) ocupada dos núcleos permitidos desde a última leitura."""
+        sample = self._sample()
+        with self._lock:
+            last, self._last = self._last, sample
+        d_total = sample[1] - last[1]
+        if d_total <= 0:
+            return None
+        return max(0.0, min(1.0, (sample[0] - last[0]) / d_total))
+
+    def cpu_score(self, options=None) -> Optional[float]:
+        loads = [self.utilisation()]
+        if self._process is not None:
+            loads.append(self._process.cpu_share(len(self.cpus)))
+        loads = [x for x in loads if x is not None]
+        if not loads:
+            return None
+        return round(_clamp(10 * (1 - max(loads))), 2)
+
+    def memory_score(self, options=None) -> Optional[float]:
+        """
+        Pior entre a pressão de memória do sistema e a fração da memória física
+        ocupada pelo RSS do processo: um processo pequeno em uma máquina
+        trocando páginas não é saudável.
+        """
+        usages = [system_memory_share(self.meminfo_path), (self._process or _ProcessUsage()).rss_share()]
+        usages = [u for u in usages if u is not None]
+        if not usages:
+            return None
+        return round(_clamp(10 * (1 - max(usages))), 2)
+
+
+class _ProcessUsage:
+    """CPU (por delta) e RSS do próprio processo."""
+
+    def __init__(self):
+        try:
+            import psutil
+            self._proc = psutil.Process()
+            self._proc.cpu_percent(interval=None)  # define a base do delta
+        except Exception:
+            self._proc = None
+        self._last = (time.monotonic(), _own_cpu_seconds())
+
+    def cpu_share(self, ncpus: int) -> Optional[float]:
+        if self._proc is not None:
+            try:
+                return self._proc.cpu_percent(interval=None) / (100 * max(1, ncpus))
+            except Exception:
+                pass
+        now, used = time.monotonic(), _own_cpu_seconds()
+        (t0, u0), self._last = self._last, (now, used)
+        if used is None or u0 is None or now <= t0:
+            return None
+        return (used - u0) / ((now - t0) * max(1, ncpus))
+
+    def rss_share(self) -> Optional[float]:
+        if self._proc is not None:
+            try:
+                import psutil
+                return self._proc.memory_info().rss / psutil.virtual_memory().total
+            except Exception:
+                pass
+        try:
+            with open("/proc/self/statm") as f:
+                rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            total = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+            return rss / total
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+
+
+def _own_cpu_seconds() -> Optional[float]:
+    try:
+        t = os.times()
+        return t.user + t.system
+    except Exception:
+        return None
@@ -2,14 +2,18 @@
 
 from typing import Optional
 
-try:
-    import pyautogui
-except Exception:
-    pyautogui = None
-
 from .nano_wait import wait
 
 
+def _load_pyautogui():
+    """Importa pyautogui apenas na primeira ação que precisa dele."""
+    try:
+        import pyautogui
+    except Exception:
+        return None
+    return pyautogui
+
+
 class Agent:
     """
     High-level automation agent that observes and acts.
@@ -40,6 +44,7 @@ class Agent:
             print(f"[Agent] Action: {action} | Target: {target}")
 
         if action == "click":
+            pyautogui = _load_pyautogui()
             if pyautogui is None:
                 raise RuntimeError("pyautogui is required for click actions")
 
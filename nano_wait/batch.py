@@ -0,0 +1,210 @@
+"""
+NanoWait Batch
+--------------
+Executa vários jobs em uma única invocação da CLI (`nano-wait batch`).
+
+Cada linha de entrada (JSON Lines) é um job; o tipo é dado pela chave presente:
+
+    {"id": "db",   "port": 5432, "host": "localhost", "timeout": 30}
+    {"id": "lock", "path": "/tmp/app.ready"}
+    {"id": "api",  "http": "http://localhost:8000/health", "status": 200}
+    {"id": "nap",  "wait": 1.5, "smart": true, "speed": "fast"}
+    {"id": "calc", "exec": "lambda: 1+1", "timeout": 10, "interval": 0.2}
+
+Todos os jobs compartilham o mesmo motor (amostragem de contexto, cache de
+aprendizado) e a partida do interpretador é paga uma única vez. Os resultados
+são emitidos como uma linha JSON por job, na ordem em que terminam.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+JOB_TYPES = ("wait", "port", "path", "http", "exec")
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_CONCURRENCY = 4
+
+
+# --------------------------
+# Verificações de prontidão
+# --------------------------
+
+def port_open(host: str, port: int, timeout: float = 1.0) -> Callable[[], bool]:
+    """Predicado: aceita conexões TCP em host:port."""
+    import socket
+
+    def check() -> bool:
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    return check
+
+
+def path_exists(path: str) -> Callable[[], bool]:
+    """Predicado: o arquivo/diretório existe."""
+    return lambda: os.path.exists(path)
+
+
+def http_ready(url: str, status: Optional[int] = None, timeout: float = 2.0) -> Callable[[], bool]:
+    """Predicado: a URL responde com `status` (ou qualquer código < 400)."""
+    from urllib.error import HTTPError, URLError
+    from urllib.request import urlopen
+
+    def check() -> bool:
+        try:
+            with urlopen(url, timeout=timeout) as response:
+                code = response.status
+        except HTTPError as e:
+            code = e.code
+        except (URLError, OSError, ValueError):
+            return False
+        return code == status if status is not None else code < 400
+    return check
+
+
+# --------------------------
+# Execução
+# --------------------------
+
+def job_type(job: Dict[str, Any]) -> str:
+    for kind in JOB_TYPES:
+        if kind in job:
+            return kind
+    raise ValueError(f"job sem tipo conhecido (esperado um de: {', '.join(JOB_TYPES)})")
+
+
+def _readiness(job: Dict[str, Any], kind: str) -> Callable[[], bool]:
+    if kind == "port":
+        return port_open(job.get("host", "localhost"), int(job["port"]))
+    if kind == "path":
+        return path_exists(job["path"])
+    return http_ready(job["http"], job.get("status"))
+
+
+def run_job(job: Dict[str, Any], *, profile: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Executa um job e devolve o registro de resultado (serializável em JSON).
+    Erros do job viram `ok: false` com a mensagem em `error` — nunca exceções.
+    """
+    from .core import get_engine
+    from .nano_wait import wait
+
+    start = time.monotonic()
+    out: Dict[str, Any] = {"id": job.get("id")}
+    try:
+        kind = out["type"] = job_type(job)
+        timeout = float(job.get("timeout", DEFAULT_TIMEOUT))
+        config = get_engine().configure(
+            job.get("profile", profile),
+            speed=job.get("speed", "normal"),
+            learning_key=job.get("key"),
+        )
+        if kind == "wait":
+            out["result"] = wait(float(job["wait"]), smart=bool(job.get("smart", False)),
+                                 wifi=job.get("wifi"), config=config)
+            out["ok"] = True
+        elif kind == "exec":
+            from .cli import safe_eval_lambda
+            from .execution import execute
+            result = execute(safe_eval_lambda(job["exec"]), timeout=timeout,
+                             interval=float(job.get("interval", 0.2)), profile=config.profile.name,
+                             smart=bool(job.get("smart", True)))
+            out.update(ok=result.success, result=result.result, attempts=result.attempts)
+            if result.error is not None:
+                out["error"] = str(result.error)
+        else:
+            out["ok"] = wait(_readiness(job, kind), timeout=timeout, config=config)
+    except Exception as e:
+        out.update(ok=False, error=f"{type(e).__name__}: {e}")
+    out["elapsed"] = round(time.monotonic() - start, 4)
+    return out
+
+
+def parse_jobs(lines: Iterable[str]):
+    """Gera (job, erro) por linha não vazia; ids ausentes viram o número da linha."""
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("cada linha deve ser um objeto JSON")
+        except ValueError as e:
+            yield {"id": lineno}, f"linha {lineno}: {e}"
+            continue
+        job.setdefault("id", lineno)
+        yield job, None
+
+
+def run_batch(
+    lines: Iterable[str],
+    emit: Callable[[Dict[str, Any]], None],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    profile: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Lê jobs sob demanda, executa até `concurrency` ao mesmo tempo e chama
+    `emit(resultado)` assim que cada um termina. Retorna a contagem ok/failed.
+    """
+    concurrency = max(1, concurrency)
+    counts = {"ok": 0, "failed": 0}
+    lock = threading.Lock()
+    # A leitura da entrada só avança quando há um worker livre: no máximo
+    # `concurrency` jobs (e futures) em memória, mesmo com stdin ilimitado.
+    slots = threading.BoundedSemaphore(concurrency)
+
+    def done(record):
+        with lock:
+            counts["ok" if record.get("ok") else "failed"] += 1
+            emit(record)
+
+    def finished(future):
+        try:
+            done(future.result())
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="nano-wait-batch") as pool:
+        for job, error in parse_jobs(lines):
+            if error is not None:
+                done({"id": job["id"], "ok": False, "error": error})
+                continue
+            slots.acquire()
+            pool.submit(run_job, job, profile=profile).add_done_callback(finished)
+    return counts
+
+
+def batch_main(argv) -> None:
+    """nano-wait batch [arquivo] — executa jobs JSON Lines (stdin por padrão)."""
+    import argparse
+    import sys
+
+    from .core import PROFILES
+
+    parser = argparse.ArgumentParser(
+        prog="nano-wait batch",
+        description="Executa esperas e verificações de prontidão descritas em JSON Lines.",
+        epilog='Exemplo: echo \'{"port": 5432}\' | nano-wait batch --concurrency 8',
+    )
+    parser.add_argument("file", nargs="?", default="-", help="Arquivo JSON Lines (padrão: stdin)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY, help="Jobs simultâneos")
+    parser.add_argument("--profile", type=str, choices=sorted(PROFILES), help="Perfil padrão dos jobs")
+    args = parser.parse_args(argv)
+
+    def emit(record):
+        print(json.dumps(record, default=repr), flush=True)
+
+    if args.file == "-":
+        counts = run_batch(sys.stdin, emit, concurrency=args.concurrency, profile=args.profile)
+    else:
+        with open(args.file) as f:
+            counts = run_batch(f, emit, concurrency=args.concurrency, profile=args.profile)
+    if counts["failed"]:
+        sys.exit(1)
@@ -0,0 +1,200 @@
+"""
+NanoWait Calibration
+--------------------
+Mede a máquina com uma carga curta e offline e gera perfis ajustados a ela.
+
+Medições:
+- overshoot do sleep: quanto time.sleep(t) dorme além de t;
+- latência do escalonador: tempo para acordar uma thread via Event;
+- custo de amostragem: snapshot_context() como o motor paga a cada poll, ao
+  longo de pelo menos uma renovação do cache (TTL) dos provedores ativos, de
+  modo que leituras bloqueantes (ex.: cpu_percent(interval=0.1)) entram na
+  média por poll;
+- vazão de predicados: chamadas/s de um predicado trivial (velocidade do
+  interpretador), registrada no arquivo de calibração.
+
+A agressividade dos perfis embutidos é mantida; o intervalo de polling sobe
+apenas até o piso que o sleep, o escalonador e a amostragem desta máquina
+conseguem honrar. O arquivo é lido por core.load_profiles().
+"""
+
+import json
+import statistics
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .core import BUILTIN_PROFILES, PROFILES_ENV, ExecutionProfile, NanoWait, default_profiles_path
+
+SLEEP_TARGETS = (0.001, 0.005, 0.02)
+SAMPLING_SPACING = min(p.poll_interval for p in BUILTIN_PROFILES.values())   # cadência do perfil mais rápido
+
+
+def _p95(samples):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def measure_overshoot(samples: int = 20) -> Dict[str, float]:
+    overshoot = []
+    for target in SLEEP_TARGETS:
+        for _ in range(samples):
+            start = time.perf_counter()
+            time.sleep(target)
+            overshoot.append(max(0.0, time.perf_counter() - start - target))
+    return {"p50": statistics.median(overshoot), "p95": _p95(overshoot)}
+
+
+def measure_scheduler_latency(samples: int = 50) -> Dict[str, float]:
+    """Tempo entre Event.set() em uma thread e o despertar de outra."""
+    ping, pong = threading.Event(), threading.Event()
+    stamps = []
+
+    def responder():
+        for _ in range(samples):
+            ping.wait()
+            ping.clear()
+            stamps.append(time.perf_counter())
+            pong.set()
+
+    th = threading.Thread(target=responder, daemon=True)
+    th.start()
+    latencies = []
+    for i in range(samples):
+        sent = time.perf_counter()
+        ping.set()
+        pong.wait()
+        pong.clear()
+        latencies.append(stamps[i] - sent)
+    th.join()
+    return {"p50": statistics.median(latencies), "p95": _p95(latencies)}
+
+
+def _refresh_window(engine: NanoWait) -> float:
+    """Maior TTL entre os provedores que entram na média de um poll comum."""
+    providers = [engine.providers.get(name) for name in engine.providers.names()]
+    return max((p.refresh_interval for p in providers if p.weight > 0 and p.requires is None), default=0.0)
+
+
+def measure_sampling_cost(engine: Optional[NanoWait] = None, samples: int = 50) -> Dict[str, float]:
+    """
+    Custo de snapshot_context() por poll, chamado na cadência do perfil mais
+    rápido durante pelo menos uma renovação do cache. `mean` é o custo médio
+    por poll (renovações bloqueantes amortizadas); `max` é a pior renovação.
+    """
+    engine = engine or NanoWait()
+    engine.snapshot_context()
+    deadline = time.perf_counter() + 1.1 * _refresh_window(engine)
+    elapsed = []
+    while len(elapsed) < samples or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        engine.snapshot_context()
+        elapsed.append(time.perf_counter() - start)
+        time.sleep(max(0.0, SAMPLING_SPACING - elapsed[-1]))
+    return {
+        "p50": statistics.median(elapsed),
+        "p95": _p95(elapsed),
+        "max": max(elapsed),
+        "mean": statistics.fmean(elapsed),
+    }
+
+
+def measure_predicate_throughput(duration: float = 0.2) -> float:
+    """Chamadas/s de um predicado trivial (custo do interpretador por poll)."""
+    predicate = lambda: False  # noqa: E731
+    calls = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            predicate()
+        calls += 1000
+    return calls / duration
+
+
+def measure(quick: bool = False) -> Dict[str, Any]:
+    scale = 1 if quick else 3
+    return {
+        "sleep_overshoot": measure_overshoot(samples=5 * scale),
+        "scheduler_latency": measure_scheduler_latency(samples=20 * scale),
+        "sampling_cost": measure_sampling_cost(samples=20 * scale),
+        "predicate_throughput": measure_predicate_throughput(0.1 * scale),
+    }
+
+
+def tune_profiles(measurements: Dict[str, Any]) -> Dict[str, ExecutionProfile]:
+    """
+    Ajusta os perfis embutidos (nunca os já calibrados) a esta máquina: o
+    intervalo de polling respeita o piso imposto por overshoot, escalonador e
+    custo médio de amostragem por poll (polls mais curtos que isso só gastam
+    CPU). A vazão de predicados é apenas registrada. A
+    agressividade não muda: ela expressa a política do perfil, não a máquina.
+    """
+    floor = max(
+        5 * measurements["sleep_overshoot"]["p95"],
+        10 * measurements["scheduler_latency"]["p95"],
+        20 * measurements["sampling_cost"]["mean"],
+        0.01,
+    )
+    tuned = {}
+    for name, base in BUILTIN_PROFILES.items():
+        tuned[name] = ExecutionProfile(
+            name=name,
+            aggressiveness=base.aggressiveness,
+            tolerance=base.tolerance,
+            poll_interval=round(max(floor, base.poll_interval), 4),
+            verbose=base.verbose,
+        )
+    return tuned
+
+
+def write_profiles(profiles: Dict[str, ExecutionProfile], measurements: Dict[str, Any], path: Optional[str] = None) -> str:
+    path = path or default_profiles_path()
+    data = {
+        "schema": 1,
+        "created": datetime.now().isoformat(),
+        "measurements": measurements,
+        "profiles": {name: {k: v for k, v in asdict(p).items() if k != "name"} for name, p in profiles.items()},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def calibrate(path: Optional[str] = None, *, quick: bool = False, write: bool = True) -> Dict[str, Any]:
+    """Mede, ajusta os perfis e (opcionalmente) grava o arquivo de perfis."""
+    measurements = measure(quick=quick)
+    profiles = tune_profiles(measurements)
+    result = {"measurements": measurements, "profiles": profiles, "path": None}
+    if write:
+        result["path"] = write_profiles(profiles, measurements, path)
+    return result
+
+
+def calibrate_main(argv) -> None:
+    """nano-wait calibrate — gera perfis ajustados a esta máquina."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="nano-wait calibrate",
+        description="Mede sleep, escalonador, amostragem de contexto e predicados e grava perfis ajustados.",
+        epilog=f"Destino padrão: ~/.nano_wait_profiles.json (ou ${PROFILES_ENV})",
+    )
+    parser.add_argument("-o", "--output", help="Arquivo de perfis a gravar")
+    parser.add_argument("--quick", action="store_true", help="Medição mais curta (menos precisa)")
+    parser.add_argument("--dry-run", action="store_true", help="Mostra os perfis sem gravar")
+    args = parser.parse_args(argv)
+
+    print("🧪 Calibrando (carga offline curta)...")
+    result = calibrate(args.output, quick=args.quick, write=not args.dry_run)
+    m = result["measurements"]
+    print(f"  sleep overshoot p95:    {m['sleep_overshoot']['p95'] * 1000:.3f} ms")
+    print(f"  scheduler latency p95:  {m['scheduler_latency']['p95'] * 1000:.3f} ms")
+    print(f"  context sampling:       {m['sampling_cost']['mean'] * 1000:.3f} ms/poll "
+          f"(pior renovação {m['sampling_cost']['max'] * 1000:.1f} ms)")
+    print(f"  predicate throughput:   {m['predicate_throughput'] / 1e6:.2f} M/s")
+    for name, p in result["profiles"].items():
+        print(f"  {name:<10} aggressiveness={p.aggressiveness:<6} poll_interval={p.poll_interval}s")
+    if result["path"]:
+        print(f"✅ Perfis gravados em {result['path']}")
@@ -0,0 +1,195 @@
+"""
+NanoWait Cancel
+---------------
+Cancelamento cooperativo para as esperas síncronas.
+
+Um CancelToken envolve um threading.Event: as esperas dormem em Event.wait()
+em vez de time.sleep(), então `token.cancel()` acorda imediatamente todas as
+esperas em andamento que observam o token. O resultado é o sentinela
+CANCELLED (falso, distinto de True/False e de um tempo dormido) ou
+ExecutionResult(cancelled=True).
+
+install_sigterm_hook() cria um token de desligamento do processo: um SIGTERM
+o cancela e toda espera (com ou sem token próprio) passa a observá-lo.
+"""
+
+import threading
+import weakref
+from typing import Optional
+
+
+class _Cancelled:
+    """Sentinela falso retornado por esperas canceladas."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "CANCELLED"
+
+    def __reduce__(self):
+        return "CANCELLED"
+
+
+CANCELLED = _Cancelled()
+
+
+class CancelToken:
+    """Sinal de cancelamento compartilhável entre threads."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._children = weakref.WeakSet()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Cancela o token e seus derivados, acordando quem estiver em wait()."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            children = list(self._children)
+        for child in children:
+            child.cancel(reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Dorme até `timeout` ou até o cancelamento; True se cancelado."""
+        return self._event.wait(timeout)
+
+    def child(self) -> "CancelToken":
+        """Token cancelado junto com este (mas que pode ser cancelado sozinho)."""
+        token = CancelToken()
+        self._link(token)
+        return token
+
+    def _link(self, token: "CancelToken") -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(token)
+                return
+        token.cancel(self.reason)
+
+    @classmethod
+    def any(cls, *tokens: "CancelToken") -> "CancelToken":
+        """Token cancelado quando qualquer um dos tokens for cancelado."""
+        combined = cls()
+        for token in tokens:
+            token._link(combined)
+        return combined
+
+    def __repr__(self) -> str:
+        return f"CancelToken(cancelled={self.cancelled})"
+
+
+# --------------------------
+# Desligamento via SIGTERM
+# --------------------------
+
+_SHUTDOWN: Optional[CancelToken] = None
+_PREVIOUS_HANDLER = None
+
+
+def shutdown_token() -> Optional[CancelToken]:
+    """Token de desligamento do processo (None se o hook não foi instalado)."""
+    return _SHUTDOWN
+
+
+def install_sigterm_hook(chain: bool = True) -> CancelToken:
+    """
+    Cancela o token de desligamento ao receber SIGTERM, acordando todas as
+    esperas de uma vez. Em seguida o SIGTERM segue seu destino anterior: com
+    `chain`, um handler Python anterior é chamado; se o anterior era o padrão
+    (SIG_DFL), a thread principal recebe SystemExit(128 + SIGTERM), então
+    blocos finally e atexit rodam e o processo ainda termina. SIG_IGN continua
+    ignorando o sinal. Deve ser chamado na thread principal.
+    """
+    import signal
+
+    global _SHUTDOWN, _PREVIOUS_HANDLER
+    if _SHUTDOWN is None:
+        _SHUTDOWN = CancelToken()
+        previous = signal.getsignal(signal.SIGTERM)
+        _PREVIOUS_HANDLER = previous
+
+        def handler(signum, frame):
+            _SHUTDOWN.cancel("SIGTERM")
+            if callable(previous):
+                if chain:
+                    previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                # Uma biblioteca não pode tornar o processo imune ao SIGTERM
+                raise SystemExit(128 + signum)
+
+        signal.signal(signal.SIGTERM, handler)
+    return _SHUTDOWN
+
+
+def remove_sigterm_hook() -> None:
+    """Restaura o handler anterior de SIGTERM e descarta o token de desligamento."""
+    import signal
+
+    global _SHUTDOWN, _PREVIOUS_HANDLER
+    if _SHUTDOWN is not None:
+        signal.signal(signal.SIGTERM, _PREVIOUS_HANDLER if _PREVIOUS_HANDLER is not None else signal.SIG_DFL)
+        _SHUTDOWN = _PREVIOUS_HANDLER = None
+
+
+CHUNK = 0.05                     # fatia de sleep para relógios sem suporte a `cancel`
+_ACCEPTS_CANCEL = {}             # tipo do relógio -> sleep() aceita `cancel`?
+
+
+def _accepts_cancel(clock) -> bool:
+    kind = type(clock)
+    accepts = _ACCEPTS_CANCEL.get(kind)
+    if accepts is None:
+        import inspect
+        try:
+            params = inspect.signature(clock.sleep).parameters.values()
+            accepts = any(p.name == "cancel" or p.kind is p.VAR_KEYWORD for p in params)
+        except (TypeError, ValueError):
+            accepts = False
+        _ACCEPTS_CANCEL[kind] = accepts
+    return accepts
+
+
+def sleep(clock, seconds: float, cancel: Optional[CancelToken] = None) -> bool:
+    """
+    Dorme no relógio observando `cancel`; True se a espera foi cancelada.
+    Relógios com o protocolo antigo (`sleep(seconds)`) dormem em fatias de
+    CHUNK segundos, checando o token entre elas.
+    """
+    if cancel is None:
+        clock.sleep(seconds)
+        return False
+    if _accepts_cancel(clock):
+        clock.sleep(seconds, cancel=cancel)
+        return cancel.cancelled
+    remaining = seconds
+    while remaining > 0 and not cancel.cancelled:
+        step = min(CHUNK, remaining)
+        clock.sleep(step)
+        remaining -= step
+    return cancel.cancelled
+
+
+def resolve_cancel(cancel: Optional[CancelToken] = None) -> Optional[CancelToken]:
+    """Token efetivo de uma espera: o explícito, o de desligamento, ou ambos."""
+    shutdown = _SHUTDOWN
+    if shutdown is None or cancel is shutdown:
+        return cancel
+    if cancel is None:
+        return shutdown
+    return CancelToken.any(cancel, shutdown)
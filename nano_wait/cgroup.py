@@ -0,0 +1,230 @@
+"""
+NanoWait cgroup v2 / PSI
+------------------------
+Saúde do sistema vista de dentro do container (Linux, cgroup v2).
+
+psutil reporta números do host inteiro: um pod estrangulado na sua cota de
+CPU aparece como "ocioso". Aqui o score vem dos limites que o processo
+realmente encontra:
+
+- cpu.max + cpu.stat: uso relativo à cota e fração de períodos estrangulados;
+- memory.current / memory.max: ocupação relativa ao limite do cgroup;
+- Pressure Stall Information (cpu/memory/io.pressure do cgroup ou
+  /proc/pressure/*): % do tempo em que tarefas ficaram travadas (avg10).
+
+O uso de CPU é calculado por delta entre leituras, sem sleep de amostragem.
+Seleção automática quando há cgroup v2 com cota de CPU ou limite de memória;
+NANO_WAIT_CGROUP=0 desativa, =1 força.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+PROC_CGROUP = "/proc/self/cgroup"
+PROC_PRESSURE = "/proc/pressure"
+
+
+def _clamp(score: float) -> float:
+    return max(0.0, min(10.0, score))
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def parse_cpu_max(text: Optional[str]) -> Optional[float]:
+    """"200000 100000" -> 2.0 CPUs; "max ..." ou ausente -> None (sem cota)."""
+    if not text:
+        return None
+    parts = text.split()
+    if parts[0] == "max":
+        return None
+    period = float(parts[1]) if len(parts) > 1 else 100000.0
+    return float(parts[0]) / period
+
+
+def parse_flat_keyed(text: Optional[str]) -> Dict[str, float]:
+    """Formato "chave valor" por linha (cpu.stat, memory.stat)."""
+    out: Dict[str, float] = {}
+    for line in (text or "").splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            try:
+                out[parts[0]] = float(parts[1])
+            except ValueError:
+                pass
+    return out
+
+
+def parse_pressure(text: Optional[str], kind: str = "some", window: str = "avg10") -> Optional[float]:
+    """Extrai, por ex., `some avg10` (0-100) de um arquivo PSI."""
+    for line in (text or "").splitlines():
+        fields = line.split()
+        if fields and fields[0] == kind:
+            for field in fields[1:]:
+                key, _, value = field.partition("=")
+                if key == window:
+                    return float(value)
+    return None
+
+
+class CgroupStats:
+    """Leituras do cgroup v2 do processo com scores 0-10 por delta."""
+
+    def __init__(
+        self,
+        root: str = CGROUP_ROOT,
+        *,
+        proc_cgroup: str = PROC_CGROUP,
+        pressure_dir: str = PROC_PRESSURE,
+    ):
+        self.root = root
+        self.pressure_dir = pressure_dir
+        self.path = self._resolve(root, proc_cgroup)
+        self._last_cpu: Optional[Tuple[float, float, float, float]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _resolve(root: str, proc_cgroup: str) -> str:
+        # Linha "0::/caminho" = hierarquia unificada (v2)
+        rel = ""
+        for line in (_read(proc_cgroup) or "").splitlines():
+            if line.startswith("0::"):
+                rel = line[3:].lstrip("/")
+                break
+        path = os.path.join(root, rel) if rel else root
+        # Dentro de um namespace de cgroup o caminho visível já é a raiz
+        return path if os.path.isdir(path) else root
+
+    def _file(self, name: str) -> Optional[str]:
+        return _read(os.path.join(self.path, name))
+
+    # --------------------------
+    # Detecção
+    # --------------------------
+
+    def is_v2(self) -> bool:
+        return os.path.exists(os.path.join(self.root, "cgroup.controllers"))
+
+    def cpu_limit(self) -> Optional[float]:
+        return parse_cpu_max(self._file("cpu.max"))
+
+    def memory_limit(self) -> Optional[float]:
+        text = self._file("memory.max")
+        if not text or text == "max":
+            return None
+        return float(text)
+
+    def is_limited(self) -> bool:
+        return self.cpu_limit() is not None or self.memory_limit() is not None
+
+    # --------------------------
+    # Leituras
+    # --------------------------
+
+    def pressure(self, resource: str, kind: str = "some") -> Optional[float]:
+        """PSI avg10 (0-100) do cgroup; recorre a /proc/pressure se ausente."""
+        value = parse_pressure(self._file(f"{resource}.pressure"), kind)
+        if value is None:
+            value = parse_pressure(_read(os.path.join(self.pressure_dir, resource)), kind)
+        return value
+
+    def cpu_usage(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        (uso relativo à cota, fração de períodos estrangulados) desde a última
+        leitura. Na primeira leitura o uso é None e o estrangulamento é o acumulado.
+        """
+        stat = parse_flat_keyed(self._file("cpu.stat"))
+        if "usage_usec" not in stat:
+            return None, None
+        sample = (
+            time.monotonic(),
+            stat["usage_usec"],
+            stat.get("nr_periods", 0.0),
+            stat.get("nr_throttled", 0.0),
+        )
+        with self._lock:
+            last, self._last_cpu = self._last_cpu, sample
+
+        if last is None:
+            throttled = sample[3] / sample[2] if sample[2] else None
+            return None, throttled
+
+        wall = (sample[0] - last[0]) * 1e6
+        limit = self.cpu_limit() or float(_visible_cpus())
+        usage = (sample[1] - last[1]) / (wall * limit) if wall > 0 else None
+        periods = sample[2] - last[2]
+        throttled = (sample[3] - last[3]) / periods if periods > 0 else 0.0
+        return usage, throttled
+
+    def memory_usage(self) -> Optional[float]:
+        current = self._file("memory.current")
+        if current is None:
+            return None
+        limit = self.memory_limit() or _mem_total()
+        if not limit:
+            return None
+        return float(current) / limit
+
+    # --------------------------
+    # Scores 0-10
+    # --------------------------
+
+    def cpu_score(self, options=None) -> Optional[float]:
+        """Pior entre uso da cota, estrangulamento e PSI de CPU."""
+        usage, throttled = self.cpu_usage()
+        psi = self.pressure("cpu")
+        loads = [x for x in (usage, throttled, psi / 100 if psi is not None else None) if x is not None]
+        if not loads:
+            return None
+        return round(_clamp(10 * (1 - max(loads))), 2)
+
+    def memory_score(self, options=None) -> Optional[float]:
+        """Pior entre ocupação do limite e PSI de memória."""
+        usage = self.memory_usage()
+        psi = self.pressure("memory")
+        loads = [x for x in (usage, psi / 100 if psi is not None else None) if x is not None]
+        if not loads:
+            return None
+        return round(_clamp(10 * (1 - max(loads))), 2)
+
+    def io_score(self, options=None) -> Optional[float]:
+        psi = self.pressure("io")
+        return None if psi is None else round(_clamp(10 * (1 - psi / 100)), 2)
+
+
+def _visible_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def _mem_total() -> Optional[float]:
+    for line in (_read("/proc/meminfo") or "").splitlines():
+        if line.startswith("MemTotal:"):
+            return float(line.split()[1]) * 1024
+    return None
+
+
+def detect(root: str = CGROUP_ROOT, **kwargs) -> Optional[CgroupStats]:
+    """
+    CgroupStats se o processo roda em um cgroup v2 com limites (container),
+    senão None. NANO_WAIT_CGROUP=0/1 desativa/força.
+    """
+    mode = os.environ.get("NANO_WAIT_CGROUP", "auto")
+    if mode == "0":
+        return None
+    stats = CgroupStats(root, **kwargs)
+    if not stats.is_v2():
+        return None
+    if mode == "1" or stats.is_limited():
+        return stats
+    return None
@@ -6,21 +6,11 @@ Suporta modos de espera, execução de lambdas e agente de automação.
 """
 
 import argparse
-import asyncio
 import sys
-from typing import Any, Callable, Optional
+from typing import Callable
 
-from .nano_wait import wait
-from .nano_wait_async import wait_async
-from .nano_wait_pool import wait_pool
-from .nano_wait_auto import wait_auto
-from .execution import execute
-
-# Tenta carregar o módulo Agent se disponível
-try:
-    from .agent import Agent
-except ImportError:
-    Agent = None
+# Os motores são importados dentro de cada modo para manter a partida da CLI
+# rápida: cada invocação carrega apenas o que vai usar.
 
 def safe_eval_lambda(expr: str) -> Callable:
     """
@@ -34,7 +24,92 @@ def safe_eval_lambda(expr: str) -> Callable:
     # Avaliação com builtins vazios para minimizar riscos
     return eval(expr, {"__builtins__": {}})
 
-def main():
+def _iter_state_files(paths):
+    """Arquivos de estado a mesclar: caminhos diretos ou *.json de diretórios (lidos sob demanda)."""
+    from pathlib import Path
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            yield from sorted(path.glob("*.json"))
+        else:
+            yield path
+
+def learning_main(argv):
+    """nano-wait learning export|merge|import — compartilha o aprendizado entre máquinas."""
+    import json
+    from .learning import export_state, import_state, merge_states
+
+    parser = argparse.ArgumentParser(
+        prog="nano-wait learning",
+        description="Exporta, mescla e importa o estado de aprendizado (~/.nano_wait_learning.json).",
+        epilog="Aquecimento automático: NANO_WAIT_LEARNING_SEED=merged.json"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_export = sub.add_parser("export", help="Exporta o estado local")
+    p_export.add_argument("-o", "--output", help="Arquivo de saída (padrão: stdout)")
+
+    p_merge = sub.add_parser("merge", help="Mescla exportações ponderando pelo número de amostras")
+    p_merge.add_argument("inputs", nargs="+", help="Arquivos ou diretórios com *.json")
+    p_merge.add_argument("-o", "--output", help="Arquivo de saída (padrão: stdout)")
+
+    p_import = sub.add_parser("import", help="Importa um snapshot para o estado local")
+    p_import.add_argument("input", help="Snapshot exportado ou mesclado")
+    p_import.add_argument("--replace", action="store_true", help="Substitui em vez de mesclar")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        try:
+            state = import_state(args.input, replace=args.replace)
+        except (OSError, ValueError) as e:
+            print(f"❌ Erro ao importar: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ Importados {len(state['profiles'])} perfis de {args.input}")
+        return
+
+    if args.command == "export":
+        state = export_state()
+    else:
+        state = merge_states(_iter_state_files(args.inputs))
+        print(f"🔀 {state['merged']} arquivos mesclados, {state['skipped']} ignorados", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(state, f, indent=2)
+    else:
+        print(json.dumps(state, indent=2))
+
+def calibrate_main(argv):
+    from .calibration import calibrate_main as run
+    run(argv)
+
+def batch_main(argv):
+    from .batch import batch_main as run
+    run(argv)
+
+def serve_main(argv):
+    from .daemon import serve_main as run
+    run(argv)
+
+def client_main(argv):
+    from .daemon import client_main as run
+    run(argv)
+
+SUBCOMMANDS = {
+    "learning": learning_main,
+    "calibrate": calibrate_main,
+    "batch": batch_main,
+    "serve": serve_main,
+    "client": client_main,
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Subcomandos são despachados antes do parser principal (que usa `time` posicional)
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
     parser = argparse.ArgumentParser(
         prog="nano-wait",
         description="🚀 NanoWait — Motor de Execução Adaptativo para Python.",
@@ -59,14 +134,21 @@ def main():
 
     # --- DEBUG E CONTROLE ---
     parser.add_argument("--verbose", "-v", action="store_true", help="Ativa logs detalhados")
-    parser.add_argument("--log", action="store_true", help="Grava eventos em nano_wait.log")
+    parser.add_argument("--log", action="store_true", help="Grava eventos em nano_wait.jsonl (JSON Lines)")
     parser.add_argument("--explain", action="store_true", help="Mostra relatório detalhado da decisão")
-    parser.add_argument("--profile", type=str, choices=["ci", "testing", "rpa"], help="Perfil de agressividade")
+    # Opções vêm do registro (embutidos + arquivo gerado por `nano-wait calibrate`)
+    from .core import PROFILES
+    parser.add_argument("--profile", type=str, choices=sorted(PROFILES), help="Perfil de agressividade")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # --- EXECUÇÃO: AGENTE ---
     if args.agent:
+        # Tenta carregar o módulo Agent se disponível
+        try:
+            from .agent import Agent
+        except ImportError:
+            Agent = None
         if Agent is None:
             print("❌ Erro: Módulo Agent não disponível. Verifique as dependências.")
             sys.exit(1)
@@ -78,6 +160,7 @@ def main():
 
     # --- EXECUÇÃO: MOTOR DE EXECUÇÃO ---
     if args.exec:
+        from .execution import execute
         try:
             fn = safe_eval_lambda(args.exec)
             print(f"⚙️ Executando lambda: '{args.exec}'...")
@@ -97,6 +180,7 @@ def main():
 
     # --- EXECUÇÃO: AUTO MODE ---
     if args.auto:
+        from .nano_wait_auto import wait_auto
         print("🤖 Iniciando espera automática baseada em contexto...")
         wait_auto(
             wifi=args.wifi,
@@ -108,6 +192,7 @@ def main():
 
     # --- EXECUÇÃO: POOL MODE ---
     if args.pool:
+        from .nano_wait_pool import wait_pool
         print(f"🔁 Executando pool de {len(args.pool)} esperas...")
         results = wait_pool(
             args.pool,
@@ -124,6 +209,8 @@ def main():
 
     # --- EXECUÇÃO: ASYNC MODE ---
     if args.use_async:
+        import asyncio
+        from .nano_wait_async import wait_async
         if args.time is None:
             print("❌ Erro: Tempo base necessário para o modo assíncrono.")
             sys.exit(1)
@@ -147,6 +234,7 @@ def main():
         parser.print_help()
         sys.exit(0)
 
+    from .nano_wait import wait
     print(f"⏱ Esperando {args.time}s (Adaptativo)...")
     result = wait(
         t=args.time,
@@ -0,0 +1,100 @@
+"""
+NanoWait Clock
+--------------
+Abstração de tempo usada por todos os motores (wait, execute, wait_async, wait_auto).
+
+O relógio padrão é monotônico (imune a ajustes de NTP). O VirtualClock avança
+instantaneamente a cada sleep, permitindo que timeouts, polling e aprendizado
+rodem em microssegundos durante testes com o mesmo comportamento do relógio real.
+
+sleep() aceita um CancelToken opcional: o relógio real dorme em Event.wait()
+e acorda assim que o token é cancelado; o virtual não avança se já cancelado.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class MonotonicClock:
+    """Relógio real baseado em time.monotonic()."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float, cancel=None) -> None:
+        if seconds <= 0:
+            return
+        if cancel is None:
+            time.sleep(seconds)
+        else:
+            cancel.wait(seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        import asyncio
+        await asyncio.sleep(max(0.0, seconds))
+
+
+class VirtualClock:
+    """
+    Relógio virtual: sleep() apenas avança o tempo interno.
+    Seguro para uso entre threads.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """Avança o relógio manualmente e retorna o novo instante."""
+        with self._lock:
+            if seconds > 0:
+                self._now += seconds
+            return self._now
+
+    def sleep(self, seconds: float, cancel=None) -> None:
+        if cancel is not None and cancel.cancelled:
+            return
+        self.advance(seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        import asyncio
+        self.advance(seconds)
+        # Cede o loop para manter a semântica cooperativa do asyncio.sleep
+        await asyncio.sleep(0)
+
+
+_DEFAULT_CLOCK = MonotonicClock()
+
+
+def get_clock():
+    """Retorna o relógio padrão do processo."""
+    return _DEFAULT_CLOCK
+
+
+def set_clock(clock=None):
+    """Define o relógio padrão. None restaura o MonotonicClock."""
+    global _DEFAULT_CLOCK
+    _DEFAULT_CLOCK = clock if clock is not None else MonotonicClock()
+    return _DEFAULT_CLOCK
+
+
+def resolve_clock(clock=None):
+    """Retorna o relógio explícito ou o padrão do processo."""
+    return clock if clock is not None else _DEFAULT_CLOCK
+
+
+@contextmanager
+def use_clock(clock=None) -> Iterator[object]:
+    """Troca temporariamente o relógio padrão (ex: VirtualClock em testes)."""
+    clock = clock if clock is not None else VirtualClock()
+    previous = get_clock()
+    set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
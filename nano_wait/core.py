@@ -9,11 +9,18 @@ A fórmula base segue uma relação inversamente proporcional à saúde do siste
 WaitTime = (BaseTime / (SystemHealth * NetworkStability)) * ProfileAggressiveness
 """
 
+import json
+import math
+import os
 import platform
-import time
-import subprocess
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+import threading
+from array import array
+from dataclasses import dataclass, replace
+from typing import Optional, Dict, Any, Sequence, Union
+
+from .clock import resolve_clock
+from .hooks import HOOKS
+from .providers import ProviderRegistry, default_registry
 
 @dataclass(frozen=True)
 class ExecutionProfile:
@@ -24,120 +31,328 @@ class ExecutionProfile:
     poll_interval: float       # Base para loops de polling em segundos
     verbose: bool              # Ativa logs detalhados por padrão
 
-PROFILES: Dict[str, ExecutionProfile] = {
+BUILTIN_PROFILES: Dict[str, ExecutionProfile] = {
     "ci": ExecutionProfile("ci", 0.5, 0.9, 0.05, True),
     "testing": ExecutionProfile("testing", 1.0, 0.7, 0.1, True),
     "rpa": ExecutionProfile("rpa", 2.0, 0.5, 0.2, False),
     "default": ExecutionProfile("default", 1.0, 0.8, 0.1, False),
 }
 
+# Registro ativo: embutidos, sobrescritos pelo arquivo de calibração e por register_profile()
+PROFILES: Dict[str, ExecutionProfile] = dict(BUILTIN_PROFILES)
+
+PROFILES_ENV = "NANO_WAIT_PROFILES"
+
+def default_profiles_path() -> str:
+    """Arquivo de perfis da máquina (gerado por `nano-wait calibrate`)."""
+    return os.environ.get(PROFILES_ENV) or os.path.expanduser("~/.nano_wait_profiles.json")
+
+def register_profile(
+    profile: Union[str, ExecutionProfile],
+    aggressiveness: float = 1.0,
+    tolerance: float = 0.8,
+    poll_interval: float = 0.1,
+    verbose: bool = False,
+) -> ExecutionProfile:
+    """Registra (ou substitui) um perfil em tempo de execução."""
+    if not isinstance(profile, ExecutionProfile):
+        profile = ExecutionProfile(profile, aggressiveness, tolerance, poll_interval, verbose)
+    PROFILES[profile.name] = profile
+    return profile
+
+def load_profiles(path: Optional[str] = None) -> int:
+    """
+    Carrega perfis de um arquivo JSON ({"profiles": {nome: campos}}) sobre os
+    embutidos. Retorna quantos foram carregados; arquivo ausente ou inválido = 0.
+    """
+    path = path or default_profiles_path()
+    try:
+        with open(path) as f:
+            entries = json.load(f)["profiles"]
+        loaded = [
+            ExecutionProfile(
+                name=name,
+                aggressiveness=float(fields["aggressiveness"]),
+                tolerance=float(fields.get("tolerance", 0.8)),
+                poll_interval=float(fields["poll_interval"]),
+                verbose=bool(fields.get("verbose", False)),
+            )
+            for name, fields in entries.items()
+        ]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return 0
+    for profile in loaded:
+        register_profile(profile)
+    return len(loaded)
+
+load_profiles()
+
+def resolve_profile(profile: Union[str, ExecutionProfile, None], default: Optional[ExecutionProfile] = None) -> ExecutionProfile:
+    """Nome (ou instância) de perfil -> ExecutionProfile; desconhecido cai no padrão."""
+    if isinstance(profile, ExecutionProfile):
+        return profile
+    if profile in PROFILES:
+        return PROFILES[profile]
+    return default or PROFILES["default"]
+
+@dataclass(frozen=True)
+class WaitConfig:
+    """
+    Configuração imutável de uma chamada, resolvida uma vez e passada adiante.
+    O motor compartilha apenas caches (provedores, sondas); nada por chamada é
+    gravado nele, então threads com perfis diferentes não interferem.
+    """
+    profile: ExecutionProfile
+    speed: Union[str, float] = "normal"
+    clock: Any = None
+    providers: Any = None
+    learning_key: Optional[str] = None
+
+    def with_changes(self, **changes) -> "WaitConfig":
+        return replace(self, **changes)
+
+# Regras finais de uma espera em modo tempo (compartilhadas com o caminho em lote)
+MIN_WAIT = 0.01
+
+def quantize(x: float) -> float:
+    """Arredonda para 4 casas (meio para cima), idêntico ao caminho vetorizado."""
+    return math.floor(x * 1e4 + 0.5) / 1e4
+
+def finalize_wait(adaptive: float, requested: Optional[float], bias: float, cap: bool) -> float:
+    """Teto no tempo pedido (se `cap`), piso de 10ms, quantização e viés aprendido."""
+    if cap and requested is not None:
+        adaptive = min(adaptive, requested)
+    adaptive = quantize(max(MIN_WAIT, adaptive))
+    return quantize(adaptive * bias)
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+def _pc_score(cpu: Optional[float], mem: Optional[float]) -> float:
+    """Score clássico de PC (0.6 CPU + 0.4 memória); 5.0 se indisponível."""
+    if cpu is None or mem is None:
+        return 5.0
+    return round((cpu * 0.6) + (mem * 0.4), 2)
+
+def _health(context: Dict[str, Any]) -> float:
+    """Saúde do contexto: a do registro de provedores ou a fórmula clássica."""
+    health = context.get("health")
+    if health is not None:
+        return health
+    pc = context["pc_score"]
+    wifi = context["wifi_score"] if context["wifi_score"] is not None else 5.0
+    net = context.get("net_score")
+    return (pc + wifi) / 2 if net is None else (pc + wifi + net) / 3
+
 class NanoWait:
     """
     O motor central que orquestra a coleta de contexto e ajuste de timing.
     """
-    def __init__(self, profile: Optional[str] = None):
+    def __init__(self, profile: Optional[str] = None, clock=None, providers: Optional[ProviderRegistry] = None):
         self.system = platform.system().lower()
         self.profile = PROFILES.get(profile, PROFILES["default"])
-        self._wifi_interface = None
-        self._initialized_wifi = False
-
-    def _init_wifi(self):
-        """Lazy initialization para evitar overhead se não for usado."""
-        if self._initialized_wifi:
-            return
-        if self.system == "windows":
-            try:
-                import pywifi
-                wifi = pywifi.PyWiFi()
-                self._wifi_interface = wifi.interfaces()[0]
-            except Exception:
-                self._wifi_interface = None
-        self._initialized_wifi = True
+        self._clock = clock
+        self.hooks = HOOKS
+        # Provedores de contexto (CPU, memória, Wi-Fi, rede, disco, load...) com caches compartilhados
+        self.providers = providers if providers is not None else default_registry()
+        self.wifi = self.providers.wifi
+        self.network = self.providers.network
+
+    @property
+    def clock(self):
+        """Relógio do motor (explícito ou o padrão do processo)."""
+        return resolve_clock(self._clock)
+
+    def configure(
+        self,
+        profile: Union[str, ExecutionProfile, None] = None,
+        *,
+        speed: Union[str, float] = "normal",
+        clock=None,
+        providers: Optional[ProviderRegistry] = None,
+        learning_key: Optional[str] = None,
+    ) -> WaitConfig:
+        """Resolve a configuração de uma chamada sem alterar o motor."""
+        return WaitConfig(
+            profile=resolve_profile(profile, self.profile),
+            speed=speed,
+            clock=clock if clock is not None else self.clock,
+            providers=providers if providers is not None else self.providers,
+            learning_key=learning_key,
+        )
+
+    def _profile(self, config) -> ExecutionProfile:
+        if isinstance(config, WaitConfig):
+            return config.profile
+        if config is None:
+            return self.profile
+        return resolve_profile(config, self.profile)
+
+    @clock.setter
+    def clock(self, value):
+        self._clock = value
 
     def get_pc_score(self) -> float:
         """
         Calcula o score de performance do sistema (0-10).
         10 = Sistema ocioso e rápido. 0 = Sistema sob estresse extremo.
         """
-        try:
-            import psutil
-            cpu = psutil.cpu_percent(interval=0.1) # Reduzido interval para maior responsividade
-            mem = psutil.virtual_memory().percent
-            
-            # Penalidade não linear para estresse alto
-            cpu_score = max(0, min(10, 10 - (cpu / 10)))
-            mem_score = max(0, min(10, 10 - (mem / 10)))
-            
-            return round((cpu_score * 0.6) + (mem_score * 0.4), 2)
-        except Exception:
-            return 5.0
+        cpu = self.providers.score("cpu")
+        mem = self.providers.score("memory")
+        return _pc_score(cpu, mem)
 
     def get_wifi_signal(self, ssid: Optional[str] = None) -> float:
         """
         Retorna a força do sinal Wi-Fi (0-10).
+        Nunca bloqueia: lê o cache do WifiSignalProvider (atualizado em background).
         """
-        try:
-            if self.system == "windows":
-                self._init_wifi()
-                if self._wifi_interface:
-                    self._wifi_interface.scan()
-                    time.sleep(0.5) # Reduzido de 2s para 0.5s
-                    for net in self._wifi_interface.scan_results():
-                        if ssid is None or net.ssid == ssid:
-                            return max(0, min(10, (net.signal + 100) / 10))
-
-            elif self.system == "darwin":
-                cmd = ["/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport", "-I"]
-                out = subprocess.check_output(cmd, text=True)
-                for line in out.splitlines():
-                    if "agrCtlRSSI" in line:
-                        rssi = int(line.split(":")[1].strip())
-                        return max(0, min(10, (rssi + 100) / 10))
-
-            elif self.system == "linux":
-                out = subprocess.check_output(["nmcli", "-t", "-f", "ACTIVE,SSID,SIGNAL", "dev", "wifi"], text=True)
-                for line in out.splitlines():
-                    parts = line.split(":")
-                    if len(parts) >= 3:
-                        active, name, sig = parts[0], parts[1], parts[2]
-                        if active == "yes" or (ssid and name == ssid):
-                            return max(0, min(10, int(sig) / 10))
-        except Exception:
-            pass
-        return 5.0
+        return self.wifi.read(ssid)
+
+    def get_network_score(self) -> Optional[float]:
+        """
+        Score de rede (0-10) baseado no RTT da sonda TCP em cache.
+        None enquanto a primeira medição (em background) não terminou.
+        """
+        return self.network.read().score
 
-    def snapshot_context(self, ssid: Optional[str] = None) -> Dict[str, Any]:
-        """Captura um estado imutável do ambiente para análise determinística."""
+    def snapshot_context(self, ssid: Optional[str] = None, network: bool = False, config: Optional[WaitConfig] = None) -> Dict[str, Any]:
+        """
+        Captura um estado imutável do ambiente para análise determinística.
+        `health` é a média ponderada de todos os provedores ativos do registro.
+        """
+        providers = config.providers if config is not None and config.providers is not None else self.providers
+        clock = config.clock if config is not None and config.clock is not None else self.clock
+        scores, health = providers.evaluate({"ssid": ssid, "network": network})
         return {
-            "pc_score": self.get_pc_score(),
-            "wifi_score": self.get_wifi_signal(ssid) if ssid else None,
-            "timestamp": time.time()
+            "pc_score": _pc_score(scores.get("cpu"), scores.get("memory")),
+            "wifi_score": scores.get("wifi"),
+            "net_score": scores.get("network"),
+            "health": health,
+            "providers": scores,
+            "timestamp": clock.now()
         }
 
-    def smart_speed(self, ssid: Optional[str] = None) -> float:
+    def smart_speed(self, ssid: Optional[str] = None, context: Optional[Dict[str, Any]] = None) -> float:
         """Calcula o fator de velocidade adaptativo (0.5 - 5.0)."""
-        ctx = self.snapshot_context(ssid)
-        pc = ctx["pc_score"]
-        wifi = ctx["wifi_score"] if ctx["wifi_score"] is not None else 5.0
+        ctx = context if context is not None else self.snapshot_context(ssid)
         
         # Heurística: se o sistema está lento, diminuímos a velocidade (aumentamos a espera)
         # Se o sistema está rápido, aumentamos a velocidade (diminuímos a espera)
-        health = (pc + wifi) / 2
+        health = _health(ctx)
         return round(max(0.5, min(5.0, health / 2)), 2)
 
-    def compute_wait(self, base_time: float, speed_factor: float, context: Dict[str, Any]) -> float:
+    def compute_wait(self, base_time: float, speed_factor: float, context: Dict[str, Any], config=None) -> float:
         """Aplica a lógica teórica central para calcular o tempo final de espera."""
-        pc = context["pc_score"]
-        wifi = context["wifi_score"] if context["wifi_score"] is not None else 5.0
-        
-        # Quanto maior a saúde (pc+wifi), menor o multiplicador de espera
-        health_factor = (pc + wifi) / 2
+        # Quanto maior a saúde (provedores ponderados), menor o multiplicador de espera
+        health_factor = _health(context)
         # Evita divisão por zero e garante um piso de segurança
         adaptive_multiplier = max(0.1, (10 - health_factor) / max(0.1, speed_factor))
         
         final_wait = base_time * adaptive_multiplier
-        return self.apply_profile(final_wait)
+        return self.apply_profile(final_wait, config)
+
+    def compute_wait_batch(
+        self,
+        base_times: Sequence[float],
+        speed_factors: Union[float, Sequence[float]],
+        context: Dict[str, Any],
+        *,
+        config=None,
+        backend: Optional[str] = None,
+    ):
+        """
+        compute_wait() para muitos tempos base com o mesmo contexto.
+        Uma passada NumPy quando disponível (retorna ndarray); senão array('d').
+        `speed_factors` pode ser escalar ou um valor por item.
+        """
+        health_factor = _health(context)
+        aggressiveness = self._profile(config).aggressiveness
+        np = _numpy() if backend != "array" else None
+        if backend == "numpy" and np is None:
+            raise ImportError("numpy is required for backend='numpy'")
+
+        if np is not None:
+            base = np.asarray(base_times, dtype=np.float64)
+            speed = np.asarray(speed_factors, dtype=np.float64)
+            multiplier = np.maximum(0.1, (10 - health_factor) / np.maximum(0.1, speed))
+            return base * multiplier * aggressiveness
+
+        if isinstance(speed_factors, (int, float)):
+            multiplier = max(0.1, (10 - health_factor) / max(0.1, speed_factors))
+            return array("d", [b * multiplier * aggressiveness for b in base_times])
+        return array("d", [
+            b * max(0.1, (10 - health_factor) / max(0.1, s)) * aggressiveness
+            for b, s in zip(base_times, speed_factors)
+        ])
+
+    def plan_waits(
+        self,
+        base_times: Sequence[float],
+        speed_factors: Union[float, Sequence[float]] = 1.5,
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        bias: float = 1.0,
+        cap: bool = True,
+        config=None,
+        backend: Optional[str] = None,
+    ):
+        """
+        Tempos finais que wait(t) dormiria para cada item (modo tempo):
+        compute_wait + teto em t (cap, como quando smart=False) + piso + viés,
+        com resultado idêntico ao caminho escalar.
+        """
+        context = context if context is not None else self.snapshot_context()
+        waits = self.compute_wait_batch(base_times, speed_factors, context, config=config, backend=backend)
+
+        if not isinstance(waits, array):
+            np = _numpy()
+            if cap:
+                waits = np.minimum(waits, np.asarray(base_times, dtype=np.float64))
+            waits = np.floor(np.maximum(MIN_WAIT, waits) * 1e4 + 0.5) / 1e4
+            return np.floor(waits * bias * 1e4 + 0.5) / 1e4
+
+        return array("d", [
+            finalize_wait(w, b, bias, cap) for w, b in zip(waits, base_times)
+        ])
+
+    def compute_wait_wifi(self, speed_factor: float, ssid: Optional[str] = None, *, context: Optional[Dict[str, Any]] = None) -> float:
+        """
+        Fator de velocidade considerando CPU e Wi-Fi (maior = sistema mais rápido).
+        Usado pelos modos auto e async: intervalo = 1 / fator.
+        """
+        ctx = context if context is not None else self.snapshot_context(ssid)
+        if ctx["wifi_score"] is None:
+            ctx = dict(ctx, wifi_score=self.get_wifi_signal(ssid), health=None)
+        health = _health(ctx)
+        return round(max(0.2, health * speed_factor / 5), 4)
+
+    def compute_wait_no_wifi(self, speed_factor: float, *, context: Optional[Dict[str, Any]] = None) -> float:
+        """Fator de velocidade considerando apenas a saúde do sistema."""
+        ctx = context if context is not None else self.snapshot_context()
+        net = ctx.get("net_score")
+        health = ctx["pc_score"] if net is None else (ctx["pc_score"] + net) / 2
+        return round(max(0.2, health * speed_factor / 5), 4)
+
+    def apply_profile(self, wait_time: float, config=None) -> float:
+        """
+        Ajusta o tempo conforme o perfil: o da WaitConfig/perfil informado ou,
+        sem argumento, o perfil padrão do motor.
+        """
+        return wait_time * self._profile(config).aggressiveness
+
+
+_ENGINE: Optional[NanoWait] = None
+_ENGINE_LOCK = threading.Lock()
 
-    def apply_profile(self, wait_time: float) -> float:
-        """Ajusta o tempo conforme o perfil de execução ativo."""
-        return wait_time * self.profile.aggressiveness
+def get_engine() -> NanoWait:
+    """Motor compartilhado por wait, wait_async e wait_auto (somente caches)."""
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                _ENGINE = NanoWait()
+    return _ENGINE
@@ -0,0 +1,232 @@
+"""
+NanoWait Daemon
+---------------
+Motor residente (`nano-wait serve`) atendendo esperas por um socket Unix.
+
+Um único processo mantém o motor aquecido (provedores de contexto em
+background, cache de Wi-Fi/rede, perfis carregados) e um único estado de
+aprendizado em memória (LearningStore) para todos os chamadores da máquina:
+o arquivo é lido uma vez e regravado atomicamente a cada atualização. Scripts
+shell pagam apenas a conexão ao socket em vez da partida do interpretador e
+da amostragem.
+
+Protocolo: uma requisição por linha, uma resposta JSON por linha. A linha é
+um job no formato de `nano-wait batch` ou uma forma curta em palavras:
+
+    ping
+    wait 1.5 [smart=true speed=fast]
+    port 5432 [host] [timeout=30]
+    path /tmp/app.ready
+    http http://localhost:8000/health [status]
+    exec lambda: 1+1          (apenas com `nano-wait serve --allow-exec`)
+
+Opções `chave=valor` no fim da linha viram campos do job (timeout, profile,
+speed, key, smart, id). Ex.: `echo "wait 2" | socat - UNIX-CONNECT:$SOCK`.
+
+Jobs `exec` avaliam expressões arbitrárias (builtins vazios não são um
+sandbox) e por isso são recusados, a menos que o servidor os habilite
+explicitamente. O socket é criado já com permissão 0600 (umask 077).
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+from typing import Any, Dict, Optional, Union
+
+from .batch import run_job
+
+SOCKET_ENV = "NANO_WAIT_SOCKET"
+
+
+def default_socket_path() -> str:
+    """$NANO_WAIT_SOCKET, senão $XDG_RUNTIME_DIR/nano-wait.sock, senão /tmp por usuário."""
+    env = os.environ.get(SOCKET_ENV)
+    if env:
+        return env
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "nano-wait.sock")
+    return f"/tmp/nano-wait-{os.getuid()}.sock"
+
+
+def _value(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_request(line: str) -> Dict[str, Any]:
+    """Converte uma linha do protocolo em job (ValueError se inválida)."""
+    line = line.strip()
+    if line.startswith("{"):
+        job = json.loads(line)
+        if not isinstance(job, dict):
+            raise ValueError("o job deve ser um objeto JSON")
+        return job
+
+    command, _, rest = line.partition(" ")
+    if command == "ping":
+        return {"ping": True}
+    if command == "exec":
+        # a lambda pode conter espaços e '=': o resto da linha é a expressão
+        return {"exec": rest.strip()}
+
+    words = rest.split()
+    options = {}
+    while words and "=" in words[-1]:
+        name, _, raw = words.pop().partition("=")
+        options[name] = _value(raw)
+
+    if command == "wait" and len(words) == 1:
+        job = {"wait": float(words[0])}
+    elif command == "port" and len(words) in (1, 2):
+        job = {"port": int(words[0])}
+        if len(words) == 2:
+            job["host"] = words[1]
+    elif command == "path" and len(words) == 1:
+        job = {"path": words[0]}
+    elif command == "http" and len(words) in (1, 2):
+        job = {"http": words[0]}
+        if len(words) == 2:
+            job["status"] = int(words[1])
+    else:
+        raise ValueError(f"requisição inválida: {line!r}")
+    job.update(options)
+    return job
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8", "replace").strip()
+            if not line:
+                continue
+            try:
+                job = parse_request(line)
+            except ValueError as e:
+                response = {"ok": False, "error": str(e)}
+            else:
+                if job.get("ping"):
+                    response = {"ok": True, "pid": os.getpid()}
+                elif "exec" in job and not self.server.allow_exec:
+                    response = {"id": job.get("id"), "ok": False,
+                                "error": "jobs exec desabilitados (inicie com nano-wait serve --allow-exec)"}
+                else:
+                    response = run_job(job, profile=self.server.profile)
+            try:
+                self.wfile.write((json.dumps(response, default=repr) + "\n").encode())
+                self.wfile.flush()
+            except OSError:
+                return  # cliente desconectou
+
+
+class NanoWaitServer(socketserver.ThreadingUnixStreamServer):
+    """Servidor de esperas; uma thread por conexão, todas no mesmo motor."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Optional[str] = None, *, profile: Optional[str] = None, allow_exec: bool = False):
+        self.path = path or default_socket_path()
+        self.profile = profile
+        self.allow_exec = allow_exec
+        if os.path.exists(self.path):
+            _remove_stale(self.path)
+        # bind() cria o socket com a umask do processo: restringe antes, não depois
+        previous = os.umask(0o077)
+        try:
+            super().__init__(self.path, _Handler)
+        finally:
+            os.umask(previous)
+        os.chmod(self.path, 0o600)
+        self.warm()
+
+    def warm(self) -> None:
+        """Cria o motor, carrega o aprendizado e dispara a primeira amostragem."""
+        from .core import get_engine
+        from .learning import get_store
+        get_store()
+        get_engine().snapshot_context()
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def _remove_stale(path: str) -> None:
+    """Remove um socket abandonado; recusa se outro servidor ainda responde."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise RuntimeError(f"já existe um nano-wait serve em {path}")
+    finally:
+        probe.close()
+
+
+def request(job: Union[str, Dict[str, Any]], path: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Envia uma requisição (linha do protocolo ou job) e devolve a resposta."""
+    line = job if isinstance(job, str) else json.dumps(job)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or default_socket_path())
+        sock.sendall(line.strip().encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            response = reader.readline()
+    if not response:
+        raise ConnectionError("o servidor fechou a conexão sem responder")
+    return json.loads(response)
+
+
+def serve_main(argv) -> None:
+    """nano-wait serve — mantém o motor aquecido atrás de um socket Unix."""
+    import argparse
+
+    from .core import PROFILES
+
+    parser = argparse.ArgumentParser(prog="nano-wait serve", description="Servidor residente de esperas adaptativas.")
+    parser.add_argument("--socket", help=f"Caminho do socket (padrão: ${SOCKET_ENV} ou {default_socket_path()})")
+    parser.add_argument("--profile", type=str, choices=sorted(PROFILES), help="Perfil padrão das requisições")
+    parser.add_argument("--allow-exec", action="store_true", help="Aceita jobs exec (avaliação de lambdas) no socket")
+    args = parser.parse_args(argv)
+
+    try:
+        server = NanoWaitServer(args.socket, profile=args.profile, allow_exec=args.allow_exec)
+    except (RuntimeError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"🛰  nano-wait servindo em {server.path}", file=sys.stderr)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def client_main(argv) -> None:
+    """nano-wait client <requisição> — envia uma linha ao servidor e imprime a resposta."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="nano-wait client", description="Cliente do nano-wait serve.")
+    parser.add_argument("--socket", help="Caminho do socket do servidor")
+    parser.add_argument("--timeout", type=float, default=None, help="Timeout da conexão em segundos")
+    parser.add_argument("request", nargs=argparse.REMAINDER, help='Ex.: wait 1.5 | port 5432 | \'{"path": "/x"}\'')
+    args = parser.parse_args(argv)
+    if not args.request:
+        parser.error("informe a requisição (ex.: wait 1.5)")
+
+    try:
+        response = request(" ".join(args.request), args.socket, args.timeout)
+    except (OSError, ValueError) as e:
+        print(f"❌ Servidor indisponível: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(response))
+    if not response.get("ok"):
+        sys.exit(1)
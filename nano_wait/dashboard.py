@@ -1,132 +1,345 @@
 # dashboard.py
-import threading
+import collections
+import itertools
+import os
 import queue
-import tkinter as tk
-from tkinter import ttk
-from time import sleep
-
-
-class TelemetryDashboard(threading.Thread):
-    def __init__(self, telemetry_queue: queue.Queue):
-        super().__init__(daemon=True)
-        self.q = telemetry_queue
-        self.running = True
+import sys
+import threading
+import time
+
+
+# ------------------------------------------------------------------
+# Dashboard compartilhado (um consumidor por processo)
+# ------------------------------------------------------------------
+#
+# Todas as sessões de telemetria publicam no mesmo hub. Produtores nunca
+# bloqueiam: quando a fila está cheia o evento é descartado e contabilizado
+# em `dropped`. STOP nunca é descartado (vai para uma lista à parte, no
+# máximo um por sessão) e sessões sem eventos por `session_ttl` segundos
+# expiram. O hub mantém apenas o estado das sessões ativas e entrega
+# snapshots periódicos a um renderer (terminal, web, Tk ou nenhum).
+
+STOP = "__STOP__"
+SESSION_TTL = 60.0
+
+
+class SessionChannel:
+    """Fila "virtual" entregue à TelemetrySession; encaminha ao hub sem bloquear."""
+
+    __slots__ = ("hub", "session_id", "profile")
+
+    def __init__(self, hub: "DashboardHub", session_id: int, profile: str):
+        self.hub = hub
+        self.session_id = session_id
+        self.profile = profile
+
+    def put(self, item) -> bool:
+        return self.hub.publish((self.session_id, self.profile, item))
+
+
+class DashboardHub(threading.Thread):
+    def __init__(self, renderer=None, maxsize: int = 1024, refresh: float = 0.25, session_ttl: float = SESSION_TTL):
+        super().__init__(name="nano-wait-dashboard", daemon=True)
+        self.renderer = renderer or HeadlessRenderer()
+        self.refresh = refresh
+        self.session_ttl = session_ttl
+        self.q: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stops = collections.deque()
+        self.dropped = 0
+        self.received = 0
+        self.finished = 0
+        self.expired = 0
+        self.sessions = {}
+        self._ids = itertools.count(1)
+        self._state_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    # --- produtores ---
+
+    def channel(self, profile: str) -> SessionChannel:
+        return SessionChannel(self, next(self._ids), profile)
+
+    def publish(self, event) -> bool:
+        if event[2] == STOP:
+            # fora da fila limitada: um STOP descartado deixaria a sessão ativa para sempre
+            self._stops.append(event)
+            return True
+        try:
+            self.q.put_nowait(event)
+            return True
+        except queue.Full:
+            with self._state_lock:
+                self.dropped += 1
+            return False
+
+    # --- consumidor ---
+
+    def _apply(self, event) -> None:
+        session_id, profile, item = event
+        with self._state_lock:
+            self.received += 1
+            if item == STOP:
+                if self.sessions.pop(session_id, None) is not None:
+                    self.finished += 1
+                return
+            self.sessions[session_id] = {
+                "profile": profile,
+                "factor": item["factor"],
+                "interval": item["interval"],
+                "count": item["count"],
+                "seen": time.monotonic(),
+            }
+
+    def expire(self, now: float = None) -> int:
+        """Remove sessões sem eventos há mais de session_ttl (produtor sumiu sem STOP)."""
+        now = time.monotonic() if now is None else now
+        with self._state_lock:
+            stale = [sid for sid, s in self.sessions.items() if now - s["seen"] > self.session_ttl]
+            for sid in stale:
+                del self.sessions[sid]
+            self.expired += len(stale)
+        return len(stale)
+
+    def snapshot(self) -> dict:
+        with self._state_lock:
+            return {
+                "active": len(self.sessions),
+                "finished": self.finished,
+                "events": self.received,
+                "dropped": self.dropped,
+                "expired": self.expired,
+                "sessions": {sid: dict(s) for sid, s in self.sessions.items()},
+            }
+
+    def drain(self, first=None) -> None:
+        """Aplica todos os eventos pendentes (útil para testes e shutdown)."""
+        # STOPs capturados antes de esvaziar a fila: os eventos anteriores de
+        # cada sessão já estão nela e são aplicados antes do STOP
+        stops = []
+        while self._stops:
+            stops.append(self._stops.popleft())
+        if first is not None:
+            self._apply(first)
+        while True:
+            try:
+                self._apply(self.q.get_nowait())
+            except queue.Empty:
+                break
+        for event in stops:
+            self._apply(event)
 
     def run(self):
-        self.root = tk.Tk()
-        self.root.title("NanoWait — Telemetry Dashboard")
-        self.root.geometry("420x260")
-        self.root.resizable(False, False)
-
-        self.factor_var = tk.StringVar(value="—")
-        self.interval_var = tk.StringVar(value="—")
-        self.count_var = tk.StringVar(value="0")
-
-        ttk.Label(self.root, text="NanoWait Telemetry", font=("Arial", 14, "bold")).pack(pady=10)
-
-        frame = ttk.Frame(self.root)
-        frame.pack(pady=10)
-
-        ttk.Label(frame, text="Adaptive Factor:").grid(row=0, column=0, sticky="w")
-        ttk.Label(frame, textvariable=self.factor_var).grid(row=0, column=1, sticky="e")
-
-        ttk.Label(frame, text="Interval (s):").grid(row=1, column=0, sticky="w")
-        ttk.Label(frame, textvariable=self.interval_var).grid(row=1, column=1, sticky="e")
-
-        ttk.Label(frame, text="Adjustments:").grid(row=2, column=0, sticky="w")
-        ttk.Label(frame, textvariable=self.count_var).grid(row=2, column=1, sticky="e")
-
-        ttk.Separator(self.root).pack(fill="x", pady=10)
-
-        self.status = ttk.Label(self.root, text="Running…", foreground="green")
-        self.status.pack()
-
-        self.root.after(100, self.poll_queue)
-        self.root.mainloop()
-
-    def poll_queue(self):
         try:
-            while not self.q.empty():
-                data = self.q.get_nowait()
-
-                if data == "__STOP__":
-                    self.status.config(text="Finished", foreground="gray")
-                    self.running = False
-                    self.root.after(800, self.root.destroy)
-                    return
-
-                self.factor_var.set(str(data["factor"]))
-                self.interval_var.set(str(data["interval"]))
-                self.count_var.set(str(data["count"]))
-
+            self.renderer.open()
+        except Exception:
+            self.renderer = HeadlessRenderer()
+        next_render = 0.0
+        while not self._stopped.is_set():
+            try:
+                first = self.q.get(timeout=self.refresh)
+            except queue.Empty:
+                first = None
+            self.drain(first)
+            now = time.monotonic()
+            if now >= next_render:
+                next_render = now + self.refresh
+                self.expire(now)
+                try:
+                    self.renderer.render(self.snapshot())
+                except Exception:
+                    self.renderer = HeadlessRenderer()
+        self.renderer.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+class HeadlessRenderer:
+    """Não desenha nada; o estado fica disponível via DashboardHub.snapshot()."""
+
+    def open(self):
+        pass
+
+    def render(self, snapshot: dict):
+        pass
+
+    def close(self):
+        pass
+
+
+def _format_lines(snapshot: dict) -> list:
+    lines = [
+        "NanoWait Telemetry",
+        f"active={snapshot['active']} finished={snapshot['finished']} "
+        f"events={snapshot['events']} dropped={snapshot['dropped']}",
+        "",
+        f"{'session':>8} {'profile':<10} {'factor':>8} {'interval':>10} {'adjust':>7}",
+    ]
+    for sid, s in sorted(snapshot["sessions"].items()):
+        lines.append(
+            f"{sid:>8} {str(s['profile']):<10} {s['factor']:>8} {s['interval']:>10} {s['count']:>7}"
+        )
+    return lines
+
+
+class CursesRenderer:
+    """Painel de terminal (curses), redesenhado a cada refresh do hub."""
+
+    def open(self):
+        import curses
+        self._curses = curses
+        self.screen = curses.initscr()
+        curses.noecho()
+        curses.curs_set(0)
+
+    def render(self, snapshot: dict):
+        height, width = self.screen.getmaxyx()
+        self.screen.erase()
+        for row, line in enumerate(_format_lines(snapshot)[: height - 1]):
+            self.screen.addnstr(row, 0, line, width - 1)
+        self.screen.refresh()
+
+    def close(self):
+        try:
+            self._curses.endwin()
         except Exception:
             pass
 
-        if self.running:
-            self.root.after(100, self.poll_queue)
-# dashboard.py
-import threading
-import queue
-import tkinter as tk
-from tkinter import ttk
-from time import sleep
-
 
-class TelemetryDashboard(threading.Thread):
-    def __init__(self, telemetry_queue: queue.Queue):
-        super().__init__(daemon=True)
-        self.q = telemetry_queue
-        self.running = True
+class WebRenderer:
+    """Página HTML local com auto-refresh e /snapshot.json."""
+
+    def __init__(self, port: int = 8765, addr: str = "127.0.0.1"):
+        self.port = port
+        self.addr = addr
+        self.server = None
+        self._latest = {}
+
+    def open(self):
+        import json
+        from html import escape
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        renderer = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/snapshot.json"):
+                    body = json.dumps(renderer._latest).encode("utf-8")
+                    ctype = "application/json"
+                else:
+                    text = "\n".join(_format_lines(renderer._latest)) if renderer._latest else "waiting..."
+                    body = (
+                        "<html><head><meta http-equiv='refresh' content='1'>"
+                        "<title>NanoWait Telemetry</title></head>"
+                        f"<body><pre>{escape(text)}</pre></body></html>"
+                    ).encode("utf-8")
+                    ctype = "text/html; charset=utf-8"
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((self.addr, self.port), _Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def render(self, snapshot: dict):
+        self._latest = snapshot
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+class TkRenderer:
+    """Uma única janela Tk por processo, atualizada pelo hub (na thread dele)."""
+
+    def open(self):
+        if not _tk_allowed():
+            # o hub cai para o HeadlessRenderer quando open() falha
+            raise RuntimeError("Tk exige a thread principal no macOS")
+        import tkinter as tk
 
-    def run(self):
         self.root = tk.Tk()
         self.root.title("NanoWait — Telemetry Dashboard")
-        self.root.geometry("420x260")
-        self.root.resizable(False, False)
-
-        self.factor_var = tk.StringVar(value="—")
-        self.interval_var = tk.StringVar(value="—")
-        self.count_var = tk.StringVar(value="0")
-
-        ttk.Label(self.root, text="NanoWait Telemetry", font=("Arial", 14, "bold")).pack(pady=10)
-
-        frame = ttk.Frame(self.root)
-        frame.pack(pady=10)
+        self.text = tk.StringVar(value="waiting...")
+        tk.Label(self.root, textvariable=self.text, font=("Courier", 11), justify="left").pack(padx=10, pady=10)
+        self.root.update()
 
-        ttk.Label(frame, text="Adaptive Factor:").grid(row=0, column=0, sticky="w")
-        ttk.Label(frame, textvariable=self.factor_var).grid(row=0, column=1, sticky="e")
+    def render(self, snapshot: dict):
+        self.text.set("\n".join(_format_lines(snapshot)))
+        self.root.update()
 
-        ttk.Label(frame, text="Interval (s):").grid(row=1, column=0, sticky="w")
-        ttk.Label(frame, textvariable=self.interval_var).grid(row=1, column=1, sticky="e")
-
-        ttk.Label(frame, text="Adjustments:").grid(row=2, column=0, sticky="w")
-        ttk.Label(frame, textvariable=self.count_var).grid(row=2, column=1, sticky="e")
-
-        ttk.Separator(self.root).pack(fill="x", pady=10)
-
-        self.status = ttk.Label(self.root, text="Running…", foreground="green")
-        self.status.pack()
-
-        self.root.after(100, self.poll_queue)
-        self.root.mainloop()
-
-    def poll_queue(self):
+    def close(self):
         try:
-            while not self.q.empty():
-                data = self.q.get_nowait()
-
-                if data == "__STOP__":
-                    self.status.config(text="Finished", foreground="gray")
-                    self.running = False
-                    self.root.after(800, self.root.destroy)
-                    return
-
-                self.factor_var.set(str(data["factor"]))
-                self.interval_var.set(str(data["interval"]))
-                self.count_var.set(str(data["count"]))
-
+            self.root.destroy()
         except Exception:
             pass
 
-        if self.running:
-            self.root.after(100, self.poll_queue)
+
+def _has_display() -> bool:
+    if sys.platform.startswith(("win", "darwin")):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def _tk_allowed() -> bool:
+    """Tk fora da thread principal só funciona fora do macOS."""
+    return threading.current_thread() is threading.main_thread() or sys.platform != "darwin"
+
+
+def make_renderer(kind: str = "auto", **options):
+    """
+    Cria um renderer: "auto", "tk", "curses", "web" ou "none". O hub renderiza
+    na própria thread, então "auto" só escolhe Tk onde ele aceita rodar fora
+    da thread principal (não no macOS); nos demais casos, sem renderer.
+    """
+    kind = (kind or "auto").lower()
+    if kind == "auto":
+        kind = "tk" if _has_display() and sys.platform != "darwin" else "none"
+    if kind == "tk":
+        return TkRenderer()
+    if kind == "curses":
+        return CursesRenderer()
+    if kind == "web":
+        return WebRenderer(**options)
+    return HeadlessRenderer()
+
+
+_HUB = None
+_HUB_LOCK = threading.Lock()
+
+
+def start_dashboard(renderer="auto", **options) -> DashboardHub:
+    """(Re)inicia o dashboard do processo com o renderer escolhido."""
+    global _HUB
+    if isinstance(renderer, str):
+        renderer = make_renderer(renderer, **options)
+    with _HUB_LOCK:
+        if _HUB is not None:
+            _HUB.stop()
+        _HUB = DashboardHub(renderer)
+        _HUB.start()
+        return _HUB
+
+
+def get_dashboard() -> DashboardHub:
+    """
+    Retorna o dashboard compartilhado, criando-o na primeira chamada.
+    O renderer padrão vem de NANO_WAIT_DASHBOARD (auto, tk, curses, web, none).
+    """
+    global _HUB
+    hub = _HUB
+    if hub is not None:
+        return hub
+    with _HUB_LOCK:
+        if _HUB is None:
+            _HUB = DashboardHub(make_renderer(os.environ.get("NANO_WAIT_DASHBOARD", "auto")))
+            _HUB.start()
+        return _HUB
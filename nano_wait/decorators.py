@@ -4,9 +4,10 @@ from functools import wraps
 from .execution import execute
 
 
-def retry(timeout=5, interval=0.2):
+def retry(timeout=5, interval=0.2, cancel=None):
     """
     Retry decorator powered by NanoWait execution engine.
+    `cancel` (CancelToken) stops the retries early.
     """
 
     def decorator(fn):
@@ -15,7 +16,8 @@ def retry(timeout=5, interval=0.2):
             return execute(
                 lambda: fn(*args, **kwargs),
                 timeout=timeout,
-                interval=interval
+                interval=interval,
+                cancel=cancel
             )
         return wrapper
 
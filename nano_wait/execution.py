@@ -6,11 +6,13 @@ e adaptabilidade. Ele garante que uma operação seja concluída com sucesso
 ou expire conforme o timeout, ajustando o intervalo de polling dinamicamente.
 """
 
-import time
 from dataclasses import dataclass
-from typing import Callable, Any, Optional, TypeVar, Generic
+from typing import Callable, Optional, TypeVar, Generic
 
 from .nano_wait import wait
+from .core import get_engine
+from .hooks import HOOKS
+from .cancel import CancelToken, resolve_cancel
 
 T = TypeVar('T')
 
@@ -22,9 +24,10 @@ class ExecutionResult(Generic[T]):
     attempts: int
     duration: float
     error: Optional[Exception] = None
+    cancelled: bool = False
 
     def __repr__(self) -> str:
-        status = "✅ SUCCESS" if self.success else "❌ FAILURE"
+        status = "✅ SUCCESS" if self.success else "⏹ CANCELLED" if self.cancelled else "❌ FAILURE"
         return f"ExecutionResult({status}, attempts={self.attempts}, duration={self.duration:.3f}s)"
 
 def execute(
@@ -34,7 +37,9 @@ def execute(
     interval: float = 0.2,
     profile: Optional[str] = None,
     verbose: bool = False,
-    smart: bool = True
+    smart: bool = True,
+    clock=None,
+    cancel: Optional[CancelToken] = None
 ) -> ExecutionResult[T]:
     """
     Executa repetidamente uma função até que ela retorne um valor verdadeiro ou o tempo expire.
@@ -45,25 +50,38 @@ def execute(
     :param profile: Perfil de execução ("ci", "testing", "rpa").
     :param verbose: Ativa logs detalhados durante a execução.
     :param smart: Habilita adaptabilidade do intervalo baseada em hardware.
+    :param clock: Relógio usado para timeout e esperas (padrão: monotônico).
+    :param cancel: CancelToken que interrompe as tentativas (result.cancelled=True).
     """
-    start_time = time.time()
+    # Configuração resolvida uma vez e reutilizada em todas as esperas
+    config = get_engine().configure(profile, clock=clock)
+    clock = config.clock
+    cancel = resolve_cancel(cancel)
+    timer = HOOKS.timer("execute")
+    start_time = clock.now()
     attempts = 0
     last_error = None
 
-    while (time.time() - start_time) < timeout:
+    while (clock.now() - start_time) < timeout:
+        if cancel is not None and cancel.cancelled:
+            break
+
         try:
             result = fn()
+            timer.mark("call")
             
             # Se a função retornar algo que avalie como verdadeiro, consideramos sucesso
             if result:
+                timer.finish(profile=profile, outcome="ok", polls=attempts + 1)
                 return ExecutionResult(
                     success=True,
                     result=result,
                     attempts=attempts + 1,
-                    duration=round(time.time() - start_time, 4)
+                    duration=round(clock.now() - start_time, 4)
                 )
                 
         except Exception as e:
+            timer.mark("call")
             last_error = e
             if verbose:
                 print(f"[NanoWait Execution] Attempt {attempts + 1} failed: {e}")
@@ -72,16 +90,21 @@ def execute(
         # conforme o contexto do sistema e o perfil escolhido.
         wait(
             interval, 
-            profile=profile, 
             smart=smart, 
-            verbose=verbose
+            verbose=verbose,
+            config=config,
+            cancel=cancel
         )
+        timer.mark("wait")
         attempts += 1
 
+    cancelled = cancel is not None and cancel.cancelled
+    timer.finish(profile=profile, outcome="cancelled" if cancelled else "timeout", polls=attempts)
     return ExecutionResult(
         success=False,
         result=None,
         attempts=attempts,
-        duration=round(time.time() - start_time, 4),
-        error=last_error
+        duration=round(clock.now() - start_time, 4),
+        error=last_error,
+        cancelled=cancelled
     )
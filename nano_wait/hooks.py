@@ -0,0 +1,173 @@
+"""
+NanoWait Instrumentation Hooks
+------------------------------
+Relata o tempo gasto em cada fase de uma chamada (contexto, aprendizado,
+telemetria, cálculo, sleep...) para hooks registrados.
+
+Sem hooks registrados, o motor usa um temporizador nulo cujos métodos não
+fazem nada: o custo no hot path é uma verificação de tupla vazia por chamada.
+
+Exemplo:
+    from nano_wait import hooks
+
+    stats = hooks.PhaseStats()
+    hooks.add_hook(stats)
+    wait(0.05)
+    print(stats.snapshot()["wait"]["sleep"]["p50"])
+"""
+
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from .stats import LogHistogram
+
+
+@dataclass(frozen=True)
+class PhaseReport:
+    """Detalhamento de uma chamada: duração por fase e metadados do motor."""
+    kind: str                     # "wait", "wait_async", "wait_auto", "execute", "pool"
+    phases: Dict[str, float]      # segundos por fase (acumulados em loops)
+    total: float
+    info: Dict[str, Any] = field(default_factory=dict)
+
+
+Hook = Callable[[PhaseReport], None]
+
+
+class PhaseTimer:
+    """Cronômetro por marcação: mark(fase) atribui à fase o tempo desde a última marca."""
+
+    __slots__ = ("kind", "phases", "info", "_registry", "_start", "_last")
+
+    def __init__(self, kind: str, registry: "HookRegistry"):
+        self.kind = kind
+        self.phases: Dict[str, float] = {}
+        self.info: Dict[str, Any] = {}
+        self._registry = registry
+        self._start = self._last = perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def note(self, **info: Any) -> None:
+        self.info.update(info)
+
+    def finish(self, **info: Any) -> None:
+        if info:
+            self.info.update(info)
+        self._registry.emit(PhaseReport(
+            kind=self.kind,
+            phases=self.phases,
+            total=perf_counter() - self._start,
+            info=self.info,
+        ))
+
+
+class _NullTimer:
+    """Temporizador sem efeito, usado quando não há hooks."""
+
+    __slots__ = ()
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def note(self, **info: Any) -> None:
+        pass
+
+    def finish(self, **info: Any) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class HookRegistry:
+    """Lista copy-on-write de hooks; leitura sem lock no hot path."""
+
+    def __init__(self):
+        self._hooks: tuple = ()
+        self._lock = threading.Lock()
+
+    def add(self, hook: Hook) -> Hook:
+        with self._lock:
+            if hook not in self._hooks:
+                self._hooks = self._hooks + (hook,)
+        return hook
+
+    def remove(self, hook: Hook) -> None:
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hooks = ()
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def timer(self, kind: str):
+        """Retorna um PhaseTimer se houver hooks, senão o temporizador nulo."""
+        return PhaseTimer(kind, self) if self._hooks else NULL_TIMER
+
+    def emit(self, report: PhaseReport) -> None:
+        for hook in self._hooks:
+            try:
+                hook(report)
+            except Exception:
+                # instrumentação nunca deve quebrar o código do usuário
+                pass
+
+
+HOOKS = HookRegistry()
+
+
+def add_hook(hook: Hook) -> Hook:
+    """Registra um hook no registro compartilhado pelos motores."""
+    return HOOKS.add(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    HOOKS.remove(hook)
+
+
+class PhaseStats:
+    """
+    Hook embutido: agrega durações em histogramas por (tipo de chamada, fase).
+    Inclui a fase sintética "total".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hists: Dict[str, Dict[str, LogHistogram]] = {}
+
+    def __call__(self, report: PhaseReport) -> None:
+        with self._lock:
+            per_kind = self._hists.setdefault(report.kind, {})
+            for phase, seconds in report.phases.items():
+                hist = per_kind.get(phase)
+                if hist is None:
+                    hist = per_kind[phase] = LogHistogram()
+                hist.add(seconds)
+            per_kind.setdefault("total", LogHistogram()).add(report.total)
+
+    def histogram(self, kind: str, phase: str) -> LogHistogram:
+        """Cópia do histograma de uma fase (vazio se nunca registrado)."""
+        with self._lock:
+            hist = self._hists.get(kind, {}).get(phase)
+            return LogHistogram().merge(hist) if hist else LogHistogram()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Resumo {tipo: {fase: {count, mean, p50, p95, p99, ...}}}."""
+        with self._lock:
+            return {
+                kind: {phase: hist.summary() for phase, hist in phases.items()}
+                for kind, phases in self._hists.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hists.clear()
@@ -1,62 +1,305 @@
 # learning.py
 import json
 import os
+import tempfile
 import threading
+from array import array
 from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from .stats import LogHistogram
+
+# Time-to-ready distributions (per key) used for the predictive first poll
+MIN_READY_SAMPLES = 5       # below this, condition waits poll from t=0 as before
+MAX_READY_SAMPLES = 64      # counts are halved on reaching this: a half-life of ~32 waits
+EARLY_QUANTILE = 0.1        # first poll happens at this quantile of time-to-ready
+PROBE_FRACTION = 0.5        # probe polls happen at this fraction of the first poll delay
+PROBE_EVERY = 8             # one wait in PROBE_EVERY probes below the learned quantile...
+CENSORED_SHARE = 0.5        # ...every other wait while more than this share was censored
+LATE_QUANTILE = 0.9         # dense polling covers [early, late]
+DENSE_POLLS = 8             # polls spread across the [early, late] window
+
+# Load-conditioned bias table (pc_score band x network band)
+PC_BANDS = 5                # pc_score 0-10 in bands of 2.0
+NET_BANDS = 3               # net_score 0-10 in bands of ~3.3 (unknown = neutral 5.0)
+MIN_BUCKET_SAMPLES = 3      # below this a bucket defers to the global bias
+
+BIAS_MIN, BIAS_MAX = 0.5, 2.5
+
+# Snapshot used to warm-start a fresh machine (no local learning file yet)
+SEED_ENV = "NANO_WAIT_LEARNING_SEED"
+STATE_SCHEMA = 1
+
+
+def _ema_step(old: float, ratio: float, success: bool, alpha: float) -> float:
+    new = old * (1 - alpha) + ratio * alpha
+    # Penaliza levemente se houve timeout
+    if not success:
+        new *= 1.05
+    # Limites de segurança
+    return round(max(BIAS_MIN, min(BIAS_MAX, new)), 4)
+
+
+class BiasTable:
+    """
+    Bias per (pc_score band, net_score band), stored in two flat arrays.
+    Lookups interpolate bilinearly between neighbouring band centres and use
+    the global bias for buckets with fewer than MIN_BUCKET_SAMPLES samples.
+    """
+
+    __slots__ = ("pc_bands", "net_bands", "bias", "samples")
+
+    def __init__(self, pc_bands: int = PC_BANDS, net_bands: int = NET_BANDS):
+        self.pc_bands = pc_bands
+        self.net_bands = net_bands
+        self.bias = array("d", [1.0]) * (pc_bands * net_bands)
+        self.samples = array("I", [0]) * (pc_bands * net_bands)
+
+    @staticmethod
+    def _position(score: Optional[float], bands: int) -> float:
+        """Continuous band coordinate: band centres sit at 0, 1, ..., bands-1."""
+        if score is None:
+            score = 5.0
+        return min(bands - 1.0, max(0.0, score / 10 * bands - 0.5))
+
+    def _index(self, pc: Optional[float], net: Optional[float]) -> int:
+        i = int(self._position(pc, self.pc_bands) + 0.5)
+        j = int(self._position(net, self.net_bands) + 0.5)
+        return i * self.net_bands + j
+
+    def update(self, pc: Optional[float], net: Optional[float], ratio: float, success: bool,
+               alpha: float, start: float) -> None:
+        idx = self._index(pc, net)
+        old = self.bias[idx] if self.samples[idx] else start
+        self.bias[idx] = _ema_step(old, ratio, success, alpha)
+        self.samples[idx] += 1
+
+    def lookup(self, pc: Optional[float], net: Optional[float], fallback: float) -> float:
+        x = self._position(pc, self.pc_bands)
+        y = self._position(net, self.net_bands)
+        i0, j0 = int(x), int(y)
+        i1, j1 = min(i0 + 1, self.pc_bands - 1), min(j0 + 1, self.net_bands - 1)
+        fx, fy = x - i0, y - j0
+        bias, samples, n = self.bias, self.samples, self.net_bands
+
+        def at(i, j):
+            k = i * n + j
+            return bias[k] if samples[k] >= MIN_BUCKET_SAMPLES else fallback
+
+        top = at(i0, j0) * (1 - fy) + at(i0, j1) * fy
+        bottom = at(i1, j0) * (1 - fy) + at(i1, j1) * fy
+        return round(top * (1 - fx) + bottom * fx, 4)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pc_bands": self.pc_bands,
+            "net_bands": self.net_bands,
+            "bias": list(self.bias),
+            "samples": list(self.samples),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "BiasTable":
+        table = cls(int(data.get("pc_bands", PC_BANDS)), int(data.get("net_bands", NET_BANDS)))
+        size = table.pc_bands * table.net_bands
+        bias, samples = data.get("bias", []), data.get("samples", [])
+        if len(bias) == size and len(samples) == size:
+            table.bias = array("d", bias)
+            table.samples = array("I", samples)
+        return table
+
+
+class LearningStore:
+    """
+    Process-wide learning state: the file is read once and every
+    AdaptiveLearning of the process (and every client of `nano-wait serve`)
+    updates the same in-memory dict under one lock. Each save writes a temp
+    file and os.replace()s it, so readers never see a truncated file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock = threading.RLock()
+        self.data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        if not self.path.exists():
+            seed = os.environ.get(SEED_ENV)
+            if seed:
+                try:
+                    return {"profiles": dict(load_state(seed)["profiles"])}
+                except Exception:
+                    pass
+            return {
+                "profiles": {}
+            }
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get("profiles"), dict):
+                return data
+        except Exception:
+            pass
+        return {"profiles": {}}
+
+    def save(self) -> None:
+        """Atomically persists the current state (call with or without the lock)."""
+        with self.lock:
+            text = json.dumps(self.data, indent=2)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(text)
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+
+    def replace(self, data: Mapping[str, Any]) -> None:
+        with self.lock:
+            self.data = {"profiles": dict(data["profiles"])}
+            self.save()
+
+
+_STORE: Optional[LearningStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_store() -> LearningStore:
+    """Learning store of the process (reloaded if AdaptiveLearning._storage_path changes)."""
+    global _STORE
+    store = _STORE
+    path = AdaptiveLearning._storage_path
+    if store is None or store.path != path:
+        with _STORE_LOCK:
+            if _STORE is None or _STORE.path != path:
+                _STORE = LearningStore(path)
+            store = _STORE
+    return store
 
 
 class AdaptiveLearning:
     """
     Self-calibrating bias engine using EMA.
     Learns optimal wait scaling based on execution success.
+    Instances are cheap views over the shared LearningStore.
     """
 
-    _lock = threading.Lock()
     _storage_path = Path.home() / ".nano_wait_learning.json"
 
     def __init__(self, profile: str):
         self.profile = profile
         self.alpha = 0.1  # EMA smoothing factor
-        self._data = self._load()
+        self._store = get_store()
+        self._table: Optional[BiasTable] = None
 
-        if profile not in self._data["profiles"]:
-            self._data["profiles"][profile] = {
-                "bias": 1.0,
-                "samples": 0,
-                "timeouts": 0
-            }
-            self._save()
+        with self._store.lock:
+            if profile not in self._data["profiles"]:
+                self._data["profiles"][profile] = {
+                    "bias": 1.0,
+                    "samples": 0,
+                    "timeouts": 0
+                }
+                self._store.save()
+
+    @property
+    def _data(self) -> Dict[str, Any]:
+        return self._store.data
 
     # --------------------------
-    # Persistence
+    # Public API
     # --------------------------
 
-    def _load(self):
-        if not self._storage_path.exists():
-            return {
-                "profiles": {}
-            }
+    @property
+    def table(self) -> BiasTable:
+        """Load-conditioned bias table of this profile (decoded once)."""
+        if self._table is None:
+            data = self._data["profiles"][self.profile].get("table")
+            self._table = BiasTable.from_dict(data) if data else BiasTable()
+        return self._table
 
-        try:
-            with open(self._storage_path, "r") as f:
-                return json.load(f)
-        except Exception:
-            return {"profiles": {}}
+    def get_bias(self, context: Optional[Mapping[str, Any]] = None) -> float:
+        """
+        Global bias of the profile or, given a context snapshot, the bias
+        interpolated from the load-conditioned table.
+        """
+        bias = self._data["profiles"][self.profile]["bias"]
+        if context is None:
+            return bias
+        return self.table.lookup(context.get("pc_score"), context.get("net_score"), bias)
 
-    def _save(self):
-        with self._lock:
-            with open(self._storage_path, "w") as f:
-                json.dump(self._data, f, indent=2)
+    def ready_distribution(self, key: str) -> Optional[LogHistogram]:
+        """Streaming histogram of how long conditions for `key` took to become true."""
+        data = self._data["profiles"][self.profile].get("ready", {}).get(key)
+        return LogHistogram.from_dict(data) if data else None
 
-    # --------------------------
-    # Public API
-    # --------------------------
+    def ready_plan(self, key: str) -> Optional[Tuple[float, float, float]]:
+        """
+        (first_poll_delay, dense_until, dense_interval) learned for `key`, or
+        None while there are fewer than MIN_READY_SAMPLES observations.
+        """
+        hist = self.ready_distribution(key)
+        if hist is None or hist.count < MIN_READY_SAMPLES:
+            return None
+        early = hist.quantile(EARLY_QUANTILE)
+        late = hist.quantile(LATE_QUANTILE)
+        return early, late, max(0.01, (late - early) / DENSE_POLLS)
+
+    def ready_probe(self, key: str) -> Optional[float]:
+        """
+        Delay of an extra poll before the learned first poll, or None.
+
+        A condition already true at the first poll only says it was ready *by
+        then* (a censored observation), so the first poll alone can never move
+        earlier. Occasional probes below the quantile catch a condition that
+        got faster; they become frequent while most waits are censored.
+        """
+        hist = self.ready_distribution(key)
+        if hist is None or hist.count < MIN_READY_SAMPLES:
+            return None
+        censored = self._data["profiles"][self.profile]["ready"][key].get("censored", 0)
+        every = 2 if censored > CENSORED_SHARE * hist.count else PROBE_EVERY
+        if hist.count % every:
+            return None
+        return hist.quantile(EARLY_QUANTILE) * PROBE_FRACTION
+
+    def update(
+        self,
+        success: bool,
+        expected: float,
+        actual: float,
+        *,
+        key: Optional[str] = None,
+        ready_time: Optional[float] = None,
+        censored: bool = False,
+        context: Optional[Mapping[str, Any]] = None,
+    ):
+        with self._store.lock:
+            self._update(success, expected, actual, key, ready_time, censored, context)
+            self._store.save()
 
-    def get_bias(self) -> float:
-        return self._data["profiles"][self.profile]["bias"]
+    def _update(self, success, expected, actual, key, ready_time, censored, context):
+        profile_data = self._data["profiles"].setdefault(
+            self.profile, {"bias": 1.0, "samples": 0, "timeouts": 0})
 
-    def update(self, success: bool, expected: float, actual: float):
-        profile_data = self._data["profiles"][self.profile]
+        # Condition waits with a key also learn their time-to-ready;
+        # `censored` marks a condition that was already true at the first poll
+        if key is not None and success and ready_time is not None:
+            ready = profile_data.setdefault("ready", {})
+            previous = ready.get(key, {})
+            hist = LogHistogram.from_dict(previous) if previous else LogHistogram()
+            hist.add(ready_time)
+            count = previous.get("censored", 0) + (1 if censored else 0)
+            if hist.count >= MAX_READY_SAMPLES:
+                hist.scale(0.5)
+                count //= 2
+            ready[key] = hist.to_dict()
+            if count:
+                ready[key]["censored"] = count
 
         profile_data["samples"] += 1
 
@@ -70,15 +313,144 @@ class AdaptiveLearning:
             ratio = 1.0
 
         old_bias = profile_data["bias"]
-        new_bias = old_bias * (1 - self.alpha) + ratio * self.alpha
+        profile_data["bias"] = _ema_step(old_bias, ratio, success, self.alpha)
 
-        # Penaliza levemente se houve timeout
-        if not success:
-            new_bias *= 1.05
+        # Same observation, attributed to the load bucket it happened in;
+        # decoded again because other views may have updated it meanwhile
+        if context is not None:
+            self._table = None
+            self.table.update(context.get("pc_score"), context.get("net_score"),
+                              ratio, success, self.alpha, start=old_bias)
+            profile_data["table"] = self.table.to_dict()
+
+
+# --------------------------
+# State sharing (export / merge / import)
+# --------------------------
+
+def load_state(source: Union[str, os.PathLike, Mapping[str, Any]]) -> Dict[str, Any]:
+    """Reads a learning file or export; raises ValueError if it has no profiles."""
+    if isinstance(source, Mapping):
+        data = source
+    else:
+        with open(source, "r") as f:
+            data = json.load(f)
+    if not isinstance(data, Mapping) or not isinstance(data.get("profiles"), Mapping):
+        raise ValueError(f"not a nano-wait learning state: {source!r}")
+    return dict(data)
 
-        # Limites de segurança
-        new_bias = max(0.5, min(2.5, new_bias))
 
-        profile_data["bias"] = round(new_bias, 4)
+def export_state(path: Optional[Union[str, os.PathLike]] = None) -> Dict[str, Any]:
+    """Snapshot of the local learning state; also written to `path` if given."""
+    storage = AdaptiveLearning._storage_path
+    profiles = load_state(storage)["profiles"] if storage.exists() else {}
+    state = {"schema": STATE_SCHEMA, "profiles": profiles}
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(state, f, indent=2)
+    return state
 
-        self._save()
+
+class _ProfileAccumulator:
+    """Sample-weighted running sums for one profile."""
+
+    __slots__ = ("samples", "timeouts", "weighted", "plain", "sources", "table", "table_w", "ready", "censored")
+
+    def __init__(self):
+        self.samples = 0
+        self.timeouts = 0
+        self.weighted = 0.0        # sum(bias * samples)
+        self.plain = 0.0           # sum(bias), used when nobody has samples
+        self.sources = 0
+        self.table: Optional[BiasTable] = None
+        self.table_w: Optional[array] = None
+        self.ready: Dict[str, LogHistogram] = {}
+        self.censored: Dict[str, int] = {}
+
+    def add(self, data: Mapping[str, Any]) -> None:
+        samples = int(data.get("samples", 0))
+        bias = float(data.get("bias", 1.0))
+        self.samples += samples
+        self.timeouts += int(data.get("timeouts", 0))
+        self.weighted += bias * samples
+        self.plain += bias
+        self.sources += 1
+
+        if data.get("table"):
+            table = BiasTable.from_dict(data["table"])
+            if self.table is None:
+                self.table = BiasTable(table.pc_bands, table.net_bands)
+                self.table.samples = array("I", [0]) * len(table.samples)
+                self.table_w = array("d", [0.0]) * len(table.bias)
+            if len(table.bias) == len(self.table_w):
+                for i, n in enumerate(table.samples):
+                    if n:
+                        self.table_w[i] += table.bias[i] * n
+                        self.table.samples[i] += n
+
+        for key, hist in (data.get("ready") or {}).items():
+            self.ready.setdefault(key, LogHistogram()).merge(LogHistogram.from_dict(hist))
+            self.censored[key] = self.censored.get(key, 0) + int(hist.get("censored", 0))
+
+    def result(self) -> Dict[str, Any]:
+        if self.samples:
+            bias = self.weighted / self.samples
+        else:
+            bias = self.plain / self.sources if self.sources else 1.0
+        out: Dict[str, Any] = {
+            "bias": round(max(BIAS_MIN, min(BIAS_MAX, bias)), 4),
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+        }
+        if self.table is not None:
+            for i, n in enumerate(self.table.samples):
+                self.table.bias[i] = round(self.table_w[i] / n, 4) if n else 1.0
+            out["table"] = self.table.to_dict()
+        if self.ready:
+            out["ready"] = {key: hist.to_dict() for key, hist in self.ready.items()}
+            for key, count in self.censored.items():
+                if count:
+                    out["ready"][key]["censored"] = count
+        return out
+
+
+def merge_states(sources: Iterable[Union[str, os.PathLike, Mapping[str, Any]]]) -> Dict[str, Any]:
+    """
+    Merges many exports by sample-weighted averaging (bias, bias table) and
+    histogram addition (time-to-ready). Sources are read one at a time, so
+    memory stays proportional to the number of profiles, not of files.
+    Unreadable sources are skipped and counted.
+    """
+    profiles: Dict[str, _ProfileAccumulator] = {}
+    merged = skipped = 0
+    for source in sources:
+        try:
+            state = load_state(source)
+        except (OSError, ValueError):
+            skipped += 1
+            continue
+        for name, data in state["profiles"].items():
+            profiles.setdefault(name, _ProfileAccumulator()).add(data)
+        merged += 1
+    return {
+        "schema": STATE_SCHEMA,
+        "merged": merged,
+        "skipped": skipped,
+        "profiles": {name: acc.result() for name, acc in profiles.items()},
+    }
+
+
+def import_state(source: Union[str, os.PathLike, Mapping[str, Any]], *, replace: bool = False) -> Dict[str, Any]:
+    """
+    Loads a snapshot into the local learning file. By default it is merged
+    with what this machine already learned; `replace=True` overwrites it.
+    """
+    snapshot = load_state(source)
+    store = get_store()
+    with store.lock:
+        if replace or not store.path.exists():
+            state = {"profiles": dict(snapshot["profiles"])}
+        else:
+            state = {"profiles": merge_states([store.data, snapshot])["profiles"]}
+        store.replace(state)
+    return state
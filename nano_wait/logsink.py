@@ -0,0 +1,293 @@
+"""
+NanoWait Log Sink
+-----------------
+Log estruturado (JSON Lines) com escrita em background.
+
+O hot path apenas monta um dicionário e o coloca em uma fila (~1µs); uma
+thread daemon agrupa os registros, serializa, grava em lote a cada
+`flush_interval` e rotaciona o arquivo por tamanho. Integra-se ao módulo
+`logging` da biblioteca padrão via JsonLinesHandler.
+
+A fila é limitada (`max_queue`): sob sobrecarga, ou se a thread escritora
+morrer (ex.: caminho sem permissão), novos registros são descartados e
+contados em `dropped` em vez de acumular memória. A falha é reportada uma
+única vez em stderr.
+
+Configuração:
+    NANO_WAIT_LOG_PATH=/var/log/nano_wait.jsonl    (padrão: ./nano_wait.jsonl)
+
+    from nano_wait.logsink import configure_logging
+    configure_logging(path="waits.jsonl", max_bytes=5_000_000, backup_count=5)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+DEFAULT_PATH = "nano_wait.jsonl"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_QUEUE = 100_000
+
+_FLUSH = object()
+_CLOSE = object()
+
+
+class LogSink:
+    """Escritor assíncrono de registros JSON Lines com rotação por tamanho."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ):
+        self.path = path or os.environ.get("NANO_WAIT_LOG_PATH", DEFAULT_PATH)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.written = 0
+        self.dropped = 0
+        self.error: Optional[BaseException] = None
+        self._q: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    # --------------------------
+    # Hot path
+    # --------------------------
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        """Enfileira um registro; o timestamp é formatado pela thread escritora."""
+        if self._closed:
+            return
+        if self.error is not None:
+            # escritora morta: descarta em vez de acumular na fila
+            self.dropped += 1
+            return
+        record.setdefault("ts", time.time())
+        if self._thread is None:
+            self._start()
+        try:
+            self._q.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def log(self, event: str, **fields: Any) -> None:
+        fields["event"] = event
+        self.emit(fields)
+
+    # --------------------------
+    # Controle
+    # --------------------------
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Bloqueia até que os registros enfileirados sejam gravados."""
+        if self._thread is None:
+            return True
+        if self.error is not None or not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self._q.put((_FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout) and self.error is None
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            try:
+                self._q.put(_CLOSE, timeout=timeout)
+            except queue.Full:
+                return
+            self._thread.join(timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="nano-wait-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    # --------------------------
+    # Thread escritora
+    # --------------------------
+
+    def _run(self) -> None:
+        f = None
+        try:
+            f = self._open()
+            while True:
+                try:
+                    item = self._q.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+
+                batch = []
+                waiters = []
+                closing = False
+                while True:
+                    if item is _CLOSE:
+                        closing = True
+                    elif isinstance(item, tuple) and item and item[0] is _FLUSH:
+                        waiters.append(item[1])
+                    else:
+                        batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._q.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    f = self._write(f, batch)
+                for w in waiters:
+                    w.set()
+                if closing:
+                    return
+        except Exception as e:
+            # logging nunca deve quebrar o código do usuário: reporta uma vez,
+            # libera a fila e passa a descartar os próximos registros
+            self.error = e
+            print(f"[NanoWait] log writer stopped ({self.path}): {e!r}; further records are dropped",
+                  file=sys.stderr)
+            self._drain()
+        finally:
+            if f is not None:
+                f.close()
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                item = self._q.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, tuple) and item and item[0] is _FLUSH:
+                item[1].set()
+            elif item is not _CLOSE:
+                self.dropped += 1
+
+    def _open(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        return open(self.path, "a", encoding="utf-8")
+
+    def _write(self, f, batch):
+        lines = []
+        for record in batch:
+            ts = record.get("ts")
+            if isinstance(ts, float):
+                record["ts"] = datetime.fromtimestamp(ts).isoformat(timespec="microseconds")
+            lines.append(json.dumps(record, default=str))
+        f.write("\n".join(lines) + "\n")
+        f.flush()
+        self.written += len(batch)
+        if self.max_bytes and f.tell() >= self.max_bytes:
+            f.close()
+            self._rotate()
+            f = self._open()
+        return f
+
+    def _rotate(self) -> None:
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+class JsonLinesHandler(logging.Handler):
+    """Handler do `logging` que encaminha registros para um LogSink."""
+
+    def __init__(self, sink: Optional[LogSink] = None, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = {
+                "ts": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "msg": record.getMessage(),
+            }
+            fields = getattr(record, "nano_wait", None)
+            if isinstance(fields, dict):
+                data.update(fields)
+            (self.sink or get_sink()).emit(data)
+        except Exception:
+            self.handleError(record)
+
+
+_SINK: Optional[LogSink] = None
+_SINK_LOCK = threading.Lock()
+_HANDLER: Optional[JsonLinesHandler] = None
+
+
+def get_sink() -> LogSink:
+    """Sink compartilhado do processo (criado na primeira utilização)."""
+    global _SINK
+    sink = _SINK
+    if sink is None:
+        with _SINK_LOCK:
+            if _SINK is None:
+                _SINK = LogSink()
+            sink = _SINK
+    return sink
+
+
+def configure_logging(
+    path: Optional[str] = None,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    attach_logger: bool = True,
+) -> LogSink:
+    """
+    Substitui o sink do processo. Com attach_logger=True, o logger "nano_wait"
+    do módulo logging também passa a gravar no mesmo arquivo.
+    """
+    global _SINK, _HANDLER
+    with _SINK_LOCK:
+        old = _SINK
+        _SINK = LogSink(
+            path,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            flush_interval=flush_interval,
+        )
+        sink = _SINK
+    if old is not None:
+        old.close()
+
+    logger = logging.getLogger("nano_wait")
+    if _HANDLER is not None:
+        logger.removeHandler(_HANDLER)
+        _HANDLER = None
+    if attach_logger:
+        _HANDLER = JsonLinesHandler(sink)
+        logger.addHandler(_HANDLER)
+    return sink
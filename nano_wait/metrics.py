@@ -0,0 +1,286 @@
+"""
+NanoWait Metrics
+----------------
+Registro de métricas em processo com exportação no formato OpenMetrics
+via HTTP local (apenas biblioteca padrão).
+
+As atualizações não usam lock: cada thread escreve no seu próprio shard e a
+coleta (scrape) soma os shards. Quando a thread termina, seu shard é somado
+a um shard base e descartado, então threads de vida curta (uma por conexão
+no daemon, workers do batch) não acumulam memória. O registro é alimentado por um hook de
+instrumentação, portanto custa zero enquanto não estiver habilitado.
+
+Exemplo:
+    from nano_wait import metrics
+
+    metrics.enable_metrics()
+    metrics.start_metrics_server(port=9464)   # GET http://127.0.0.1:9464/metrics
+"""
+
+import threading
+import weakref
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from .hooks import HOOKS, PhaseReport
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Limites (segundos) dos buckets exportados
+BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    """Histograma de buckets fixos (contagens não cumulativas)."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * (len(BUCKETS) + 1)))
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Shard:
+    """Métricas escritas por uma única thread."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+
+    def merge(self, other: "_Shard") -> None:
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0.0) + value
+        for key, hist in list(other.histograms.items()):
+            total = self.histograms.get(key)
+            if total is None:
+                total = self.histograms[key] = _Histogram()
+            for i, c in enumerate(hist.counts):
+                total.counts[i] += c
+            total.sum += hist.sum
+            total.count += hist.count
+
+
+class _ThreadToken:
+    """Vive no threading.local: é coletado quando a thread termina."""
+
+    __slots__ = ("__weakref__",)
+
+
+class MetricsRegistry:
+    """Contadores, gauges e histogramas rotulados."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._base = _Shard()              # soma dos shards de threads encerradas
+        self._shards_lock = threading.Lock()
+        self._gauges: Dict[Tuple[str, Labels], float] = {}
+        self._help: Dict[str, Tuple[str, str]] = {}
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            token = self._local.token = _ThreadToken()
+            weakref.finalize(token, self._retire, shard)
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Soma o shard de uma thread encerrada ao shard base."""
+        with self._shards_lock:
+            self._base.merge(shard)
+            self._shards.remove(shard)
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    # --------------------------
+    # Atualização (hot path)
+    # --------------------------
+
+    def inc(self, name: str, labels: Labels, amount: float = 1.0) -> None:
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0.0) + amount
+
+    def set(self, name: str, labels: Labels, value: float) -> None:
+        self._gauges[(name, labels)] = value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        histograms = self._shard().histograms
+        key = (name, labels)
+        hist = histograms.get(key)
+        if hist is None:
+            hist = histograms[key] = _Histogram()
+        hist.observe(value)
+
+    # --------------------------
+    # Coleta
+    # --------------------------
+
+    def collect(self):
+        """Retorna (contadores, gauges, histogramas) agregados de todos os shards."""
+        total = _Shard()
+        with self._shards_lock:
+            total.merge(self._base)
+            for shard in self._shards:
+                total.merge(shard)
+        return total.counters, dict(self._gauges), total.histograms
+
+    def render(self) -> str:
+        """Exposição no formato texto OpenMetrics 1.0."""
+        counters, gauges, histograms = self.collect()
+        families: Dict[str, List[str]] = {}
+
+        for (name, labels), value in sorted(counters.items()):
+            families.setdefault(name, []).append(f"{name}_total{_fmt_labels(labels)} {_fmt(value)}")
+        for (name, labels), value in sorted(gauges.items()):
+            families.setdefault(name, []).append(f"{name}{_fmt_labels(labels)} {_fmt(value)}")
+        for (name, labels), hist in sorted(histograms.items(), key=lambda kv: kv[0]):
+            lines = families.setdefault(name, [])
+            cumulative = 0
+            for bound, c in zip(BUCKETS + (float("inf"),), hist.counts):
+                cumulative += c
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_fmt_labels(labels)} {_fmt(hist.sum)}")
+            lines.append(f"{name}_count{_fmt_labels(labels)} {hist.count}")
+
+        out = []
+        for name in sorted(families):
+            kind, help_text = self._help.get(name, ("unknown", ""))
+            out.append(f"# TYPE {name} {kind}")
+            if help_text:
+                out.append(f"# HELP {name} {help_text}")
+            out.extend(families[name])
+        out.append("# EOF")
+        return "\n".join(out) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _fmt_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value))
+
+
+# --------------------------
+# Integração com o motor
+# --------------------------
+
+class MetricsHook:
+    """Hook que converte PhaseReports em métricas por tipo, perfil e chave."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        registry.describe("nano_wait_waits", "counter", "Chamadas concluídas por resultado.")
+        registry.describe("nano_wait_polls", "counter", "Avaliações de condição (polls).")
+        registry.describe("nano_wait_timeouts", "counter", "Chamadas encerradas por timeout.")
+        registry.describe("nano_wait_learned_bias", "gauge", "Viés aprendido mais recente.")
+        registry.describe("nano_wait_interval_seconds", "histogram", "Intervalo de espera calculado.")
+        registry.describe("nano_wait_duration_seconds", "histogram", "Duração total da chamada.")
+
+    def __call__(self, report: PhaseReport) -> None:
+        info = report.info
+        profile = str(info.get("profile") or "default")
+        key = str(info.get("key") or profile)
+        outcome = str(info.get("outcome", "ok"))
+        labels = (("kind", report.kind), ("profile", profile), ("key", key))
+        reg = self.registry
+
+        reg.inc("nano_wait_waits", labels + (("outcome", outcome),))
+        polls = info.get("polls")
+        if polls:
+            reg.inc("nano_wait_polls", labels, polls)
+        if outcome == "timeout":
+            reg.inc("nano_wait_timeouts", labels)
+        bias = info.get("bias")
+        if bias is not None:
+            reg.set("nano_wait_learned_bias", (("profile", profile), ("key", key)), bias)
+        interval = info.get("interval")
+        if interval is not None:
+            reg.observe("nano_wait_interval_seconds", labels, interval)
+        reg.observe("nano_wait_duration_seconds", labels, report.total)
+
+
+REGISTRY = MetricsRegistry()
+_HOOK: Optional[MetricsHook] = None
+_SERVER = None
+
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """Passa a alimentar o registro com todas as chamadas dos motores."""
+    global _HOOK
+    disable_metrics()
+    _HOOK = MetricsHook(registry or REGISTRY)
+    HOOKS.add(_HOOK)
+    return _HOOK.registry
+
+
+def disable_metrics() -> None:
+    global _HOOK
+    if _HOOK is not None:
+        HOOKS.remove(_HOOK)
+        _HOOK = None
+
+
+def start_metrics_server(port: int = 9464, addr: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None):
+    """
+    Serve GET /metrics em uma thread daemon. Retorna o servidor
+    (server.server_address traz a porta real quando port=0).
+    """
+    global _SERVER
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    reg = registry or REGISTRY
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = reg.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="nano-wait-metrics", daemon=True).start()
+    _SERVER = server
+    return server
+
+
+def stop_metrics_server() -> None:
+    global _SERVER
+    if _SERVER is not None:
+        _SERVER.shutdown()
+        _SERVER.server_close()
+        _SERVER = None
@@ -5,45 +5,44 @@ Interface de alto nível para o motor de execução adaptativo.
 Oferece suporte a esperas baseadas em tempo, condições e telemetria.
 """
 
-import time
-import queue
-import socket
 from typing import overload, Callable, Optional, Union, Dict, Any
 from datetime import datetime
 
 from .learning import AdaptiveLearning
-from .core import NanoWait, PROFILES
+from .core import NanoWait, WaitConfig, finalize_wait, get_engine
+from .cancel import CANCELLED, CancelToken, resolve_cancel, sleep as cancellable_sleep
 from .utils import get_speed_value
 from .explain import ExplainReport
-from .telemetry import TelemetrySession
-from .dashboard import TelemetryDashboard
-
-_ENGINE = None
+from .telemetry import TelemetrySession, DEFAULT_CAPACITY
 
 def _get_engine(profile: Optional[str] = None) -> NanoWait:
-    global _ENGINE
-    if _ENGINE is None:
-        _ENGINE = NanoWait(profile)
-    elif profile and _ENGINE.profile.name != profile:
-        _ENGINE.profile = PROFILES.get(profile, PROFILES["default"])
-    return _ENGINE
+    """
+    Motor compartilhado. O perfil não é mais aplicado ao motor (era estado
+    global disputado entre threads): cada chamada resolve sua WaitConfig.
+    """
+    return get_engine()
 
 def has_internet(host="8.8.8.8", port=53, timeout=1) -> bool:
-    """Verifica conectividade básica de rede."""
+    """
+    Verifica conectividade básica de rede (bloqueante, uma única sonda).
+    Os motores usam o NetworkProbe em cache do NanoWait; esta função fica para
+    chamadas explícitas e não altera o timeout global de sockets.
+    """
+    import socket
     try:
-        socket.setdefaulttimeout(timeout)
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.connect((host, port))
-        return True
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
     except Exception:
         return False
 
-def _setup_telemetry(nw: NanoWait, context: Dict[str, Any], enabled: bool):
+def _setup_telemetry(config: WaitConfig, context: Dict[str, Any], enabled: bool):
     """Configura sessão de telemetria se habilitado."""
-    telemetry_queue = queue.Queue() if enabled else None
+    telemetry_queue = None
     if enabled:
         try:
-            TelemetryDashboard(telemetry_queue).start()
+            # Um único dashboard por processo, alimentado por todas as sessões
+            from .dashboard import get_dashboard
+            telemetry_queue = get_dashboard().channel(config.profile.name)
         except Exception:
             pass
 
@@ -51,12 +50,27 @@ def _setup_telemetry(nw: NanoWait, context: Dict[str, Any], enabled: bool):
         enabled=enabled,
         cpu_score=context["pc_score"],
         wifi_score=context["wifi_score"],
-        profile=nw.profile.name,
-        queue=telemetry_queue
+        profile=config.profile.name,
+        queue=telemetry_queue,
+        capacity=DEFAULT_CAPACITY
     )
     session.start()
     return session
 
+def _log_wait(**fields):
+    """Enfileira um registro estruturado no log em background (não bloqueia)."""
+    from .logsink import get_sink
+    get_sink().log("wait", **fields)
+
+def _cancelled(config, telemetry_session, timer, log, mode, elapsed, polls, key=None):
+    """Encerra uma espera cancelada sem atualizar o aprendizado."""
+    telemetry_session.stop()
+    timer.finish(profile=config.profile.name, outcome="cancelled", polls=polls, key=key)
+    if log:
+        _log_wait(profile=config.profile.name, mode=mode, outcome="cancelled",
+                  polls=polls, elapsed=round(elapsed, 4), key=key)
+    return CANCELLED
+
 @overload
 def wait(t: float, **kwargs) -> float: ...
 
@@ -74,7 +88,13 @@ def wait(
     log: bool = False,
     explain: bool = False,
     telemetry: bool = False,
-    profile: Optional[str] = None
+    profile: Optional[str] = None,
+    clock=None,
+    key: Optional[str] = None,
+    config: Optional[WaitConfig] = None,
+    cancel: Optional[CancelToken] = None,
+    share_key: Optional[str] = None,
+    share_ttl: float = 0.0
 ) -> Union[float, bool, ExplainReport]:
     """
     Executa uma espera adaptativa baseada em tempo ou condição.
@@ -89,51 +109,119 @@ def wait(
     :param explain: Retorna um relatório detalhado da decisão de timing.
     :param telemetry: Habilita dashboard de telemetria em tempo real.
     :param profile: Perfil de execução ("ci", "testing", "rpa").
+    :param clock: Relógio usado para medir e dormir (padrão: monotônico do motor).
+    :param key: Identifica a condição (ex: "login_page") para aprender quanto
+        tempo ela leva para ficar pronta e adiar o primeiro poll.
+    :param config: WaitConfig já resolvida (substitui profile/speed/clock/key).
+    :param cancel: CancelToken que interrompe a espera; retorna CANCELLED.
+    :param share_key: Esperas concorrentes com a mesma chave compartilham uma
+        única avaliação da condição em andamento.
+    :param share_ttl: Reaproveita o resultado compartilhado por esse tempo (s).
     """
-    nw = _get_engine(profile)
-    learning = AdaptiveLearning(nw.profile.name)
-    verbose = verbose or nw.profile.verbose
+    nw = _get_engine()
+    if config is None:
+        config = nw.configure(profile, speed=speed, clock=clock, learning_key=key)
+    clock = config.clock
+    key = config.learning_key
+    cancel = resolve_cancel(cancel)
+    timer = nw.hooks.timer("wait")
+    learning = AdaptiveLearning(config.profile.name)
+    verbose = verbose or config.profile.verbose
+    timer.mark("learning_load")
     
     # Snapshot inicial do ambiente
-    context = nw.snapshot_context(wifi)
-    telemetry_session = _setup_telemetry(nw, context, telemetry)
+    context = nw.snapshot_context(wifi, config=config)
+    timer.mark("context")
+    telemetry_session = _setup_telemetry(config, context, telemetry)
+    timer.mark("telemetry")
     
     # Resolução de velocidade
-    speed_value = nw.smart_speed(wifi) if smart else get_speed_value(speed)
+    speed_value = nw.smart_speed(wifi, context) if smart else get_speed_value(config.speed)
+    timer.mark("context")
 
     # --- MODO CONDIÇÃO (CALLABLE) ---
     if callable(t):
-        if timeout <= 0: return False
-        start_time = time.time()
+        if timeout <= 0:
+            timer.finish(profile=config.profile.name, outcome="timeout", polls=0)
+            return False
+        if share_key is not None:
+            from .singleflight import shared
+            t = shared(t, share_key, share_ttl, clock)
+        start_time = clock.now()
         attempts = 0
+        interval = None
+
+        # Primeiro poll preditivo: com histórico suficiente para a chave, dorme
+        # até o quantil inicial do tempo-até-pronto e depois faz polls densos
+        # até o quantil final, voltando ao intervalo adaptativo em seguida.
+        # De tempos em tempos, um poll de sondagem antes do quantil detecta
+        # uma condição que passou a ficar pronta mais cedo.
+        plan = learning.ready_plan(key) if key is not None else None
+        probe = None
+        if plan is not None:
+            first_delay, dense_until, dense_interval = plan
+            probe = learning.ready_probe(key)
+            if verbose:
+                print(f"[NanoWait | {config.profile.name}] Predictive first poll for '{key}': {first_delay:.3f}s")
+            cancelled = cancellable_sleep(clock, min(probe if probe is not None else first_delay, timeout), cancel)
+            timer.mark("sleep")
+            if cancelled:
+                return _cancelled(config, telemetry_session, timer, log, "condition", clock.now() - start_time, 0, key)
         
-        while (time.time() - start_time) < timeout:
+        while (clock.now() - start_time) < timeout:
+            if cancel is not None and cancel.cancelled:
+                return _cancelled(config, telemetry_session, timer, log, "condition", clock.now() - start_time, attempts, key)
             try:
                 if t():
+                    timer.mark("predicate")
+                    elapsed = clock.now() - start_time
                     telemetry_session.stop()
-                    learning.update(True, 1.0, 1.0)
+                    # Pronta já no primeiro poll preditivo: só sabemos que ficou
+                    # pronta até aqui (observação censurada)
+                    learning.update(True, 1.0, 1.0, key=key, ready_time=elapsed,
+                                    censored=plan is not None and attempts == 0, context=context)
+                    timer.mark("learning_update")
+                    timer.finish(profile=config.profile.name, outcome="ok", polls=attempts + 1, bias=learning.get_bias(context), interval=interval, key=key)
+                    if log:
+                        _log_wait(profile=config.profile.name, mode="condition", outcome="ok",
+                                  polls=attempts + 1, elapsed=round(elapsed, 4), key=key)
                     return True
             except Exception as e:
                 if verbose: print(f"[NanoWait] Condition Error: {e}")
+            timer.mark("predicate")
             
             # Cálculo de intervalo adaptativo para polling
             # Baseado na saúde do sistema para não sobrecarregar
-            interval = nw.compute_wait(0.1, speed_value, context)
+            interval = nw.compute_wait(config.profile.poll_interval, speed_value, context, config)
             interval = max(0.05, min(0.5, interval)) # Clamping de segurança
             
             # Aplicação de viés aprendido
-            bias = learning.get_bias()
+            bias = learning.get_bias(context)
             interval = round(interval * bias, 4)
+            if plan is not None and clock.now() - start_time < dense_until:
+                interval = min(interval, dense_interval)
+            if probe is not None and attempts == 0:
+                interval = max(0.0, first_delay - (clock.now() - start_time))
+            timer.mark("compute")
             
             telemetry_session.record(factor=speed_value, interval=interval)
             if verbose:
-                print(f"[NanoWait | {nw.profile.name}] Polling: {interval:.3f}s | Attempt: {attempts}")
+                print(f"[NanoWait | {config.profile.name}] Polling: {interval:.3f}s | Attempt: {attempts}")
+            timer.mark("telemetry")
             
-            time.sleep(interval)
+            cancelled = cancellable_sleep(clock, interval, cancel)
+            timer.mark("sleep")
             attempts += 1
+            if cancelled:
+                return _cancelled(config, telemetry_session, timer, log, "condition", clock.now() - start_time, attempts, key)
             
         telemetry_session.stop()
-        learning.update(False, 1.0, 1.0)
+        learning.update(False, 1.0, 1.0, context=context)
+        timer.mark("learning_update")
+        timer.finish(profile=config.profile.name, outcome="timeout", polls=attempts, bias=learning.get_bias(context), interval=interval, key=key)
+        if log:
+            _log_wait(profile=config.profile.name, mode="condition", outcome="timeout",
+                      polls=attempts, elapsed=round(clock.now() - start_time, 4), key=key)
         return False
 
     # --- MODO TEMPO (FLOAT) ---
@@ -142,32 +230,44 @@ def wait(
 
     # Calcula tempo adaptativo final
     base_t = float(t) if t is not None else 1.0
-    adaptive_wait = nw.compute_wait(base_t, speed_value, context)
+    adaptive_wait = nw.compute_wait(base_t, speed_value, context, config)
     
-    # Garante que não esperamos mais do que o solicitado se não for smart
-    if not smart and t is not None:
-        adaptive_wait = min(adaptive_wait, t)
-    
-    adaptive_wait = round(max(0.01, adaptive_wait), 4)
-    bias = learning.get_bias()
-    final_wait = round(adaptive_wait * bias, 4)
+    # Garante que não esperamos mais do que o solicitado se não for smart;
+    # piso, quantização e viés seguem as mesmas regras de NanoWait.plan_waits
+    bias = learning.get_bias(context)
+    final_wait = finalize_wait(adaptive_wait, t, bias, cap=not smart)
+    timer.mark("compute")
 
     telemetry_session.record(factor=speed_value, interval=final_wait)
+    timer.mark("telemetry")
     
+    start_time = clock.now()
     try:
-        time.sleep(final_wait)
-        learning.update(True, base_t, final_wait)
+        cancelled = cancellable_sleep(clock, final_wait, cancel)
+        timer.mark("sleep")
+        # Espera interrompida não é sucesso nem falha para o aprendizado
+        if not cancelled:
+            learning.update(True, base_t, final_wait, context=context)
     except Exception:
-        learning.update(False, base_t, final_wait)
+        learning.update(False, base_t, final_wait, context=context)
         raise
     finally:
         telemetry_session.stop()
+        timer.mark("learning_update")
+
+    if cancelled:
+        return _cancelled(config, telemetry_session, timer, log, "time", clock.now() - start_time, 0)
+
+    timer.finish(profile=config.profile.name, outcome="ok", polls=0, bias=bias, interval=final_wait)
+    if log:
+        _log_wait(profile=config.profile.name, mode="time", outcome="ok",
+                  requested=t, final=final_wait, bias=bias, speed=speed_value)
 
     if explain:
         return ExplainReport(
             requested_time=t,
             final_time=final_wait,
-            speed_input=speed,
+            speed_input=config.speed,
             speed_value=speed_value,
             smart=smart,
             cpu_score=context["pc_score"],
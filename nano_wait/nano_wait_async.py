@@ -1,22 +1,16 @@
 import asyncio
-import time
 from datetime import datetime
+from functools import partial
 from typing import Callable, Optional
 
 from .learning import AdaptiveLearning
-from .core import NanoWait, PROFILES
+from .core import NanoWait, WaitConfig, get_engine
 from .utils import get_speed_value
 from .telemetry import TelemetrySession
 from .explain import ExplainReport
 
-_ENGINE = None
-
-
-def _engine():
-    global _ENGINE
-    if _ENGINE is None:
-        _ENGINE = NanoWait()
-    return _ENGINE
+def _engine() -> NanoWait:
+    return get_engine()
 
 
 async def wait_async(
@@ -30,50 +24,78 @@ async def wait_async(
     explain: bool = False,
     telemetry: bool = False,
     profile: str | None = None,
+    clock=None,
+    config: WaitConfig | None = None,
+    share_key: str | None = None,
+    share_ttl: float = 0.0,
 ):
 
     nw = _engine()
+    if config is None:
+        config = nw.configure(profile, speed=speed, clock=clock)
+    clock = config.clock
+    timer = nw.hooks.timer("wait_async")
 
-    if not profile:
-        profile = "auto"
-
-    nw.profile = PROFILES.get(profile, PROFILES["default"])
-    learning = AdaptiveLearning(nw.profile.name)
+    learning = AdaptiveLearning(config.profile.name)
+    timer.mark("learning_load")
 
     # CONDITION MODE
     if callable(t):
 
         if timeout <= 0:
             return False
-
-        context = nw.snapshot_context(wifi)
-        speed_value = nw.smart_speed(wifi) if smart else get_speed_value(speed)
-
-        start = time.time()
-
-        while time.time() - start < timeout:
-
-            if await asyncio.to_thread(t):
-                learning.update(True, 1.0, 1.0)
+        if share_key is not None:
+            # Compartilhado também com esperas síncronas; seguidores aguardam
+            # um future em vez de bloquear threads do executor
+            from .singleflight import shared_async
+            evaluate = shared_async(t, share_key, share_ttl, clock)
+        else:
+            evaluate = partial(asyncio.to_thread, t)
+
+        context = nw.snapshot_context(wifi, config=config)
+        speed_value = nw.smart_speed(wifi, context) if smart else get_speed_value(config.speed)
+        timer.mark("context")
+
+        start = clock.now()
+        polls = 0
+
+        while clock.now() - start < timeout:
+
+            ready = await evaluate()
+            timer.mark("predicate")
+            polls += 1
+            if ready:
+                learning.update(True, 1.0, 1.0, context=context)
+                timer.mark("learning_update")
+                timer.finish(profile=config.profile.name, outcome="ok", polls=polls)
                 return True
 
             factor = nw.compute_wait_no_wifi(speed_value, context=context)
             interval = max(0.05, min(0.5, 1 / factor))
-            interval = nw.apply_profile(interval)
+            interval = nw.apply_profile(interval, config)
 
-            bias = learning.get_bias()
+            bias = learning.get_bias(context)
             interval *= bias
             interval = round(interval, 4)
+            timer.mark("compute")
 
-            await asyncio.sleep(interval)
+            await clock.sleep_async(interval)
+            timer.mark("sleep")
 
-        learning.update(False, 1.0, 1.0)
+        learning.update(False, 1.0, 1.0, context=context)
+        timer.mark("learning_update")
+        timer.finish(profile=config.profile.name, outcome="timeout", polls=polls)
         return False
 
     # NORMAL TIME
-    factor = nw.compute_wait_no_wifi(1.0, context=nw.snapshot_context(wifi))
+    context = nw.snapshot_context(wifi, config=config)
+    timer.mark("context")
+    factor = nw.compute_wait_no_wifi(1.0, context=context)
     raw_wait = t / factor if t else factor
     wait_time = round(max(0.05, min(raw_wait, t or raw_wait)), 3)
+    timer.mark("compute")
 
-    await asyncio.sleep(wait_time)
+    await clock.sleep_async(wait_time)
+    timer.mark("sleep")
+    timer.finish(profile=config.profile.name, outcome="ok", polls=0, interval=wait_time)
     return wait_time
@@ -1,20 +1,13 @@
 # nano_wait_auto.py
 
-import time
 from .learning import AdaptiveLearning
-from .core import NanoWait, PROFILES
-from .telemetry import TelemetrySession
+from .core import NanoWait, WaitConfig, get_engine
+from .telemetry import TelemetrySession, DEFAULT_CAPACITY
 from .utils import log_message
-from .nano_wait import has_internet
+from .cancel import CANCELLED, resolve_cancel, sleep as cancellable_sleep
 
-_ENGINE = None
-
-
-def _engine():
-    global _ENGINE
-    if _ENGINE is None:
-        _ENGINE = NanoWait()
-    return _ENGINE
+def _engine() -> NanoWait:
+    return get_engine()
 
 
 def wait_auto(
@@ -25,19 +18,25 @@ def wait_auto(
     verbose: bool = False,
     log: bool = False,
     telemetry: bool = False,
-    explain: bool = False
+    explain: bool = False,
+    clock=None,
+    config: WaitConfig | None = None,
+    cancel=None
 ) -> float | dict:
 
     nw = _engine()
+    if config is None:
+        config = nw.configure(profile, clock=clock)
+    clock = config.clock
+    cancel = resolve_cancel(cancel)
+    timer = nw.hooks.timer("wait_auto")
 
-    if profile:
-        nw.profile = PROFILES.get(profile, PROFILES["default"])
+    learning = AdaptiveLearning(config.profile.name)
 
-    learning = AdaptiveLearning(nw.profile.name)
+    verbose = verbose or config.profile.verbose
+    timer.mark("learning_load")
 
-    verbose = verbose or nw.profile.verbose
-
-    context = nw.snapshot_context(wifi)
+    context = nw.snapshot_context(wifi, network=True, config=config)
     cpu_score = context["pc_score"]
     wifi_score = context["wifi_score"]
 
@@ -45,34 +44,39 @@ def wait_auto(
         enabled=telemetry,
         cpu_score=cpu_score,
         wifi_score=wifi_score,
-        profile=nw.profile.name
+        profile=config.profile.name,
+        capacity=DEFAULT_CAPACITY
     )
     telemetry_session.start()
+    timer.mark("telemetry")
 
-    speed_value = nw.smart_speed(wifi)
+    speed_value = nw.smart_speed(wifi, context)
 
     factor = (
         nw.compute_wait_wifi(speed_value, wifi, context=context)
-        if wifi or has_internet()
+        if wifi or nw.network.read().reachable
         else nw.compute_wait_no_wifi(speed_value, context=context)
     )
 
+    timer.mark("context")
+
     interval = max(0.05, 1 / factor)
-    interval = nw.apply_profile(interval)
+    interval = nw.apply_profile(interval, config)
 
     if t is not None:
         interval = min(interval, t)
 
     # 🔥 APPLY LEARNING BIAS
-    bias = learning.get_bias()
+    bias = learning.get_bias(context)
     interval *= bias
     interval = round(interval, 4)
+    timer.mark("compute")
 
     telemetry_session.record(factor=factor, interval=interval)
 
     if verbose:
         print(
-            f"[NanoWait AUTO | {nw.profile.name}] "
+            f"[NanoWait AUTO | {config.profile.name}] "
             f"factor={factor:.2f} "
             f"bias={bias:.3f} "
             f"wait={interval:.4f}s"
@@ -80,20 +84,29 @@ def wait_auto(
 
     if log:
         log_message(
-            f"[NanoWait AUTO | {nw.profile.name}] "
-            f"factor={factor:.2f} "
-            f"bias={bias:.3f} "
-            f"wait={interval:.4f}s"
+            "wait_auto",
+            profile=config.profile.name,
+            factor=factor,
+            bias=bias,
+            wait=interval
         )
+    timer.mark("telemetry")
 
     try:
-        time.sleep(interval)
-        learning.update(True, interval, interval)
+        cancelled = cancellable_sleep(clock, interval, cancel)
+        timer.mark("sleep")
+        if not cancelled:
+            learning.update(True, interval, interval, context=context)
     except Exception:
-        learning.update(False, interval, interval)
+        learning.update(False, interval, interval, context=context)
         raise
 
     telemetry_session.stop()
+    timer.mark("learning_update")
+    if cancelled:
+        timer.finish(profile=config.profile.name, outcome="cancelled", polls=0, bias=bias, interval=interval)
+        return CANCELLED
+    timer.finish(profile=config.profile.name, outcome="ok", polls=0, bias=bias, interval=interval)
 
     if explain:
         return {
@@ -101,7 +114,8 @@ def wait_auto(
             "factor": factor,
             "cpu_score": cpu_score,
             "wifi_score": wifi_score,
-            "profile": nw.profile.name,
+            "net_score": context["net_score"],
+            "profile": config.profile.name,
             "bias": bias
         }
 
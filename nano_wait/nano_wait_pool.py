@@ -1,9 +1,33 @@
 # nano_wait_pool.py
 import asyncio
-from typing import List, Callable, Optional
+from dataclasses import dataclass
+from typing import Any, List, Callable, Optional
 from .nano_wait_async import wait_async
+from .hooks import HOOKS
+
+CANCEL_CHECK_INTERVAL = 0.1
+
+
+@dataclass
+class PoolResult:
+    """Resultado de um item do pool (retornado com with_status=True)."""
+    index: int
+    duration: float
+    status: str                     # "ok", "skipped", "cancelled" ou "error"
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class _PoolState:
+    """Estado compartilhado entre as tasks do pool e o vigia de cancel_if."""
+
+    def __init__(self, max_concurrency: Optional[int]):
+        self.fired = False
+        self.gate = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
 
 async def _async_wait_task(
+    index: int,
     duration: float,
     wifi: Optional[str],
     speed: str | float,
@@ -13,36 +37,60 @@ async def _async_wait_task(
     explain: bool,
     profile: Optional[str],
     callback: Optional[Callable],
-    cancel_if: Optional[Callable[[], bool]] = None
-):
+    state: _PoolState
+) -> PoolResult:
     """
     Task wrapper for async wait with conditional cancellation.
     """
+    started = False
     try:
-        # Cancela se a condição retornar True antes de iniciar
-        if cancel_if and cancel_if():
-            if verbose:
-                print(f"[NanoWait | {profile}] Skipped wait {duration}s due to cancel condition")
-            return None
-
-        # Executa wait_async normalmente
-        result = await wait_async(
-            t=duration,
-            wifi=wifi,
-            speed=speed,
-            smart=smart,
-            verbose=verbose,
-            log=log,
-            explain=explain,
-            profile=profile,
-            callback=callback
-        )
-        return result
+        if state.gate is not None:
+            await state.gate.acquire()
+        try:
+            # cancel_if já disparou enquanto a task aguardava sua vez
+            if state.fired:
+                if verbose:
+                    print(f"[NanoWait | {profile}] Skipped wait {duration}s due to cancel condition")
+                return PoolResult(index, duration, "skipped")
+
+            started = True
+            result = await wait_async(
+                t=duration,
+                wifi=wifi,
+                speed=speed,
+                smart=smart,
+                verbose=verbose,
+                explain=explain,
+                profile=profile
+            )
+        finally:
+            if state.gate is not None:
+                state.gate.release()
+        if callback:
+            callback(result)
+        return PoolResult(index, duration, "ok", result)
 
     except asyncio.CancelledError:
         if verbose:
             print(f"[NanoWait | {profile}] Wait {duration}s cancelled safely")
-        return None
+        return PoolResult(index, duration, "cancelled" if started else "skipped")
+    except Exception as e:
+        return PoolResult(index, duration, "error", error=e)
+
+
+async def _watch_cancel(cancel_if: Callable[[], bool], interval: float, state: _PoolState, tasks) -> None:
+    """Um único vigia reavalia cancel_if e cancela as tasks pendentes quando dispara."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            fired = cancel_if()
+        except Exception:
+            fired = False
+        if fired:
+            state.fired = True
+            for task in tasks:
+                task.cancel()
+            return
 
 
 async def wait_pool_async(
@@ -55,13 +103,29 @@ async def wait_pool_async(
     explain: bool = False,
     profile: Optional[str] = None,
     callback: Optional[Callable] = None,
-    cancel_if: Optional[Callable[[], bool]] = None
+    cancel_if: Optional[Callable[[], bool]] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    cancel_check_interval: float = CANCEL_CHECK_INTERVAL,
+    with_status: bool = False
 ):
     """
     Dispara múltiplos waits adaptativos em paralelo.
+
+    cancel_if é avaliado antes do início e depois a cada `cancel_check_interval`
+    segundos por um único vigia; ao disparar, as esperas pendentes são
+    canceladas e o resultado é parcial. `max_concurrency` limita quantas
+    esperas rodam ao mesmo tempo. Com `with_status`, retorna um PoolResult por
+    item (ok/skipped/cancelled/error) em vez do valor (None se não concluído).
     """
+    timer = HOOKS.timer("pool")
+    state = _PoolState(max_concurrency)
+    if cancel_if is not None and cancel_if():
+        state.fired = True
+
     tasks = [
-        _async_wait_task(
+        asyncio.ensure_future(_async_wait_task(
+            index=i,
             duration=d,
             wifi=wifi,
             speed=speed,
@@ -71,11 +135,28 @@ async def wait_pool_async(
             explain=explain,
             profile=profile,
             callback=callback,
-            cancel_if=cancel_if
-        )
-        for d in durations
+            state=state
+        ))
+        for i, d in enumerate(durations)
     ]
-    return await asyncio.gather(*tasks)
+    watcher = None
+    if cancel_if is not None and not state.fired:
+        watcher = asyncio.ensure_future(_watch_cancel(cancel_if, cancel_check_interval, state, tasks))
+    timer.mark("schedule")
+    try:
+        items = await asyncio.gather(*tasks)
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+    timer.mark("gather")
+    timer.finish(profile=profile, outcome="cancelled" if state.fired else "ok", size=len(durations))
+
+    if with_status:
+        return items
+    for item in items:
+        if item.error is not None:
+            raise item.error
+    return [item.result for item in items]
 
 
 def wait_pool(
@@ -88,7 +169,11 @@ def wait_pool(
     explain: bool = False,
     profile: Optional[str] = None,
     callback: Optional[Callable] = None,
-    cancel_if: Optional[Callable[[], bool]] = None
+    cancel_if: Optional[Callable[[], bool]] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    cancel_check_interval: float = CANCEL_CHECK_INTERVAL,
+    with_status: bool = False
 ):
     """
     Wrapper síncrono que dispara múltiplos waits adaptativos em paralelo usando asyncio.
@@ -103,5 +188,8 @@ def wait_pool(
         explain=explain,
         profile=profile,
         callback=callback,
-        cancel_if=cancel_if
+        cancel_if=cancel_if,
+        max_concurrency=max_concurrency,
+        cancel_check_interval=cancel_check_interval,
+        with_status=with_status
     ))
@@ -0,0 +1,126 @@
+"""
+NanoWait Network Probe
+----------------------
+Qualidade de rede (alcançabilidade + RTT) medida em background e mantida em
+cache por `ttl` segundos.
+
+Cada sonda abre uma conexão TCP com timeout próprio (socket.create_connection),
+sem alterar socket.setdefaulttimeout(). `read()` nunca bloqueia: retorna o
+último status conhecido e agenda nova medição quando expirado.
+
+Alvos configuráveis via NANO_WAIT_PROBE_TARGETS="host:port,host:port".
+"""
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+DEFAULT_TARGETS: Tuple[Tuple[str, int], ...] = (("8.8.8.8", 53), ("1.1.1.1", 53))
+DEFAULT_TTL = 30.0
+DEFAULT_TIMEOUT = 1.0
+
+# RTT <= 10ms vale 10; cada década acima perde 5 pontos (>= 1s vale 0)
+_BEST_RTT = 0.01
+
+
+def parse_targets(spec: str) -> Tuple[Tuple[str, int], ...]:
+    """Converte "host:port,host:port" em tuplas (host, porta)."""
+    targets = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.rpartition(":")
+        targets.append((host.strip("[]"), int(port)))
+    return tuple(targets)
+
+
+def rtt_score(rtt: float) -> float:
+    """Converte RTT (segundos) em score 0-10."""
+    if rtt <= _BEST_RTT:
+        return 10.0
+    return round(max(0.0, min(10.0, 10 - 5 * math.log10(rtt / _BEST_RTT))), 2)
+
+
+@dataclass(frozen=True)
+class NetworkStatus:
+    reachable: Optional[bool]        # None = ainda não medido
+    rtt: Optional[float] = None      # melhor RTT de conexão em segundos
+    checked_at: Optional[float] = None
+
+    @property
+    def score(self) -> Optional[float]:
+        """Score 0-10 baseado no RTT; None enquanto desconhecido."""
+        if self.reachable is None:
+            return None
+        if not self.reachable or self.rtt is None:
+            return 0.0
+        return rtt_score(self.rtt)
+
+
+UNKNOWN = NetworkStatus(reachable=None)
+
+
+class NetworkProbe:
+    """Sonda TCP assíncrona com cache de alcançabilidade e RTT."""
+
+    def __init__(
+        self,
+        targets: Optional[Sequence[Tuple[str, int]]] = None,
+        *,
+        ttl: float = DEFAULT_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        if targets is None:
+            env = os.environ.get("NANO_WAIT_PROBE_TARGETS")
+            targets = parse_targets(env) if env else DEFAULT_TARGETS
+        self.targets = tuple(targets)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._status = UNKNOWN
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def read(self) -> NetworkStatus:
+        """Status em cache; agenda atualização em background se expirado."""
+        status = self._status
+        if status.checked_at is None or time.monotonic() - status.checked_at >= self.ttl:
+            self._schedule()
+        return status
+
+    def refresh(self) -> NetworkStatus:
+        """Mede todos os alvos agora (bloqueante) e atualiza o cache."""
+        best = None
+        for host, port in self.targets:
+            rtt = self._connect(host, port)
+            if rtt is not None and (best is None or rtt < best):
+                best = rtt
+        status = NetworkStatus(reachable=best is not None, rtt=best, checked_at=time.monotonic())
+        self._status = status
+        return status
+
+    def _connect(self, host: str, port: int) -> Optional[float]:
+        import socket
+        start = time.perf_counter()
+        try:
+            with socket.create_connection((host, port), timeout=self.timeout):
+                return time.perf_counter() - start
+        except OSError:
+            return None
+
+    def _schedule(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._run, name="nano-wait-netprobe", daemon=True).start()
+
+    def _run(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
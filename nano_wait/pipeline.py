@@ -12,11 +12,12 @@ class Pipeline:
         self.steps.append(fn)
         return self
 
-    def run(self):
+    def run(self, cancel=None):
+        """Executa os passos em ordem; para na primeira falha ou cancelamento."""
         results = []
 
         for step in self.steps:
-            result = execute(step)
+            result = execute(step, cancel=cancel)
             results.append(result)
 
             if not result.success:
@@ -0,0 +1,299 @@
+"""
+NanoWait Context Providers
+--------------------------
+Registro de provedores de contexto que alimentam o fator de saúde do motor.
+
+Cada provedor retorna um score 0-10 (10 = saudável) e declara:
+- weight: peso na média ponderada (0 desativa o provedor);
+- cost: custo estimado de uma leitura, em segundos (informativo);
+- refresh_interval: por quanto tempo a última leitura é reutilizada;
+- requires: opção da chamada que ativa o provedor (ex: "ssid" para Wi-Fi);
+- neutral: valor usado quando inativo/indisponível (None = fica fora da média).
+
+Os pesos padrão reproduzem a fórmula clássica:
+    health = (pc_score + wifi_score) / 2,  pc_score = 0.6 * cpu + 0.4 * mem
+Disco e load average vêm registrados com peso 0 (ative com set_weight).
+Em containers, CPU e memória usam cgroup v2 + PSI (ver nano_wait.cgroup); em
+processos fixados a alguns núcleos, o uso desses núcleos (ver nano_wait.affinity).
+
+Exemplo:
+    registry = default_registry()
+    registry.register(ContextProvider("job_queue", lambda opts: 10 - queue_depth() / 10,
+                                      weight=0.5, cost=0.01, refresh_interval=2.0))
+"""
+
+import math
+import operator
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .network import NetworkProbe
+from .wifi import WifiSignalProvider
+
+Scores = Dict[str, Optional[float]]
+
+
+def _clamp(score: float) -> float:
+    return max(0.0, min(10.0, score))
+
+
+@dataclass
+class ContextProvider:
+    name: str
+    read: Callable[[Mapping[str, Any]], Optional[float]]
+    weight: float = 1.0
+    cost: float = 0.0
+    refresh_interval: float = 0.0
+    requires: Optional[str] = None
+    neutral: Optional[float] = None
+
+
+class ProviderRegistry:
+    """Provedores ordenados com pesos em array e cache por refresh_interval."""
+
+    def __init__(self, wifi: Optional[WifiSignalProvider] = None, network: Optional[NetworkProbe] = None):
+        self.wifi = wifi or WifiSignalProvider()
+        self.network = network or NetworkProbe()
+        self._providers: List[ContextProvider] = []
+        self._weights = array("d")
+        self._cache: Dict[Tuple[str, Any], Tuple[Optional[float], float]] = {}
+        self._lock = threading.Lock()
+
+    # --------------------------
+    # Registro
+    # --------------------------
+
+    def register(self, provider: ContextProvider) -> ContextProvider:
+        """Adiciona (ou substitui, pelo nome) um provedor."""
+        with self._lock:
+            providers = [p for p in self._providers if p.name != provider.name]
+            providers.append(provider)
+            self._set(providers)
+        return provider
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._set([p for p in self._providers if p.name != name])
+
+    def set_weight(self, name: str, weight: float) -> None:
+        with self._lock:
+            self.get(name).weight = weight
+            self._set(list(self._providers))
+
+    def get(self, name: str) -> ContextProvider:
+        for p in self._providers:
+            if p.name == name:
+                return p
+        raise KeyError(name)
+
+    def names(self) -> List[str]:
+        return [p.name for p in self._providers]
+
+    def _set(self, providers: List[ContextProvider]) -> None:
+        # Provedores caros primeiro: ficam agrupados e são os que mais se beneficiam do cache
+        providers.sort(key=lambda p: -p.cost)
+        self._providers = providers
+        self._weights = array("d", (p.weight for p in providers))
+        self._cache.clear()
+
+    # --------------------------
+    # Amostragem
+    # --------------------------
+
+    def _read(self, provider: ContextProvider, options: Mapping[str, Any], now: float) -> Optional[float]:
+        key = (provider.name, options.get(provider.requires) if provider.requires else None)
+        if provider.refresh_interval > 0:
+            cached = self._cache.get(key)
+            if cached is not None and now - cached[1] < provider.refresh_interval:
+                return cached[0]
+        try:
+            value = provider.read(options)
+        except Exception:
+            value = None
+        if provider.refresh_interval > 0:
+            self._cache[key] = (value, now)
+        return value
+
+    def score(self, name: str, options: Optional[Mapping[str, Any]] = None) -> Optional[float]:
+        """Leitura (com cache) de um único provedor."""
+        return self._read(self.get(name), options or {}, time.monotonic())
+
+    def evaluate(self, options: Optional[Mapping[str, Any]] = None) -> Tuple[Scores, float]:
+        """
+        Lê os provedores ativos (respeitando o cache) e combina tudo no fator
+        de saúde 0-10 com uma única média ponderada sobre arrays.
+        """
+        options = options or {}
+        providers = self._providers
+        weights = self._weights
+        now = time.monotonic()
+
+        scores: Scores = {}
+        values = array("d", bytes(8 * len(providers)))
+        used = array("d", bytes(8 * len(providers)))
+        for i, p in enumerate(providers):
+            w = weights[i]
+            active = p.requires is None or bool(options.get(p.requires))
+            value = self._read(p, options, now) if active and w > 0 else None
+            scores[p.name] = value
+            if value is None:
+                value = p.neutral
+            if value is not None and w > 0:
+                values[i] = value
+                used[i] = w
+
+        total = math.fsum(used)
+        if total <= 0:
+            return scores, 5.0
+        health = math.fsum(map(operator.mul, values, used)) / total
+        return scores, health
+
+
+# ------------------------------------------------------------------
+# Provedores embutidos
+# ------------------------------------------------------------------
+
+def _cpu_score(options) -> Optional[float]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return _clamp(10 - psutil.cpu_percent(interval=0.1) / 10)
+
+
+def _memory_score(options) -> Optional[float]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return _clamp(10 - psutil.virtual_memory().percent / 10)
+
+
+def _loadavg_score(options) -> Optional[float]:
+    """Load average de 1 min por CPU: 0 -> 10, 1 -> 5, >= 2 -> 0."""
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+    return _clamp(10 - 5 * load / (os.cpu_count() or 1))
+
+
+class DiskIOScore:
+    """Utilização de disco (tempo ocupado) por delta entre leituras sucessivas."""
+
+    def __init__(self, diskstats: str = "/proc/diskstats"):
+        self.diskstats = diskstats
+        self._last: Optional[Tuple[float, float]] = None
+
+    def _busy_ms(self) -> Optional[float]:
+        try:
+            import psutil
+            counters = psutil.disk_io_counters()
+            busy = getattr(counters, "busy_time", None) if counters else None
+            if busy is not None:
+                return float(busy)
+        except Exception:
+            pass
+        try:
+            busiest = 0.0
+            with open(self.diskstats) as f:
+                for line in f:
+                    fields = line.split()
+                    # campo 13 = ms gastos em I/O; o disco mais ocupado domina
+                    # (partições nunca passam do disco a que pertencem)
+                    if len(fields) >= 13 and not fields[2].startswith(("loop", "ram")):
+                        busiest = max(busiest, float(fields[12]))
+            return busiest
+        except (OSError, ValueError):
+            return None
+
+    def __call__(self, options) -> Optional[float]:
+        busy = self._busy_ms()
+        if busy is None:
+            return None
+        now = time.monotonic()
+        last, self._last = self._last, (busy, now)
+        if last is None or now <= last[1]:
+            return None
+        util = (busy - last[0]) / ((now - last[1]) * 1000)
+        return _clamp(10 - 10 * util)
+
+
+def register_builtin_providers(
+    registry: ProviderRegistry,
+    *,
+    cgroup_stats: Any = "auto",
+    cpu_scope: Optional[str] = None,
+) -> ProviderRegistry:
+    """
+    Registra os provedores padrão. CPU e memória seguem `cpu_scope`
+    (ou NANO_WAIT_CPU_SCOPE): "system" (psutil), "affinity" (núcleos
+    permitidos), "process" (núcleos permitidos + CPU/RSS do processo) ou
+    "auto": cgroup v2/PSI em containers, "affinity" quando o processo está
+    fixado em parte dos núcleos, senão "system".
+    """
+    wifi, network = registry.wifi, registry.network
+    set_cpu_scope(cpu_scope or os.environ.get("NANO_WAIT_CPU_SCOPE", "auto"), registry, cgroup_stats=cgroup_stats)
+    registry.register(ContextProvider(
+        "wifi", lambda opts: wifi.read(opts.get("ssid")),
+        weight=0.5, requires="ssid", neutral=5.0,
+    ))
+    registry.register(ContextProvider(
+        "network", lambda opts: network.read().score,
+        weight=0.5, requires="network",
+    ))
+    registry.register(ContextProvider("disk_io", DiskIOScore(), weight=0.0, cost=0.001, refresh_interval=1.0))
+    registry.register(ContextProvider("loadavg", _loadavg_score, weight=0.0, cost=0.0001, refresh_interval=1.0))
+    return registry
+
+
+def set_cpu_scope(scope: str, registry: Optional[ProviderRegistry] = None, *, cgroup_stats: Any = "auto") -> str:
+    """Troca a origem dos provedores "cpu" e "memory"; retorna o escopo efetivo."""
+    registry = registry if registry is not None else default_registry()
+
+    if scope == "auto":
+        if cgroup_stats == "auto":
+            from .cgroup import detect
+            cgroup_stats = detect()
+        if cgroup_stats is not None:
+            scope = "cgroup"
+        else:
+            from .affinity import allowed_cpus
+            scope = "affinity" if len(allowed_cpus()) < (os.cpu_count() or 1) else "system"
+
+    if scope == "cgroup":
+        if cgroup_stats in (None, "auto"):
+            from .cgroup import CgroupStats
+            cgroup_stats = CgroupStats()
+        cpu, memory, cost, refresh = cgroup_stats.cpu_score, cgroup_stats.memory_score, 0.0005, 0.25
+    elif scope in ("affinity", "process"):
+        from .affinity import AffinityCPU
+        scorer = AffinityCPU(include_process=scope == "process")
+        memory = scorer.memory_score if scope == "process" else _memory_score
+        cpu, cost, refresh = scorer.cpu_score, 0.0005, 0.25
+    elif scope == "system":
+        cpu, memory, cost, refresh = _cpu_score, _memory_score, 0.1, 1.0
+    else:
+        raise ValueError(f"Unknown cpu scope: {scope!r}")
+
+    registry.register(ContextProvider("cpu", cpu, weight=0.3, cost=cost, refresh_interval=refresh, neutral=5.0))
+    registry.register(ContextProvider("memory", memory, weight=0.2, cost=0.001, refresh_interval=refresh, neutral=5.0))
+    return scope
+
+
+_DEFAULT: Optional[ProviderRegistry] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_registry() -> ProviderRegistry:
+    """Registro compartilhado pelos motores do processo (caches incluídos)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        with _DEFAULT_LOCK:
+            if _DEFAULT is None:
+                _DEFAULT = register_builtin_providers(ProviderRegistry())
+    return _DEFAULT
@@ -0,0 +1,158 @@
+"""
+NanoWait Single-Flight
+----------------------
+Avaliação compartilhada de predicados entre esperas concorrentes.
+
+Quando várias threads esperam pela mesma condição (ex.: a mesma URL de
+health), cada poll dispara uma requisição. Com uma `share_key`, a primeira
+thread avalia o predicado e as demais que chegarem durante a avaliação
+recebem o mesmo resultado (ou a mesma exceção). Com `ttl > 0`, o resultado
+ainda é reutilizado por esse intervalo: a carga no sistema verificado fica
+limitada a uma avaliação por TTL, independentemente do número de esperas.
+
+O TTL é medido no relógio injetável (MonotonicClock por padrão, ou o da
+espera), então um VirtualClock controla a expiração nos testes. Tasks
+asyncio (do_async) aguardam um future em vez de bloquear uma thread do
+executor em Event.wait().
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .clock import MonotonicClock
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "expires", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.expires = 0.0
+        self.waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def value(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class SingleFlight:
+    """Deduplica chamadas concorrentes por chave."""
+
+    def __init__(self, clock=None):
+        self.clock = clock if clock is not None else MonotonicClock()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def _join(self, key: Hashable, clock) -> Tuple[_Call, bool]:
+        """Chamada em curso (ou em cache) da chave e se quem chegou é o líder."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.event.is_set() and call.expires <= clock.now():
+                call = None
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        return call, leader
+
+    def _lead(self, key: Hashable, call: _Call, fn: Callable[[], Any], ttl: float, clock) -> None:
+        """Avalia `fn` como líder e acorda os seguidores (threads e tasks)."""
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                if call.error is None and ttl > 0:
+                    call.expires = clock.now() + ttl
+                elif self._calls.get(key) is call:
+                    del self._calls[key]
+                call.event.set()
+                waiters, call.waiters = call.waiters, []
+            for loop, future in waiters:
+                try:
+                    loop.call_soon_threadsafe(_wake, future)
+                except RuntimeError:
+                    pass  # loop já encerrado
+
+    def do(self, key: Hashable, fn: Callable[[], Any], ttl: float = 0.0, clock=None) -> Any:
+        """
+        Executa `fn` uma vez por chave entre chamadores simultâneos; resultados
+        bem-sucedidos são reutilizados por `ttl` segundos (no relógio `clock`,
+        ou no do grupo). Exceções são repassadas a quem esperava, mas nunca
+        ficam em cache.
+        """
+        clock = clock if clock is not None else self.clock
+        call, leader = self._join(key, clock)
+        if leader:
+            self._lead(key, call, fn, ttl, clock)
+        else:
+            call.event.wait()
+        return call.value()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any], ttl: float = 0.0, clock=None) -> Any:
+        """
+        Versão asyncio de do(): o líder avalia `fn` no executor padrão e os
+        seguidores aguardam um future, sem ocupar threads do executor.
+        """
+        clock = clock if clock is not None else self.clock
+        call, leader = self._join(key, clock)
+        loop = asyncio.get_running_loop()
+        if leader:
+            # shield: se a task líder for cancelada, a avaliação ainda termina
+            # e acorda os seguidores
+            await asyncio.shield(loop.run_in_executor(None, self._lead, key, call, fn, ttl, clock))
+            return call.value()
+        with self._lock:
+            if not call.event.is_set():
+                future = loop.create_future()
+                call.waiters.append((loop, future))
+            else:
+                future = None
+        if future is not None:
+            await future
+        return call.value()
+
+    def forget(self, key: Hashable) -> None:
+        """Descarta o resultado em cache da chave (avaliações em curso seguem)."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.event.is_set():
+                del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+_GROUP: Optional[SingleFlight] = None
+_GROUP_LOCK = threading.Lock()
+
+
+def get_group() -> SingleFlight:
+    """Grupo de single-flight compartilhado pelo processo."""
+    global _GROUP
+    if _GROUP is None:
+        with _GROUP_LOCK:
+            if _GROUP is None:
+                _GROUP = SingleFlight()
+    return _GROUP
+
+
+def shared(predicate: Callable[[], Any], key: Hashable, ttl: float = 0.0, clock=None) -> Callable[[], Any]:
+    """Envolve `predicate` para que esperas com a mesma chave compartilhem a avaliação."""
+    group = get_group()
+    return lambda: group.do(key, predicate, ttl, clock)
+
+
+def shared_async(predicate: Callable[[], Any], key: Hashable, ttl: float = 0.0, clock=None):
+    """Como shared(), mas devolve uma função assíncrona (para wait_async)."""
+    group = get_group()
+    return lambda: group.do_async(key, predicate, ttl, clock)
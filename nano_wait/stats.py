@@ -0,0 +1,140 @@
+"""
+NanoWait Streaming Statistics
+-----------------------------
+Histograma logarítmico de memória constante para durações em segundos.
+
+Os buckets cobrem de 1µs a 10.000s com 10 divisões por década (erro relativo
+de ~12% nos quantis), mais buckets de underflow e overflow. Adicionar um valor
+custa um log10 e um incremento em array; memória é fixa independentemente do
+número de amostras.
+"""
+
+import math
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+MIN_VALUE = 1e-6
+DECADES = 10
+PER_DECADE = 10
+_NBUCKETS = DECADES * PER_DECADE + 2  # + underflow + overflow
+_LOG_MIN = math.log10(MIN_VALUE)
+
+
+def _bucket_index(value: float) -> int:
+    if value < MIN_VALUE:
+        return 0
+    idx = int((math.log10(value) - _LOG_MIN) * PER_DECADE) + 1
+    return idx if idx < _NBUCKETS - 1 else _NBUCKETS - 1
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Limite superior (inclusivo aproximado) do bucket."""
+    if index >= _NBUCKETS - 1:
+        return math.inf
+    return 10 ** (_LOG_MIN + index / PER_DECADE)
+
+
+class LogHistogram:
+    """Histograma streaming com buckets logarítmicos fixos."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * _NBUCKETS))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.counts[_bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def scale(self, factor: float) -> "LogHistogram":
+        """Multiplica as contagens (esquecimento exponencial); min/max são mantidos."""
+        before = self.count
+        for i, c in enumerate(self.counts):
+            if c:
+                self.counts[i] = int(c * factor)
+        self.count = sum(self.counts)
+        self.total = self.total * self.count / before if before else 0.0
+        if not self.count:
+            self.min, self.max = math.inf, -math.inf
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Quantil aproximado (média geométrica do bucket, limitado a [min, max])."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if c and seen > rank:
+                if i == 0:
+                    return self.min
+                lower = 10 ** (_LOG_MIN + (i - 1) / PER_DECADE)
+                value = math.sqrt(lower * bucket_upper_bound(i)) if i < _NBUCKETS - 1 else self.max
+                return max(self.min, min(self.max, value))
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """Itera (limite superior, contagem) para buckets não vazios."""
+        for i, c in enumerate(self.counts):
+            if c:
+                yield bucket_upper_bound(i), c
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    # --------------------------
+    # Serialização (esparsa)
+    # --------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogHistogram":
+        hist = cls()
+        for i, c in data.get("buckets", {}).items():
+            idx = int(i)
+            if 0 <= idx < _NBUCKETS:
+                hist.counts[idx] = int(c)
+        hist.count = int(data.get("count", 0))
+        hist.total = float(data.get("total", 0.0))
+        if hist.count:
+            hist.min = float(data["min"])
+            hist.max = float(data["max"])
+        return hist
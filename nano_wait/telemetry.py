@@ -1,13 +1,19 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from array import array
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
 import queue as std_queue
+import threading
 from time import time
 
+from .stats import LogHistogram
 from .usage import log_usage_event
 
 __version__ = "5.3.0"
 
+# Capacidade padrão do ring buffer usado pelos motores
+DEFAULT_CAPACITY = 1024
+
 
 @dataclass(frozen=True)
 class TelemetryEvent:
@@ -16,6 +22,91 @@ class TelemetryEvent:
     interval: float
 
 
+class RingBuffer:
+    """
+    Buffer circular numérico de tamanho fixo (timestamp, fator, intervalo).
+    Armazena floats em arrays: memória constante e sem objetos por evento.
+    """
+
+    __slots__ = ("capacity", "timestamps", "factors", "intervals", "_head", "_size")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.factors = array("d", bytes(8 * capacity))
+        self.intervals = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._size = 0
+
+    def append(self, timestamp: float, factor: float, interval: float) -> None:
+        i = self._head
+        self.timestamps[i] = timestamp
+        self.factors[i] = factor
+        self.intervals[i] = interval
+        self._head = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[float, float, float]]:
+        """Itera em ordem cronológica (mais antigo primeiro)."""
+        start = (self._head - self._size) % self.capacity
+        for k in range(self._size):
+            i = (start + k) % self.capacity
+            yield self.timestamps[i], self.factors[i], self.intervals[i]
+
+
+class _SessionAggregate:
+    """Histogramas acumulados de todas as sessões encerradas do processo."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sessions = 0
+        self.intervals = LogHistogram()
+        self.durations = LogHistogram()
+
+    def add(self, intervals: LogHistogram, duration: Optional[float]) -> None:
+        with self._lock:
+            self.sessions += 1
+            self.intervals.merge(intervals)
+            if duration is not None:
+                self.durations.add(duration)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": self.sessions,
+                "intervals": _quantiles(self.intervals),
+                "durations": _quantiles(self.durations),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.sessions = 0
+            self.intervals = LogHistogram()
+            self.durations = LogHistogram()
+
+
+def _quantiles(hist: LogHistogram) -> dict:
+    return {
+        "p50": hist.quantile(0.50),
+        "p95": hist.quantile(0.95),
+        "p99": hist.quantile(0.99),
+    }
+
+
+AGGREGATE = _SessionAggregate()
+
+
+def aggregate_summary() -> dict:
+    """Quantis de intervalo e duração de todas as sessões encerradas."""
+    return AGGREGATE.summary()
+
+
 @dataclass
 class TelemetrySession:
     enabled: bool = False
@@ -29,6 +120,18 @@ class TelemetrySession:
     events: List[TelemetryEvent] = field(default_factory=list)
     queue: Optional[std_queue.Queue] = None
 
+    # None mantém a lista de eventos (modo legado); um inteiro ativa o
+    # ring buffer numérico de memória limitada.
+    capacity: Optional[int] = None
+
+    def __post_init__(self):
+        self.ring: Optional[RingBuffer] = (
+            RingBuffer(self.capacity) if self.enabled and self.capacity else None
+        )
+        # Histograma só é alocado para sessões ativas (hot path sem telemetria)
+        self.intervals: Optional[LogHistogram] = LogHistogram() if self.enabled else None
+        self.count = 0
+
     def start(self):
         if not self.enabled:
             return
@@ -36,9 +139,10 @@ class TelemetrySession:
         log_usage_event("session_start", __version__)
 
     def stop(self):
-        if not self.enabled:
+        if not self.enabled or self.end_time is not None:
             return
         self.end_time = time()
+        AGGREGATE.add(self.intervals, self._total_time())
         if self.queue:
             self.queue.put("__STOP__")
 
@@ -46,35 +150,42 @@ class TelemetrySession:
         if not self.enabled:
             return
 
-        event = TelemetryEvent(
-            timestamp=datetime.utcnow().isoformat(),
-            factor=round(factor, 4),
-            interval=round(interval, 4),
-        )
+        self.count += 1
+        self.intervals.add(interval)
 
-        self.events.append(event)
+        if self.ring is not None:
+            self.ring.append(time(), factor, interval)
+        else:
+            self.events.append(TelemetryEvent(
+                timestamp=datetime.utcnow().isoformat(),
+                factor=round(factor, 4),
+                interval=round(interval, 4),
+            ))
 
         if self.queue:
             self.queue.put({
-                "factor": event.factor,
-                "interval": event.interval,
-                "count": len(self.events)
+                "factor": round(factor, 4),
+                "interval": round(interval, 4),
+                "count": self.count
             })
 
-    def summary(self) -> dict:
-        if not self.enabled:
-            return {}
-
-        total_time = (
+    def _total_time(self) -> Optional[float]:
+        return (
             round(self.end_time - self.start_time, 4)
             if self.start_time and self.end_time
             else None
         )
 
+    def summary(self) -> dict:
+        if not self.enabled:
+            return {}
+
         return {
             "profile": self.profile,
             "cpu_score": self.cpu_score,
             "wifi_score": self.wifi_score,
-            "adjustments": len(self.events),
-            "total_time": total_time,
+            "adjustments": self.count,
+            "total_time": self._total_time(),
+            "intervals": _quantiles(self.intervals),
+            "all_sessions": AGGREGATE.summary(),
         }
@@ -1,6 +1,157 @@
 # nano_wait/usage.py
+"""
+Pipeline único de eventos de uso anônimos.
+
+- O ID anônimo é lido (ou criado) uma única vez e mantido em memória.
+- Eventos ficam em um buffer e são gravados em lote por uma thread de fundo
+  (a cada `flush_interval`, quando o buffer enche e na saída do processo).
+- NANO_WAIT_TELEMETRY=0 desativa tudo; a verificação é um booleano lido no import.
+
+Registrar um evento nunca faz I/O de arquivo nem escreve no stdout.
+O WRITER global resolve USAGE_FILE/ID_FILE no momento da gravação, então
+testes (ou aplicações) podem redirecioná-los sem recriar o writer.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
 from datetime import datetime
+from typing import List, Optional, Tuple
+
+USAGE_FILE = os.path.expanduser("~/.nano_wait_usage.jsonl")
+ID_FILE = os.path.expanduser("~/.nano_wait_uid")
+
+_ENABLED = os.getenv("NANO_WAIT_TELEMETRY", "1") != "0"
+
+
+def telemetry_enabled() -> bool:
+    """
+    Telemetry is ON by default.
+    Disable with: export NANO_WAIT_TELEMETRY=0
+    """
+    return _ENABLED
+
+
+class UsageWriter:
+    """Buffer de eventos com gravação em lote em background."""
+
+    def __init__(
+        self,
+        usage_file: Optional[str] = None,
+        id_file: Optional[str] = None,
+        *,
+        flush_interval: float = 30.0,
+        max_buffer: int = 256,
+    ):
+        self._usage_file = usage_file
+        self._id_file = id_file
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: List[Tuple[str, Optional[str], float]] = []
+        self._anon_id: Optional[str] = None
+        self._lock = threading.Lock()          # serializa gravações
+        self._buffer_lock = threading.Lock()   # protege apenas a troca do buffer
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def usage_file(self) -> str:
+        return self._usage_file or USAGE_FILE
+
+    @property
+    def id_file(self) -> str:
+        return self._id_file or ID_FILE
+
+    def anon_id(self) -> str:
+        """Identificador anônimo persistente, lido do disco uma única vez."""
+        if self._anon_id is None:
+            self._anon_id = _read_or_create_id(self.id_file)
+        return self._anon_id
+
+    def record(self, event: str, version: Optional[str] = None) -> None:
+        with self._buffer_lock:
+            self._buffer.append((event, version, time.time()))
+        if self._thread is None:
+            self._start()
+        if len(self._buffer) >= self.max_buffer:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Grava os eventos pendentes; retorna quantos foram gravados."""
+        with self._lock:
+            with self._buffer_lock:
+                pending, self._buffer = self._buffer, []
+            if not pending:
+                return 0
+            anon_id = self.anon_id()
+            lines = [
+                json.dumps({
+                    "anon_id": anon_id,
+                    "event": event,
+                    "version": version,
+                    "ts": datetime.utcfromtimestamp(ts).isoformat(),
+                })
+                for event, version, ts in pending
+            ]
+            try:
+                with open(self.usage_file, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+            except Exception:
+                # telemetry must NEVER break user code
+                pass
+            return len(pending)
+
+    def _start(self) -> None:
+        with self._buffer_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="nano-wait-usage", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+def _read_or_create_id(path: str) -> str:
+    if os.path.exists(path):
+        try:
+            with open(path) as f:
+                uid = f.read().strip()
+            if uid:
+                return uid
+        except Exception:
+            pass
+
+    import uuid
+    uid = str(uuid.uuid4())
+    try:
+        with open(path, "w") as f:
+            f.write(uid)
+    except Exception:
+        pass
+    return uid
+
+
+WRITER = UsageWriter()
+
+
+def get_anon_id() -> str:
+    """
+    Persistent, anonymous, local-only user identifier.
+    """
+    return WRITER.anon_id()
+
 
-def log_usage_event(event: str, metadata: dict | None = None):
-    timestamp = datetime.utcnow().isoformat()
-    print(f"[NanoWait][USAGE] {timestamp} | {event} | {metadata}")
+def log_usage_event(event: str, version: Optional[str] = None):
+    """
+    Log a minimal anonymous usage event (buffered; written in batches).
+    """
+    if not _ENABLED:
+        return
+    WRITER.record(event, version)
@@ -0,0 +1,175 @@
+"""
+NanoWait Wi-Fi Provider
+-----------------------
+Leitura do sinal Wi-Fi (0-10) sem bloquear quem espera.
+
+As medições (nmcli, airport, varredura pywifi) rodam em uma thread de fundo
+e ficam em cache por `ttl` segundos. `read()` sempre retorna imediatamente:
+o valor em cache, mesmo que expirado (disparando uma nova medição), ou o
+valor neutro 5.0 enquanto a primeira medição não termina.
+
+No Linux, /proc/net/wireless é lido diretamente antes de recorrer ao nmcli.
+"""
+
+import platform
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+NEUTRAL_SCORE = 5.0
+DEFAULT_TTL = 10.0
+PROC_WIRELESS = "/proc/net/wireless"
+AIRPORT = "/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport"
+
+
+def _clamp(score: float) -> float:
+    return max(0, min(10, score))
+
+
+def read_proc_wireless(path: str = PROC_WIRELESS) -> Optional[float]:
+    """
+    Score do melhor link em /proc/net/wireless (None se não houver interface).
+    Usa o nível em dBm quando disponível; senão a qualidade do link (0-70).
+    """
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()[2:]
+    except OSError:
+        return None
+
+    best = None
+    for line in lines:
+        if ":" not in line:
+            continue
+        fields = line.split(":", 1)[1].split()
+        if len(fields) < 3:
+            continue
+        try:
+            link = float(fields[1].rstrip("."))
+            level = float(fields[2].rstrip("."))
+        except ValueError:
+            continue
+        if level < 0:
+            score = _clamp((level + 100) / 10)
+        else:
+            score = _clamp(link / 70 * 10)
+        best = score if best is None else max(best, score)
+    return best
+
+
+class WifiSignalProvider:
+    """Cache com TTL e atualização em background do sinal Wi-Fi por SSID."""
+
+    def __init__(
+        self,
+        system: Optional[str] = None,
+        *,
+        ttl: float = DEFAULT_TTL,
+        probe: Optional[Callable[[Optional[str]], float]] = None,
+        proc_path: str = PROC_WIRELESS,
+    ):
+        self.system = (system or platform.system()).lower()
+        self.ttl = ttl
+        self.proc_path = proc_path
+        self._probe = probe or self.probe
+        self._cache: Dict[Optional[str], Tuple[float, float]] = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._jobs: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._wifi_interface = None
+        self._initialized_wifi = False
+
+    # --------------------------
+    # Leitura não bloqueante
+    # --------------------------
+
+    def read(self, ssid: Optional[str] = None) -> float:
+        """Retorna o score em cache e agenda atualização se expirado."""
+        cached = self._cache.get(ssid)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self.ttl:
+            return cached[0]
+        self._schedule(ssid)
+        return cached[0] if cached is not None else NEUTRAL_SCORE
+
+    def refresh(self, ssid: Optional[str] = None) -> float:
+        """Mede agora (bloqueante) e atualiza o cache."""
+        try:
+            score = self._probe(ssid)
+        except Exception:
+            score = NEUTRAL_SCORE
+        self._cache[ssid] = (score, time.monotonic())
+        return score
+
+    def _schedule(self, ssid: Optional[str]) -> None:
+        with self._lock:
+            if ssid in self._pending:
+                return
+            self._pending.add(ssid)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="nano-wait-wifi", daemon=True)
+                self._worker.start()
+        self._jobs.put(ssid)
+
+    def _run(self) -> None:
+        while True:
+            ssid = self._jobs.get()
+            try:
+                self.refresh(ssid)
+            finally:
+                with self._lock:
+                    self._pending.discard(ssid)
+
+    # --------------------------
+    # Medição por plataforma (roda na thread de fundo)
+    # --------------------------
+
+    def _init_wifi(self):
+        """Lazy initialization para evitar overhead se não for usado."""
+        if self._initialized_wifi:
+            return
+        if self.system == "windows":
+            try:
+                import pywifi
+                wifi = pywifi.PyWiFi()
+                self._wifi_interface = wifi.interfaces()[0]
+            except Exception:
+                self._wifi_interface = None
+        self._initialized_wifi = True
+
+    def probe(self, ssid: Optional[str] = None) -> float:
+        """Medição bloqueante do sinal (0-10); 5.0 se indisponível."""
+        try:
+            import subprocess
+            if self.system == "windows":
+                self._init_wifi()
+                if self._wifi_interface:
+                    self._wifi_interface.scan()
+                    time.sleep(0.5)
+                    for net in self._wifi_interface.scan_results():
+                        if ssid is None or net.ssid == ssid:
+                            return _clamp((net.signal + 100) / 10)
+
+            elif self.system == "darwin":
+                out = subprocess.check_output([AIRPORT, "-I"], text=True)
+                for line in out.splitlines():
+                    if "agrCtlRSSI" in line:
+                        rssi = int(line.split(":")[1].strip())
+                        return _clamp((rssi + 100) / 10)
+
+            elif self.system == "linux":
+                score = read_proc_wireless(self.proc_path)
+                if score is not None:
+                    return score
+                out = subprocess.check_output(["nmcli", "-t", "-f", "ACTIVE,SSID,SIGNAL", "dev", "wifi"], text=True)
+                for line in out.splitlines():
+                    parts = line.split(":")
+                    if len(parts) >= 3:
+                        active, name, sig = parts[0], parts[1], parts[2]
+                        if active == "yes" or (ssid and name == ssid):
+                            return _clamp(int(sig) / 10)
+        except Exception:
+            pass
+        return NEUTRAL_SCORE
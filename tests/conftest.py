@@ -0,0 +1,20 @@
+import pytest
+
+from nano_wait import usage
+from nano_wait.learning import SEED_ENV, AdaptiveLearning
+
+
+@pytest.fixture(autouse=True)
+def isolated_learning(tmp_path, monkeypatch):
+    """Nenhum teste lê ou grava o ~/.nano_wait_learning.json do desenvolvedor."""
+    monkeypatch.setattr(AdaptiveLearning, "_storage_path", tmp_path / "learning.json")
+    monkeypatch.delenv(SEED_ENV, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def isolated_usage(tmp_path, monkeypatch):
+    """Eventos de uso vão para tmp_path, nunca para ~/.nano_wait_usage.jsonl."""
+    monkeypatch.setattr(usage, "USAGE_FILE", str(tmp_path / "usage.jsonl"))
+    monkeypatch.setattr(usage, "ID_FILE", str(tmp_path / "uid"))
+    yield
+    usage.WRITER.flush()   # drena o buffer enquanto o caminho ainda é o temporário
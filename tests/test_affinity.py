@@ -0,0 +1,72 @@
+import pytest
+
+from nano_wait.affinity import AffinityCPU, read_cpu_times
+from nano_wait.providers import ProviderRegistry, register_builtin_providers, set_cpu_scope
+
+STAT = (
+    "cpu  {a} 0 0 {b} 0 0 0 0 0 0\n"
+    "cpu0 {busy0} 0 0 {idle0} 0 0 0 0 0 0\n"
+    "cpu1 {busy1} 0 0 {idle1} 0 0 0 0 0 0\n"
+    "intr 0\n"
+)
+
+
+def _write(path, busy0, idle0, busy1, idle1):
+    path.write_text(STAT.format(a=busy0 + busy1, b=idle0 + idle1, busy0=busy0, idle0=idle0, busy1=busy1, idle1=idle1))
+
+
+def test_read_cpu_times_per_core(tmp_path):
+    stat = tmp_path / "stat"
+    _write(stat, 30, 70, 5, 95)
+    assert read_cpu_times(str(stat)) == {0: (30.0, 100.0), 1: (5.0, 100.0)}
+
+
+def test_only_allowed_cores_count(tmp_path):
+    stat = tmp_path / "stat"
+    _write(stat, 0, 0, 0, 0)
+    pinned = AffinityCPU(frozenset({1}), stat_path=str(stat))
+    everything = AffinityCPU(frozenset({0, 1}), stat_path=str(stat))
+
+    # núcleo 0 (não permitido) saturado, núcleo 1 (o nosso) ocioso
+    _write(stat, 100, 0, 0, 100)
+    assert pinned.cpu_score() == 10.0
+    assert everything.cpu_score() == 5.0
+
+    # agora o nosso núcleo satura
+    _write(stat, 100, 100, 100, 100)
+    assert pinned.cpu_score() == 0.0
+
+
+def test_no_elapsed_ticks_is_unknown(tmp_path):
+    stat = tmp_path / "stat"
+    _write(stat, 10, 10, 10, 10)
+    scorer = AffinityCPU(frozenset({0}), stat_path=str(stat))
+    assert scorer.cpu_score() is None
+
+
+def test_process_scope_includes_own_usage():
+    scorer = AffinityCPU(include_process=True)
+    score = scorer.cpu_score()
+    assert score is None or 0.0 <= score <= 10.0
+    assert 0.0 <= scorer.memory_score() <= 10.0
+
+
+def test_scope_selection():
+    registry = register_builtin_providers(ProviderRegistry(), cgroup_stats=None, cpu_scope="affinity")
+    assert registry.get("cpu").cost < 0.01  # sem sleep de amostragem
+    assert set_cpu_scope("system", registry) == "system"
+    with pytest.raises(ValueError):
+        set_cpu_scope("quantum", registry)
+
+
+def test_process_memory_never_hides_system_pressure(tmp_path):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       1000000 kB\nMemFree:          10000 kB\nMemAvailable:     50000 kB\n")
+    scorer = AffinityCPU(include_process=True, meminfo_path=str(meminfo))
+    try:
+        import psutil  # noqa: F401
+    except ImportError:
+        # 95% da memória do sistema em uso: score baixo mesmo com RSS pequeno
+        assert scorer.memory_score() == 0.5
+    else:
+        assert scorer.memory_score() <= 10 * (1 - psutil.virtual_memory().percent / 100) + 0.01
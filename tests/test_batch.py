@@ -0,0 +1,72 @@
+import json
+import socket
+
+from nano_wait.batch import run_batch, run_job
+from nano_wait.cli import main
+
+
+def test_time_wait_job():
+    record = run_job({"id": "nap", "wait": 0.01})
+    assert record["ok"] is True and record["type"] == "wait"
+    assert 0.0 < record["result"] <= 0.01
+
+
+def test_readiness_jobs(tmp_path):
+    marker = tmp_path / "ready"
+    marker.write_text("")
+    assert run_job({"path": str(marker), "timeout": 1})["ok"] is True
+    assert run_job({"path": str(tmp_path / "missing"), "timeout": 0.1})["ok"] is False
+
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        assert run_job({"port": port, "host": "127.0.0.1", "timeout": 1})["ok"] is True
+
+
+def test_exec_job_and_errors():
+    record = run_job({"exec": "lambda: 1+1", "timeout": 1})
+    assert record["ok"] is True and record["result"] == 2
+
+    assert "ValueError" in run_job({"exec": "print('x')"})["error"]
+    assert run_job({"nothing": 1})["ok"] is False
+
+
+def test_run_batch_streams_every_job():
+    lines = [
+        '{"id": "a", "wait": 0.01}',
+        "",
+        "not json",
+        '{"id": "b", "exec": "lambda: True"}',
+    ]
+    records = []
+    counts = run_batch(lines, records.append, concurrency=2)
+    assert counts == {"ok": 2, "failed": 1}
+    assert {r["id"] for r in records} == {"a", "b", 3}
+
+
+def test_cli_batch_file(tmp_path, capsys):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text('{"id": "x", "wait": 0.01}\n{"id": "y", "exec": "lambda: 42"}\n')
+    main(["batch", str(jobs), "--concurrency", "2"])
+    out = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert {r["id"]: r["ok"] for r in out} == {"x": True, "y": True}
+
+
+def test_run_batch_reads_input_only_as_workers_free_up():
+    read, completed, pending = [], [], []
+
+    def jobs():
+        for i in range(12):
+            read.append(i)
+            yield '{"wait": 0.01}'
+
+    def emit(record):
+        # jobs já lidos e ainda não concluídos (incluindo este)
+        pending.append(len(read) - len(completed))
+        completed.append(record)
+
+    counts = run_batch(jobs(), emit, concurrency=2)
+    assert counts == {"ok": 12, "failed": 0}
+    # no máximo `concurrency` em execução + a linha lida aguardando um slot
+    assert max(pending) <= 3
@@ -0,0 +1,47 @@
+import json
+
+from nano_wait.learning import MIN_BUCKET_SAMPLES, AdaptiveLearning, BiasTable
+
+IDLE = {"pc_score": 9.0, "net_score": None}
+BUSY = {"pc_score": 1.0, "net_score": None}
+
+
+def test_buckets_learn_independently():
+    learning = AdaptiveLearning("default")
+    for _ in range(40):
+        learning.update(False, 1.0, 1.0, context=BUSY)
+        learning.update(True, 1.0, 0.6, context=IDLE)
+
+    # o viés global mistura os dois regimes; a tabela separa
+    busy, idle = learning.get_bias(BUSY), learning.get_bias(IDLE)
+    assert busy > 1.5 and idle < 0.8
+
+
+def test_sparse_buckets_fall_back_to_global_bias():
+    learning = AdaptiveLearning("default")
+    for _ in range(MIN_BUCKET_SAMPLES - 1):
+        learning.update(True, 1.0, 2.0, context=BUSY)
+    assert learning.get_bias(BUSY) == learning.get_bias()
+
+
+def test_lookup_interpolates_between_band_centres():
+    table = BiasTable()
+    for pc, bias in ((5.0, 1.0), (7.0, 2.0)):
+        idx = table._index(pc, None)
+        table.bias[idx] = bias
+        table.samples[idx] = MIN_BUCKET_SAMPLES
+    assert table.lookup(5.0, None, fallback=1.0) == 1.0
+    assert table.lookup(6.0, None, fallback=1.0) == 1.5
+    assert table.lookup(7.0, None, fallback=1.0) == 2.0
+
+
+def test_table_round_trips_through_storage():
+    learning = AdaptiveLearning("rpa")
+    for _ in range(5):
+        learning.update(True, 1.0, 1.4, context={"pc_score": 3.0, "net_score": 8.0})
+
+    stored = json.loads(AdaptiveLearning._storage_path.read_text())["profiles"]["rpa"]["table"]
+    assert sum(stored["samples"]) == 5
+    reloaded = AdaptiveLearning("rpa")
+    ctx = {"pc_score": 3.0, "net_score": 8.0}
+    assert reloaded.get_bias(ctx) == learning.get_bias(ctx)
@@ -0,0 +1,83 @@
+import json
+import time
+
+import pytest
+
+from nano_wait import cli, core
+from nano_wait.calibration import calibrate, measure_sampling_cost, tune_profiles, write_profiles
+from nano_wait.core import BUILTIN_PROFILES, PROFILES, NanoWait, load_profiles, register_profile, resolve_profile
+from nano_wait.providers import ContextProvider, ProviderRegistry
+
+MEASURED = {
+    "sleep_overshoot": {"p50": 0.0001, "p95": 0.0002},
+    "scheduler_latency": {"p50": 0.00001, "p95": 0.00002},
+    "sampling_cost": {"p50": 0.00002, "p95": 0.00005, "max": 0.0001, "mean": 0.00003},
+    "predicate_throughput": 15e6,
+}
+
+
+@pytest.fixture(autouse=True)
+def restore_profiles():
+    saved = dict(PROFILES)
+    yield
+    PROFILES.clear()
+    PROFILES.update(saved)
+
+
+def test_quiet_machine_keeps_builtin_profiles():
+    assert tune_profiles(MEASURED) == BUILTIN_PROFILES
+
+
+def test_poll_interval_respects_measured_floor():
+    jittery = dict(MEASURED, sleep_overshoot={"p50": 0.01, "p95": 0.04})
+    tuned = tune_profiles(jittery)
+    assert all(p.poll_interval >= 0.2 for p in tuned.values())
+    assert all(tuned[n].aggressiveness == p.aggressiveness for n, p in BUILTIN_PROFILES.items())
+
+
+def test_sampling_cost_includes_blocking_cache_refresh():
+    def slow_read(opts):
+        time.sleep(0.05)
+        return 5.0
+
+    registry = ProviderRegistry()
+    registry.register(ContextProvider("slow", slow_read, refresh_interval=0.2))
+    cost = measure_sampling_cost(NanoWait(providers=registry), samples=5)
+
+    assert cost["max"] >= 0.05                 # ao menos uma renovação medida
+    assert cost["p50"] < 0.01                  # polls comuns usam o cache
+    assert cost["mean"] > 0.05 / 10            # a renovação entra na média por poll
+
+    tuned = tune_profiles(dict(MEASURED, sampling_cost=cost))
+    assert tuned["ci"].poll_interval > BUILTIN_PROFILES["ci"].poll_interval
+
+
+def test_profile_file_round_trip(tmp_path):
+    path = tmp_path / "profiles.json"
+    write_profiles(tune_profiles(MEASURED), MEASURED, str(path))
+    assert json.loads(path.read_text())["measurements"] == MEASURED
+
+    assert load_profiles(str(path)) == len(BUILTIN_PROFILES)
+    assert PROFILES["ci"] == BUILTIN_PROFILES["ci"]
+    assert load_profiles(str(tmp_path / "missing.json")) == 0
+
+
+def test_register_profile_and_cli_choices(capsys):
+    register_profile("nightly", aggressiveness=3.0, poll_interval=0.5)
+    assert resolve_profile("nightly").aggressiveness == 3.0
+    assert core.get_engine().apply_profile(1.0, "nightly") == 3.0
+
+    with pytest.raises(SystemExit):
+        cli.main(["--help"])
+    assert "nightly" in capsys.readouterr().out
+
+
+def test_calibrate_quick_writes_file(tmp_path):
+    path = tmp_path / "profiles.json"
+    result = calibrate(str(path), quick=True)
+    assert result["path"] == str(path)
+    data = json.loads(path.read_text())
+    assert set(data["profiles"]) == set(BUILTIN_PROFILES)
+    assert data["measurements"]["predicate_throughput"] > 0
+    # amostragem em cache por poll: nunca deve empurrar o piso para segundos
+    assert all(p.poll_interval <= 0.25 for p in result["profiles"].values())
@@ -0,0 +1,153 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from nano_wait import CANCELLED, CancelToken, VirtualClock
+from nano_wait.cancel import install_sigterm_hook, remove_sigterm_hook
+from nano_wait.decorators import retry
+from nano_wait.execution import execute
+from nano_wait.nano_wait import wait
+from nano_wait.nano_wait_auto import wait_auto
+from nano_wait.pipeline import Pipeline
+
+
+def _cancel_later(token, delay=0.05):
+    timer = threading.Timer(delay, token.cancel)
+    timer.start()
+    return timer
+
+
+def test_sentinel_is_falsy_and_distinct():
+    assert not CANCELLED
+    assert CANCELLED is not False and repr(CANCELLED) == "CANCELLED"
+
+
+def test_cancel_wakes_time_wait_immediately():
+    token = CancelToken()
+    _cancel_later(token)
+    start = time.monotonic()
+    assert wait(5, smart=True, cancel=token) is CANCELLED
+    assert time.monotonic() - start < 1.0
+
+
+def test_cancel_wakes_condition_wait():
+    token = CancelToken()
+    _cancel_later(token)
+    start = time.monotonic()
+    assert wait(lambda: False, timeout=10, cancel=token) is CANCELLED
+    assert time.monotonic() - start < 1.0
+
+
+def test_already_cancelled_token_with_virtual_clock():
+    token = CancelToken()
+    token.cancel()
+    clock = VirtualClock()
+    assert wait(lambda: False, timeout=30, clock=clock, cancel=token) is CANCELLED
+    assert clock.now() == 0.0
+    assert wait_auto(1.0, clock=clock, cancel=token) is CANCELLED
+
+
+def test_execute_retry_and_pipeline_report_cancellation():
+    token = CancelToken()
+    _cancel_later(token)
+    start = time.monotonic()
+    result = execute(lambda: False, timeout=15, interval=0.5, cancel=token)
+    assert result.cancelled and not result.success
+    assert time.monotonic() - start < 1.0
+
+    assert retry(timeout=15, cancel=token)(lambda: False)().cancelled
+    results = Pipeline().add(lambda: True).add(lambda: False).run(cancel=token)
+    assert [r.cancelled for r in results] == [True]
+
+
+def test_child_and_any_tokens():
+    parent, other = CancelToken(), CancelToken()
+    child = parent.child()
+    combined = CancelToken.any(parent, other)
+    other.cancel("stop")
+    assert combined.cancelled and combined.reason == "stop"
+    assert not child.cancelled
+    parent.cancel()
+    assert child.cancelled
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM") or os.name != "posix", reason="POSIX only")
+def test_sigterm_hook_cancels_waits_without_explicit_token():
+    received = []
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum))
+    token = install_sigterm_hook()
+    try:
+        threading.Timer(0.05, os.kill, (os.getpid(), signal.SIGTERM)).start()
+        start = time.monotonic()
+        assert wait(lambda: False, timeout=10) is CANCELLED
+        assert token.cancelled and token.reason == "SIGTERM"
+        assert time.monotonic() - start < 1.0
+        assert received == [signal.SIGTERM]          # handler anterior encadeado
+    finally:
+        remove_sigterm_hook()
+        signal.signal(signal.SIGTERM, previous)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM") or os.name != "posix", reason="POSIX only")
+def test_sigterm_hook_still_terminates_with_default_handler(tmp_path):
+    script = textwrap.dedent("""
+        import os, signal, threading
+        from nano_wait import install_sigterm_hook, wait
+
+        install_sigterm_hook()
+        results = []
+        worker = threading.Thread(target=lambda: results.append(wait(lambda: False, timeout=10)))
+        worker.start()
+        threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGTERM)).start()
+        try:
+            wait(lambda: False, timeout=10)
+        finally:
+            worker.join()
+            print(results[0])
+    """)
+    env = dict(os.environ, HOME=str(tmp_path), NANO_WAIT_TELEMETRY="0")
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=20, env=env)
+    assert proc.returncode == 128 + signal.SIGTERM
+    assert proc.stdout.strip() == "CANCELLED"
+
+
+class _LegacyClock:
+    """Relógio no protocolo original: apenas now() e sleep(seconds)."""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def now(self):
+        return self.t
+
+    def sleep(self, seconds):
+        self.t += seconds
+
+
+def test_clock_without_cancel_parameter_still_works():
+    clock = _LegacyClock()
+    token = CancelToken()
+    assert wait(2, clock=clock, cancel=token) > 0
+    assert wait(lambda: clock.now() >= 1.0, timeout=5, clock=clock, cancel=token) is True
+
+    token.cancel()
+    before = clock.now()
+    assert wait(lambda: False, timeout=5, clock=clock, cancel=token) is CANCELLED
+    assert clock.now() == before
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM") or os.name != "posix", reason="POSIX only")
+def test_legacy_clock_with_sigterm_hook_installed():
+    install_sigterm_hook()
+    try:
+        clock = _LegacyClock()
+        assert wait(lambda: clock.now() >= 1.0, timeout=5, clock=clock) is True
+        assert execute(lambda: False, timeout=2, interval=0.5, clock=clock).success is False
+    finally:
+        remove_sigterm_hook()
@@ -0,0 +1,69 @@
+import pytest
+
+from nano_wait import cgroup
+from nano_wait.cgroup import CgroupStats, parse_cpu_max, parse_pressure
+from nano_wait.providers import ProviderRegistry, register_builtin_providers
+
+PSI = "some avg10={some} avg60=0.00 avg300=0.00 total=0\nfull avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+
+
+@pytest.fixture
+def fake_cgroup(tmp_path):
+    root = tmp_path / "cgroup"
+    pod = root / "kubepods" / "pod1"
+    pod.mkdir(parents=True)
+    (root / "cgroup.controllers").write_text("cpu memory io\n")
+    proc = tmp_path / "self_cgroup"
+    proc.write_text("0::/kubepods/pod1\n")
+    pressure = tmp_path / "pressure"
+    pressure.mkdir()
+
+    (pod / "cpu.max").write_text("50000 100000\n")
+    (pod / "cpu.stat").write_text("usage_usec 0\nnr_periods 0\nnr_throttled 0\n")
+    (pod / "memory.current").write_text(str(256 * 2**20))
+    (pod / "memory.max").write_text(str(1024 * 2**20))
+    (pod / "cpu.pressure").write_text(PSI.format(some="0.00"))
+    (pod / "memory.pressure").write_text(PSI.format(some="0.00"))
+
+    stats = CgroupStats(str(root), proc_cgroup=str(proc), pressure_dir=str(pressure))
+    return stats, pod
+
+
+def test_parsers():
+    assert parse_cpu_max("200000 100000") == 2.0
+    assert parse_cpu_max("max 100000") is None
+    assert parse_pressure(PSI.format(some="12.50")) == 12.5
+    assert parse_pressure(PSI.format(some="1.0"), kind="full") == 0.0
+
+
+def test_resolves_process_cgroup_and_limits(fake_cgroup):
+    stats, pod = fake_cgroup
+    assert stats.path == str(pod)
+    assert stats.is_v2() and stats.is_limited()
+    assert stats.cpu_limit() == 0.5
+    assert stats.memory_score() == 7.5
+
+
+def test_throttling_lowers_cpu_score(fake_cgroup):
+    stats, pod = fake_cgroup
+    assert stats.cpu_score() == 10.0   # primeira leitura: sem delta, nada estrangulado
+
+    (pod / "cpu.stat").write_text("usage_usec 10\nnr_periods 10\nnr_throttled 8\n")
+    assert stats.cpu_score() == pytest.approx(2.0)
+
+
+def test_pressure_stall_dominates_score(fake_cgroup):
+    stats, pod = fake_cgroup
+    (pod / "memory.pressure").write_text(PSI.format(some="60.00"))
+    assert stats.memory_score() == 4.0
+
+
+def test_detect_and_provider_selection(fake_cgroup, monkeypatch):
+    stats, pod = fake_cgroup
+    monkeypatch.setenv("NANO_WAIT_CGROUP", "0")
+    assert cgroup.detect(stats.root) is None
+    monkeypatch.delenv("NANO_WAIT_CGROUP")
+
+    registry = register_builtin_providers(ProviderRegistry(), cgroup_stats=stats)
+    (pod / "memory.current").write_text(str(1024 * 2**20))
+    assert registry.score("memory") == 0.0
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from nano_wait import VirtualClock, use_clock
+from nano_wait.nano_wait import wait
+from nano_wait.nano_wait_async import wait_async
+from nano_wait.execution import execute
+
+
+def test_virtual_clock_advances_on_sleep():
+    clock = VirtualClock(start=10.0)
+    clock.sleep(2.5)
+    assert clock.now() == 12.5
+
+
+def test_condition_timeout_runs_instantly_with_virtual_clock():
+    clock = VirtualClock()
+    start = time.monotonic()
+    result = wait(lambda: False, timeout=30, clock=clock)
+    assert result is False
+    assert clock.now() >= 30
+    assert time.monotonic() - start < 5
+
+
+def test_condition_becomes_true_in_virtual_time():
+    clock = VirtualClock()
+    result = wait(lambda: clock.now() >= 2.0, timeout=10, clock=clock)
+    assert result is True
+    assert 2.0 <= clock.now() < 10
+
+
+def test_time_wait_advances_virtual_clock():
+    clock = VirtualClock()
+    final = wait(5, clock=clock)
+    assert clock.now() == final
+
+
+def test_use_clock_applies_to_execute():
+    with use_clock() as clock:
+        result = execute(lambda: False, timeout=20, interval=0.5, smart=False)
+    assert result.success is False
+    assert result.duration >= 20
+    assert clock.now() >= 20
+
+
+def test_wait_async_uses_virtual_clock():
+    clock = VirtualClock()
+    result = asyncio.run(wait_async(lambda: False, timeout=5, clock=clock))
+    assert result is False
+    assert clock.now() >= 5
@@ -0,0 +1,78 @@
+import os
+import stat
+import threading
+
+import pytest
+
+from nano_wait.daemon import NanoWaitServer, parse_request, request
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = NanoWaitServer(str(tmp_path / "nw.sock"))
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    thread.join()
+
+
+def test_parse_request_words_and_json():
+    assert parse_request("wait 1.5 smart=true") == {"wait": 1.5, "smart": True}
+    assert parse_request("port 5432 db timeout=30") == {"port": 5432, "host": "db", "timeout": 30}
+    assert parse_request("exec lambda x=1: x") == {"exec": "lambda x=1: x"}
+    assert parse_request('{"path": "/x"}') == {"path": "/x"}
+    with pytest.raises(ValueError):
+        parse_request("jump 3")
+
+
+def test_requests_over_socket(server, tmp_path):
+    assert request("ping", server.path)["ok"] is True
+
+    response = request("wait 0.01", server.path)
+    assert response["ok"] is True and 0.0 < response["result"] <= 0.01
+
+    assert request({"id": "p", "path": str(tmp_path), "timeout": 1}, server.path)["ok"] is True
+    assert "inválida" in request("bogus", server.path)["error"]
+    assert stat.S_IMODE(os.stat(server.path).st_mode) == 0o600
+
+
+def test_exec_requires_allow_exec(server, tmp_path):
+    assert "--allow-exec" in request("exec lambda: 6*7", server.path)["error"]
+    assert request({"exec": "lambda: 1"}, server.path)["ok"] is False
+
+    srv = NanoWaitServer(str(tmp_path / "exec.sock"), allow_exec=True)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert request("exec lambda: 6*7", srv.path)["result"] == 42
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        thread.join()
+
+
+def test_concurrent_clients_share_one_server(server):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(request("wait 0.01", server.path)))
+               for _ in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert len(results) == 8 and all(r["ok"] for r in results)
+
+
+def test_refuses_to_replace_live_socket(server):
+    with pytest.raises(RuntimeError):
+        NanoWaitServer(server.path)
+
+
+def test_serve_reports_unusable_socket_path(tmp_path, capsys):
+    from nano_wait.daemon import serve_main
+
+    with pytest.raises(SystemExit) as exc:
+        serve_main(["--socket", str(tmp_path / "missing-dir" / "nw.sock")])
+    assert exc.value.code == 1
+    assert "❌" in capsys.readouterr().err
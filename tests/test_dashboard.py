@@ -0,0 +1,92 @@
+import json
+import time
+import urllib.request
+
+from nano_wait import VirtualClock, dashboard
+from nano_wait.dashboard import (
+    DashboardHub,
+    HeadlessRenderer,
+    TkRenderer,
+    WebRenderer,
+    get_dashboard,
+    make_renderer,
+    start_dashboard,
+)
+from nano_wait.nano_wait import wait
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_producers_drop_instead_of_blocking_when_full():
+    hub = DashboardHub(maxsize=4)  # consumidor não iniciado
+    channel = hub.channel("ci")
+    accepted = [channel.put({"factor": 1.0, "interval": 0.1, "count": i}) for i in range(10)]
+
+    assert accepted.count(True) == 4
+    assert hub.dropped == 6
+    hub.drain()
+    assert hub.snapshot()["sessions"][channel.session_id]["count"] == 3
+
+
+def test_all_waits_share_one_dashboard():
+    hub = start_dashboard("none")
+    clock = VirtualClock()
+    for _ in range(3):
+        wait(lambda: False, timeout=0.2, telemetry=True, clock=clock)
+
+    assert get_dashboard() is hub
+    assert _wait_for(lambda: hub.snapshot()["finished"] == 3)
+    assert hub.snapshot()["active"] == 0
+
+
+def test_web_renderer_serves_snapshot():
+    renderer = WebRenderer(port=0)
+    hub = start_dashboard(renderer)
+    hub.channel("rpa").put({"factor": 2.0, "interval": 0.3, "count": 1})
+    assert _wait_for(lambda: renderer.server is not None and renderer._latest.get("events") == 1)
+
+    port = renderer.server.server_address[1]
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/snapshot.json", timeout=5) as resp:
+        data = json.loads(resp.read())
+    assert data["active"] == 1
+    start_dashboard("none")
+
+
+def test_stop_is_never_dropped_when_queue_is_full():
+    hub = DashboardHub(maxsize=2)
+    channel = hub.channel("ci")
+    for i in range(5):
+        channel.put({"factor": 1.0, "interval": 0.1, "count": i})
+    assert channel.put("__STOP__") is True
+    hub.drain()
+    snap = hub.snapshot()
+    assert snap["active"] == 0 and snap["finished"] == 1
+
+
+def test_idle_sessions_expire():
+    hub = DashboardHub(session_ttl=10)
+    hub.channel("rpa").put({"factor": 1.0, "interval": 0.1, "count": 1})
+    hub.drain()
+    assert hub.expire(time.monotonic() + 5) == 0
+    assert hub.expire(time.monotonic() + 11) == 1
+    assert hub.snapshot()["active"] == 0 and hub.snapshot()["expired"] == 1
+
+
+def test_auto_never_runs_tk_off_the_main_thread_on_macos(monkeypatch):
+    monkeypatch.setattr(dashboard.sys, "platform", "darwin")
+    assert isinstance(make_renderer("auto"), HeadlessRenderer)
+
+    hub = DashboardHub(TkRenderer(), refresh=0.01)   # pedido explícito: a thread do hub não é a principal
+    hub.start()
+    try:
+        assert _wait_for(lambda: isinstance(hub.renderer, HeadlessRenderer))
+    finally:
+        hub.stop()
+        hub.join()
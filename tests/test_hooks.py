@@ -0,0 +1,51 @@
+from nano_wait import VirtualClock
+from nano_wait.execution import execute
+from nano_wait.hooks import HOOKS, NULL_TIMER, PhaseStats, add_hook, remove_hook
+from nano_wait.nano_wait import wait
+
+
+def test_no_hooks_uses_null_timer():
+    assert not HOOKS
+    assert HOOKS.timer("wait") is NULL_TIMER
+
+
+def test_wait_reports_phase_breakdown():
+    reports = []
+    hook = add_hook(reports.append)
+    try:
+        wait(0.2, clock=VirtualClock())
+    finally:
+        remove_hook(hook)
+
+    report = reports[-1]
+    assert report.kind == "wait"
+    assert {"learning_load", "context", "compute", "sleep", "learning_update"} <= set(report.phases)
+    assert report.info["outcome"] == "ok"
+    assert abs(sum(report.phases.values()) - report.total) < 0.01
+
+
+def test_phase_stats_aggregates_histograms():
+    stats = add_hook(PhaseStats())
+    try:
+        clock = VirtualClock()
+        for _ in range(5):
+            wait(lambda: False, timeout=1, clock=clock)
+        execute(lambda: True)
+    finally:
+        remove_hook(stats)
+
+    snapshot = stats.snapshot()
+    assert snapshot["wait"]["predicate"]["count"] == 5
+    assert snapshot["wait"]["total"]["p50"] > 0
+    assert stats.histogram("execute", "call").count == 1
+
+
+def test_failing_hook_does_not_break_wait():
+    def broken(report):
+        raise RuntimeError("boom")
+
+    add_hook(broken)
+    try:
+        assert wait(lambda: True, timeout=1) is True
+    finally:
+        remove_hook(broken)
@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ("tkinter", "psutil", "pywifi", "pyautogui", "asyncio", "socket", "subprocess")
+
+# Teto generoso para máquinas de CI lentas; o custo real é ~1-2 ms.
+IMPORT_BUDGET_US = 50_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _loaded_heavy_modules(statement: str) -> list:
+    code = (
+        f"import sys, json\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    return json.loads(_run(code).stdout)
+
+
+def test_import_nano_wait_is_within_budget():
+    stderr = _run("import nano_wait", "-X", "importtime").stderr
+    cumulative = None
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "nano_wait":
+            cumulative = int(parts[1])
+    assert cumulative is not None
+    assert cumulative < IMPORT_BUDGET_US
+
+
+def test_import_nano_wait_loads_no_heavy_modules():
+    assert _loaded_heavy_modules("import nano_wait") == []
+
+
+def test_wait_and_cli_do_not_load_optional_modules():
+    assert _loaded_heavy_modules("from nano_wait import wait") == []
+    assert _loaded_heavy_modules("import nano_wait.cli") == []
+
+
+def test_lazy_attributes_resolve():
+    import nano_wait
+
+    assert callable(nano_wait.wait)
+    assert callable(nano_wait.execute)
+    assert "wait_pool" in dir(nano_wait)
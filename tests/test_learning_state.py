@@ -0,0 +1,91 @@
+import json
+import threading
+
+from nano_wait import cli
+from nano_wait.clock import VirtualClock
+from nano_wait.learning import SEED_ENV, AdaptiveLearning, export_state, get_store, import_state, merge_states
+from nano_wait.nano_wait import wait
+
+
+def _runner(tmp_path, name, bias, samples, ready=None):
+    profile = {"bias": bias, "samples": samples, "timeouts": 1}
+    if ready is not None:
+        profile["ready"] = {"login": ready}
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps({"profiles": {"ci": profile}}))
+    return path
+
+
+def test_merge_is_sample_weighted_and_skips_bad_files(tmp_path):
+    a = _runner(tmp_path, "a", 1.0, 30)
+    b = _runner(tmp_path, "b", 2.0, 10)
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+
+    merged = merge_states([a, b, bad])
+    ci = merged["profiles"]["ci"]
+    assert ci["bias"] == 1.25
+    assert ci["samples"] == 40 and ci["timeouts"] == 2
+    assert (merged["merged"], merged["skipped"]) == (2, 1)
+
+
+def test_merge_combines_tables_and_ready_histograms():
+    learning = AdaptiveLearning("ci")
+    for _ in range(4):
+        learning.update(True, 1.0, 1.0, key="login", ready_time=2.0, context={"pc_score": 8.0, "net_score": None})
+    snapshot = export_state()
+
+    merged = merge_states([snapshot, snapshot])["profiles"]["ci"]
+    assert sum(merged["table"]["samples"]) == 8
+    assert merged["ready"]["login"]["count"] == 8
+
+
+def test_import_merges_or_replaces_local_state(tmp_path):
+    AdaptiveLearning("ci").update(True, 1.0, 1.0)
+    snapshot = _runner(tmp_path, "fleet", 2.0, 99)
+
+    state = import_state(snapshot)
+    assert state["profiles"]["ci"]["samples"] == 100
+
+    state = import_state(snapshot, replace=True)
+    assert state["profiles"]["ci"] == {"bias": 2.0, "samples": 99, "timeouts": 1}
+    assert AdaptiveLearning("ci").get_bias() == 2.0
+
+
+def test_seed_env_warm_starts_fresh_machine(tmp_path, monkeypatch):
+    seed = _runner(tmp_path, "seed", 1.8, 500)
+    monkeypatch.setenv(SEED_ENV, str(seed))
+    assert AdaptiveLearning("ci").get_bias() == 1.8
+
+
+def test_cli_round_trip(tmp_path, capsys):
+    runners = tmp_path / "runners"
+    runners.mkdir()
+    _runner(runners, "r1", 1.0, 10)
+    _runner(runners, "r2", 1.5, 10)
+    out = tmp_path / "merged.json"
+
+    cli.main(["learning", "merge", str(runners), "-o", str(out)])
+    assert json.loads(out.read_text())["profiles"]["ci"]["bias"] == 1.25
+
+    cli.main(["learning", "import", str(out), "--replace"])
+    cli.main(["learning", "export"])
+    exported = json.loads(capsys.readouterr().out.split("\n", 1)[1])
+    assert exported["profiles"]["ci"]["samples"] == 20
+
+
+def test_concurrent_waits_share_one_store_and_keep_every_sample():
+    def worker():
+        for _ in range(100):
+            wait(0.5, clock=VirtualClock())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    storage = AdaptiveLearning._storage_path
+    assert get_store().data["profiles"]["default"]["samples"] == 800
+    assert json.loads(storage.read_text())["profiles"]["default"]["samples"] == 800
+    assert [p.name for p in storage.parent.iterdir() if p.suffix == ".tmp"] == []
@@ -0,0 +1,97 @@
+import json
+import logging
+import time
+
+from nano_wait import VirtualClock
+from nano_wait.logsink import LogSink, configure_logging, get_sink
+from nano_wait.nano_wait import wait
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_batched_as_json_lines(tmp_path):
+    path = tmp_path / "waits.jsonl"
+    sink = LogSink(str(path), flush_interval=0.05)
+    for i in range(100):
+        sink.log("wait", i=i)
+    assert sink.flush()
+
+    records = _read_lines(path)
+    assert [r["i"] for r in records] == list(range(100))
+    assert records[0]["event"] == "wait"
+    assert "T" in records[0]["ts"]
+    sink.close()
+
+
+def test_emit_is_cheap_on_the_hot_path(tmp_path):
+    sink = LogSink(str(tmp_path / "hot.jsonl"))
+    start = time.perf_counter()
+    for i in range(10_000):
+        sink.log("wait", i=i)
+    per_call = (time.perf_counter() - start) / 10_000
+    sink.close()
+    assert per_call < 50e-6
+
+
+def test_size_based_rotation(tmp_path):
+    path = tmp_path / "rot.jsonl"
+    sink = LogSink(str(path), max_bytes=2_000, backup_count=2, batch_size=10)
+    for i in range(500):
+        sink.log("wait", payload="x" * 20, i=i)
+    sink.close()
+
+    assert (tmp_path / "rot.jsonl.1").exists()
+    assert (tmp_path / "rot.jsonl.2").exists()
+    assert not (tmp_path / "rot.jsonl.3").exists()
+
+
+def test_wait_log_flag_and_stdlib_logger(tmp_path):
+    path = tmp_path / "nano.jsonl"
+    configure_logging(str(path), flush_interval=0.05)
+    try:
+        wait(0.1, log=True, clock=VirtualClock())
+        logging.getLogger("nano_wait").warning("hello %s", "world")
+        assert get_sink().flush()
+    finally:
+        configure_logging(attach_logger=False)
+
+    records = _read_lines(path)
+    assert records[0]["event"] == "wait" and records[0]["mode"] == "time"
+    assert records[1]["msg"] == "hello world" and records[1]["level"] == "WARNING"
+
+
+def test_dead_writer_stops_enqueueing(tmp_path, capsys):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    sink = LogSink(str(blocker / "waits.jsonl"), flush_interval=0.01)
+    sink.log("wait", i=0)
+    sink._thread.join(2)
+
+    for i in range(10_000):
+        sink.log("wait", i=i)
+    assert sink.error is not None
+    assert sink._q.qsize() == 0
+    assert sink.dropped >= 10_000
+    assert sink.flush() is False
+    assert capsys.readouterr().err.count("log writer stopped") == 1
+    sink.close()
+
+
+def test_bounded_queue_drops_on_overflow(tmp_path):
+    sink = LogSink(str(tmp_path / "full.jsonl"), max_queue=10)
+    sink._thread = object()  # escritora nunca iniciada: a fila só enche
+    for i in range(25):
+        sink.log("wait", i=i)
+    assert sink._q.qsize() == 10 and sink.dropped == 15
+
+
+def test_default_path_does_not_reuse_legacy_plaintext_log(monkeypatch):
+    monkeypatch.delenv("NANO_WAIT_LOG_PATH", raising=False)
+    sink = LogSink()
+    try:
+        assert sink.path == "nano_wait.jsonl"
+    finally:
+        sink.close()
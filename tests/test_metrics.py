@@ -0,0 +1,74 @@
+import threading
+import urllib.request
+
+from nano_wait import VirtualClock
+from nano_wait.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    disable_metrics,
+    enable_metrics,
+    start_metrics_server,
+    stop_metrics_server,
+)
+from nano_wait.nano_wait import wait
+
+
+def test_wait_calls_feed_the_registry():
+    registry = enable_metrics(MetricsRegistry())
+    try:
+        clock = VirtualClock()
+        wait(0.1, clock=clock)
+        wait(lambda: False, timeout=1, clock=clock)
+    finally:
+        disable_metrics()
+
+    text = registry.render()
+    assert 'nano_wait_waits_total{kind="wait",profile="default",key="default",outcome="ok"} 1.0' in text
+    assert 'nano_wait_timeouts_total{kind="wait",profile="default",key="default"} 1.0' in text
+    assert "# TYPE nano_wait_duration_seconds histogram" in text
+    assert 'nano_wait_duration_seconds_count{kind="wait",profile="default",key="default"} 2' in text
+    assert "nano_wait_learned_bias{" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    for value in (0.002, 0.02, 0.2):
+        registry.observe("h", (("k", "v"),), value)
+    text = registry.render()
+    assert 'h_bucket{k="v",le="0.005"} 1' in text
+    assert 'h_bucket{k="v",le="0.025"} 2' in text
+    assert 'h_bucket{k="v",le="+Inf"} 3' in text
+
+
+def test_http_endpoint_serves_openmetrics():
+    registry = MetricsRegistry()
+    registry.inc("nano_wait_polls", (("profile", "ci"),), 3)
+    server = start_metrics_server(port=0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            body = resp.read().decode()
+            assert resp.headers["Content-Type"] == CONTENT_TYPE
+    finally:
+        stop_metrics_server()
+
+    assert 'nano_wait_polls_total{profile="ci"} 3.0' in body
+
+
+def test_short_lived_threads_fold_their_shards():
+    registry = MetricsRegistry()
+
+    def work():
+        registry.inc("jobs", (("kind", "batch"),))
+        registry.observe("latency", (), 0.02)
+
+    for _ in range(200):
+        t = threading.Thread(target=work)
+        t.start()
+        t.join()
+
+    assert len(registry._shards) <= 1
+    counters, _, histograms = registry.collect()
+    assert counters[("jobs", (("kind", "batch"),))] == 200
+    assert histograms[("latency", ())].count == 200
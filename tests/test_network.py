@@ -0,0 +1,70 @@
+import socket
+import time
+
+import pytest
+
+from nano_wait.core import NanoWait
+from nano_wait.network import NetworkProbe, parse_targets, rtt_score
+
+
+@pytest.fixture
+def tcp_server():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(16)
+    yield server.getsockname()
+    server.close()
+
+
+def _closed_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def test_probe_reports_reachable_local_target(tcp_server):
+    probe = NetworkProbe([tcp_server], timeout=1)
+    status = probe.refresh()
+    assert status.reachable is True
+    assert status.rtt < 0.5
+    assert status.score > 5
+
+
+def test_probe_reports_unreachable_target():
+    probe = NetworkProbe([("127.0.0.1", _closed_port())], timeout=0.5)
+    status = probe.refresh()
+    assert status.reachable is False
+    assert status.score == 0.0
+
+
+def test_probe_leaves_global_socket_timeout_untouched(tcp_server):
+    before = socket.getdefaulttimeout()
+    NetworkProbe([tcp_server], timeout=0.3).refresh()
+    assert socket.getdefaulttimeout() == before
+
+
+def test_read_is_non_blocking_and_refreshes_in_background(tcp_server):
+    probe = NetworkProbe([tcp_server], ttl=60)
+    assert probe.read().reachable is None
+
+    deadline = time.monotonic() + 5
+    while probe.read().reachable is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert probe.read().reachable is True
+
+
+def test_network_score_feeds_compute_wait(tcp_server):
+    nw = NanoWait()
+    base = {"pc_score": 5.0, "wifi_score": None, "net_score": None}
+    fast = dict(base, net_score=10.0)
+    slow = dict(base, net_score=0.0)
+    assert nw.compute_wait(1.0, 1.0, fast) < nw.compute_wait(1.0, 1.0, base) < nw.compute_wait(1.0, 1.0, slow)
+
+
+def test_rtt_score_and_target_parsing():
+    assert rtt_score(0.005) == 10.0
+    assert rtt_score(0.1) == 5.0
+    assert rtt_score(2.0) == 0.0
+    assert parse_targets("10.0.0.1:53, example.com:443") == (("10.0.0.1", 53), ("example.com", 443))
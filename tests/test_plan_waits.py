@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from nano_wait.core import NanoWait, finalize_wait
+
+CONTEXT = {"pc_score": 6.37, "wifi_score": 4.2, "net_score": None}
+
+
+def _scalar(nw, bases, speeds, bias, cap):
+    return [
+        finalize_wait(nw.compute_wait(b, s, CONTEXT), b, bias, cap)
+        for b, s in zip(bases, speeds)
+    ]
+
+
+@pytest.mark.parametrize("backend", ["array", "numpy"])
+@pytest.mark.parametrize("profile", ["ci", "rpa", None])
+def test_batch_matches_scalar_exactly(backend, profile):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    rng = random.Random(42)
+    nw = NanoWait(profile)
+    bases = [rng.uniform(0.0, 5.0) for _ in range(2000)] + [0.0, 0.004, 1e-5]
+    speeds = [rng.choice([0.05, 0.8, 1.5, 3.0, 6.0]) for _ in bases]
+
+    for cap in (True, False):
+        planned = nw.plan_waits(bases, speeds, CONTEXT, bias=1.37, cap=cap, backend=backend)
+        assert list(planned) == _scalar(nw, bases, speeds, 1.37, cap)
+
+    planned = nw.plan_waits(bases, 1.5, CONTEXT, backend=backend)
+    assert list(planned) == _scalar(nw, bases, [1.5] * len(bases), 1.0, True)
+
+
+def test_compute_wait_batch_matches_compute_wait():
+    nw = NanoWait("rpa")
+    bases = [0.1, 1.0, 2.5]
+    raw = nw.compute_wait_batch(bases, 3.0, CONTEXT, backend="array")
+    assert list(raw) == [nw.compute_wait(b, 3.0, CONTEXT) for b in bases]
+
+
+def test_floor_and_cap_rules():
+    nw = NanoWait()
+    slow = {"pc_score": 0.0, "wifi_score": 0.0, "net_score": None}
+    planned = nw.plan_waits([0.001, 2.0], 0.8, slow, backend="array")
+    assert list(planned) == [0.01, 2.0]          # piso de 10ms; teto no tempo pedido
+    uncapped = nw.plan_waits([2.0], 0.8, slow, cap=False, backend="array")
+    assert uncapped[0] > 2.0
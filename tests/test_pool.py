@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+from nano_wait.nano_wait_pool import wait_pool, wait_pool_async
+
+
+def test_default_results_unchanged():
+    results = wait_pool([0.05, 0.05])
+    assert len(results) == 2 and all(r > 0 for r in results)
+
+
+def test_cancel_if_true_up_front_skips_everything():
+    items = wait_pool([1.0, 1.0], cancel_if=lambda: True, with_status=True)
+    assert [i.status for i in items] == ["skipped", "skipped"]
+
+
+def test_cancel_if_is_rechecked_while_sleeping():
+    deadline = time.monotonic() + 0.2
+    start = time.monotonic()
+    items = wait_pool([0.05, 3.0, 3.0], cancel_if=lambda: time.monotonic() >= deadline,
+                      cancel_check_interval=0.02, with_status=True)
+    assert time.monotonic() - start < 1.5
+    assert [i.status for i in items] == ["ok", "cancelled", "cancelled"]
+    assert items[0].result > 0 and items[1].result is None
+
+
+def test_max_concurrency_bounds_running_waits():
+    async def run():
+        return await wait_pool_async([0.05] * 4, max_concurrency=1, with_status=True)
+
+    start = time.monotonic()
+    items = asyncio.run(run())
+    assert time.monotonic() - start >= 0.15
+    assert all(i.status == "ok" for i in items)
+    assert [i.index for i in items] == [0, 1, 2, 3]
+
+
+def test_cancel_while_queued_marks_skipped():
+    deadline = time.monotonic() + 0.1
+    items = wait_pool([0.5, 0.5, 0.5], max_concurrency=1, cancel_if=lambda: time.monotonic() >= deadline,
+                      cancel_check_interval=0.02, with_status=True)
+    assert [i.status for i in items] == ["cancelled", "skipped", "skipped"]
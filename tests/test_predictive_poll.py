@@ -0,0 +1,86 @@
+import pytest
+
+from nano_wait.clock import VirtualClock
+from nano_wait.learning import MAX_READY_SAMPLES, MIN_READY_SAMPLES, AdaptiveLearning
+from nano_wait.nano_wait import wait
+
+
+def _page_load(clock, ready_after):
+    start = clock.now()
+    calls = []
+
+    def predicate():
+        calls.append(clock.now() - start)
+        return clock.now() - start >= ready_after
+
+    return predicate, calls
+
+
+def test_learned_key_delays_first_poll_and_cuts_predicate_calls():
+    clock = VirtualClock()
+    polls = []
+    latencies = []
+    for _ in range(MIN_READY_SAMPLES + 3):
+        predicate, calls = _page_load(clock, 4.0)
+        assert wait(predicate, timeout=15, key="login", clock=clock) is True
+        polls.append(len(calls))
+        latencies.append(calls[-1] - 4.0)
+
+    cold, warm = polls[0], polls[-1]
+    assert cold >= 10 * warm
+    assert latencies[-1] <= latencies[0] + 1e-9
+
+    hist = AdaptiveLearning("default").ready_distribution("login")
+    assert hist.count == len(polls)
+
+
+def test_without_key_or_history_polls_from_start():
+    clock = VirtualClock()
+    predicate, calls = _page_load(clock, 0.0)
+    assert wait(predicate, timeout=5, clock=clock) is True
+    assert calls == [0.0]
+
+    learning = AdaptiveLearning("default")
+    learning.update(True, 1.0, 1.0, key="rare", ready_time=2.0)
+    assert learning.ready_plan("rare") is None   # histórico insuficiente
+
+
+def test_ready_plan_quantiles():
+    learning = AdaptiveLearning("default")
+    for i in range(20):
+        learning.update(True, 1.0, 1.0, key="api", ready_time=1.0 + i * 0.05)
+    early, late, dense = learning.ready_plan("api")
+    assert 0.9 <= early < late <= 2.2
+    assert dense == pytest.approx(max(0.01, (late - early) / 8))
+
+
+def test_first_poll_moves_earlier_when_condition_gets_faster():
+    clock = VirtualClock()
+    for _ in range(20):
+        predicate, _ = _page_load(clock, 4.0)
+        assert wait(predicate, timeout=15, key="login", clock=clock) is True
+
+    latencies = []
+    for _ in range(60):
+        start = clock.now()
+        predicate, _ = _page_load(clock, 0.5)
+        assert wait(predicate, timeout=15, key="login", clock=clock) is True
+        latencies.append(clock.now() - start)
+
+    assert max(latencies[:3]) > 2.0              # ainda no plano antigo
+    assert max(latencies[-10:]) < 0.75           # o primeiro poll acompanhou a mudança
+    first_delay, _, _ = AdaptiveLearning("default").ready_plan("login")
+    assert first_delay < 0.75
+
+
+def test_censored_count_decays_with_histogram():
+    learning = AdaptiveLearning("default")
+    for _ in range(MAX_READY_SAMPLES - 1):
+        learning.update(True, 1.0, 1.0, key="api", ready_time=1.0, censored=True)
+    data = learning._data["profiles"]["default"]["ready"]["api"]
+    assert data["censored"] == data["count"] == MAX_READY_SAMPLES - 1
+
+    learning.update(True, 1.0, 1.0, key="api", ready_time=1.0)
+    data = learning._data["profiles"]["default"]["ready"]["api"]
+    assert data["count"] == MAX_READY_SAMPLES // 2
+    assert data["censored"] == (MAX_READY_SAMPLES - 1) // 2
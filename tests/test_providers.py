@@ -0,0 +1,94 @@
+import pytest
+
+from nano_wait.core import NanoWait
+from nano_wait.providers import ContextProvider, DiskIOScore, ProviderRegistry, register_builtin_providers
+
+
+class FixedWifi:
+    def __init__(self, score):
+        self.score = score
+
+    def read(self, ssid=None):
+        return self.score
+
+
+def _registry(cpu=8.0, mem=6.0, wifi=4.0):
+    registry = ProviderRegistry(wifi=FixedWifi(wifi))
+    register_builtin_providers(registry)
+    registry.register(ContextProvider("cpu", lambda o: cpu, weight=0.3, neutral=5.0))
+    registry.register(ContextProvider("memory", lambda o: mem, weight=0.2, neutral=5.0))
+    return registry
+
+
+def test_default_weights_reproduce_legacy_health():
+    nw = NanoWait(providers=_registry())
+    pc = 8.0 * 0.6 + 6.0 * 0.4
+
+    ctx = nw.snapshot_context("home")
+    assert ctx["pc_score"] == pytest.approx(pc)
+    assert ctx["wifi_score"] == 4.0
+    assert ctx["health"] == pytest.approx((pc + 4.0) / 2)
+
+    # sem SSID o Wi-Fi entra com o valor neutro, como antes
+    ctx = nw.snapshot_context()
+    assert ctx["wifi_score"] is None
+    assert ctx["health"] == pytest.approx((pc + 5.0) / 2)
+
+    legacy = {"pc_score": pc, "wifi_score": None, "net_score": None}
+    assert nw.compute_wait(1.0, 1.5, ctx) == pytest.approx(nw.compute_wait(1.0, 1.5, legacy))
+
+
+def test_custom_provider_changes_health_and_can_be_removed():
+    registry = _registry(cpu=5.0, mem=5.0)
+    nw = NanoWait(providers=registry)
+    baseline = nw.snapshot_context()["health"]
+
+    registry.register(ContextProvider("queue", lambda o: 0.0, weight=0.5))
+    loaded = nw.snapshot_context()
+    assert loaded["providers"]["queue"] == 0.0
+    assert loaded["health"] < baseline
+
+    registry.set_weight("queue", 0.0)
+    assert nw.snapshot_context()["health"] == pytest.approx(baseline)
+    registry.unregister("queue")
+    assert "queue" not in registry.names()
+
+
+def test_refresh_interval_reuses_expensive_readings():
+    calls = []
+
+    def expensive(options):
+        calls.append(1)
+        return 7.0
+
+    registry = ProviderRegistry(wifi=FixedWifi(5.0))
+    registry.register(ContextProvider("slow", expensive, weight=1.0, cost=0.5, refresh_interval=60))
+    registry.register(ContextProvider("cheap", lambda o: 3.0, weight=1.0))
+    for _ in range(5):
+        scores, health = registry.evaluate()
+    assert len(calls) == 1
+    assert health == pytest.approx(5.0)
+    assert registry.names()[0] == "slow"  # mais caro primeiro
+
+
+def test_failing_or_unavailable_provider_falls_back():
+    def broken(options):
+        raise RuntimeError("sensor offline")
+
+    registry = ProviderRegistry(wifi=FixedWifi(5.0))
+    registry.register(ContextProvider("broken", broken, weight=1.0, neutral=2.0))
+    registry.register(ContextProvider("missing", lambda o: None, weight=1.0))
+    registry.register(ContextProvider("ok", lambda o: 8.0, weight=1.0))
+    scores, health = registry.evaluate()
+    assert scores["broken"] is None
+    assert health == pytest.approx(5.0)   # (2 neutro + 8) / 2; "missing" fica fora
+
+
+def test_disk_io_score_from_diskstats(tmp_path):
+    stats = tmp_path / "diskstats"
+    row = "   8       0 sda 1 0 0 0 1 0 0 0 0 {busy} 0\n"
+    stats.write_text(row.format(busy=1000))
+    score = DiskIOScore(str(stats))
+    assert score({}) is None            # primeira leitura só define a base
+    stats.write_text(row.format(busy=1000))
+    assert score({}) == 10.0            # nenhum tempo ocupado desde então
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nano_wait.clock import VirtualClock
+from nano_wait.nano_wait import wait
+from nano_wait.nano_wait_async import wait_async
+from nano_wait.singleflight import SingleFlight
+
+
+def _slow_health(ready_at, calls, lock):
+    def check():
+        with lock:
+            calls.append(time.monotonic())
+        time.sleep(0.05)
+        return time.monotonic() >= ready_at
+    return check
+
+
+def test_concurrent_callers_share_one_evaluation():
+    group = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(10)
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.1)
+        return "up"
+
+    results = []
+
+    def caller():
+        barrier.wait()
+        results.append(group.do("health", fn))
+
+    threads = [threading.Thread(target=caller) for _ in range(10)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert results == ["up"] * 10
+    assert len(calls) == 1
+    assert len(group) == 0  # sem TTL nada fica em cache
+
+
+def test_ttl_reuses_result_but_never_caches_errors():
+    group = SingleFlight()
+    calls = []
+    assert group.do("k", lambda: calls.append(1) or True, ttl=10) is True
+    assert group.do("k", lambda: calls.append(1) or False, ttl=10) is True
+    assert len(calls) == 1
+    group.forget("k")
+    assert group.do("k", lambda: False) is False
+
+    with pytest.raises(ZeroDivisionError):
+        group.do("err", lambda: 1 / 0, ttl=10)
+    assert group.do("err", lambda: "recovered", ttl=10) == "recovered"
+
+
+def test_waiters_on_same_key_keep_checked_system_load_flat():
+    lock = threading.Lock()
+    calls = []
+    check = _slow_health(time.monotonic() + 0.4, calls, lock)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(wait(check, timeout=5, share_key="api", share_ttl=0.05)))
+        for _ in range(20)
+    ]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert results == [True] * 20
+    # 20 esperas independentes fariam >= 20 * polls avaliações
+    assert len(calls) < 20
+
+
+def test_wait_async_shares_with_key():
+    lock = threading.Lock()
+    calls = []
+    check = _slow_health(time.monotonic() + 0.2, calls, lock)
+
+    async def run():
+        return await asyncio.gather(*[wait_async(check, timeout=5, share_key="db", share_ttl=0.05) for _ in range(8)])
+
+    assert asyncio.run(run()) == [True] * 8
+    assert len(calls) < 8 * 2
+
+
+def test_ttl_expiry_follows_injected_clock():
+    clock = VirtualClock()
+    group = SingleFlight(clock)
+    calls = []
+    assert group.do("k", lambda: calls.append(1) or True, ttl=5) is True
+    clock.advance(4.9)
+    group.do("k", lambda: calls.append(1) or True, ttl=5)
+    assert len(calls) == 1
+    clock.advance(0.2)
+    group.do("k", lambda: calls.append(1) or True, ttl=5)
+    assert len(calls) == 2
+
+
+def test_async_followers_do_not_hold_executor_threads():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "up"
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        tasks = [asyncio.ensure_future(group.do_async("db", fn)) for _ in range(20)]
+        await asyncio.sleep(0.05)
+        # com 20 seguidores bloqueados em Event.wait(), o executor (2 threads) estaria esgotado
+        assert await loop.run_in_executor(None, lambda: "free") == "free"
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == ["up"] * 20
+    assert len(calls) == 1
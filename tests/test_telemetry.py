@@ -0,0 +1,52 @@
+from nano_wait.telemetry import AGGREGATE, RingBuffer, TelemetrySession, aggregate_summary
+
+
+def test_ring_buffer_keeps_only_latest_entries():
+    ring = RingBuffer(capacity=3)
+    for i in range(5):
+        ring.append(float(i), 1.0, i / 10)
+
+    assert len(ring) == 3
+    assert [ts for ts, _, _ in ring] == [2.0, 3.0, 4.0]
+
+
+def test_ring_session_memory_is_bounded():
+    session = TelemetrySession(enabled=True, profile="ci", capacity=16)
+    session.start()
+    for i in range(10_000):
+        session.record(factor=1.5, interval=0.05)
+    session.stop()
+
+    assert session.events == []
+    assert len(session.ring) == 16
+    summary = session.summary()
+    assert summary["adjustments"] == 10_000
+    assert 0.04 < summary["intervals"]["p50"] < 0.06
+
+
+def test_summary_reports_quantiles_across_sessions():
+    AGGREGATE.reset()
+    for interval in (0.01, 0.1, 1.0):
+        session = TelemetrySession(enabled=True, capacity=8)
+        session.start()
+        for _ in range(10):
+            session.record(factor=1.0, interval=interval)
+        session.stop()
+
+    stats = aggregate_summary()
+    assert stats["sessions"] == 3
+    assert stats["intervals"]["p50"] < stats["intervals"]["p99"]
+    assert session.summary()["all_sessions"]["sessions"] == 3
+
+
+def test_legacy_list_mode_still_records_events():
+    session = TelemetrySession(enabled=True)
+    session.record(factor=1.0, interval=0.1)
+    assert len(session.events) == 1
+    assert session.ring is None
+
+
+def test_disabled_session_is_inert():
+    session = TelemetrySession(enabled=False, capacity=8)
+    session.record(factor=1.0, interval=0.1)
+    assert session.summary() == {}
@@ -0,0 +1,44 @@
+import json
+
+from nano_wait import usage
+from nano_wait.usage import UsageWriter
+
+
+def test_events_are_buffered_and_flushed_in_batch(tmp_path):
+    usage_file = tmp_path / "usage.jsonl"
+    uid = tmp_path / "uid"
+    writer = UsageWriter(str(usage_file), str(uid), flush_interval=3600)
+
+    for _ in range(5):
+        writer.record("session_start", "6.0.0")
+    assert not usage_file.exists()
+
+    assert writer.flush() == 5
+    events = [json.loads(line) for line in usage_file.read_text().splitlines()]
+    assert len(events) == 5
+    assert {e["anon_id"] for e in events} == {uid.read_text()}
+
+
+def test_anon_id_is_read_once(tmp_path):
+    uid = tmp_path / "uid"
+    uid.write_text("abc")
+    writer = UsageWriter(str(tmp_path / "usage.jsonl"), str(uid), flush_interval=3600)
+
+    assert writer.anon_id() == "abc"
+    uid.write_text("changed")
+    assert writer.anon_id() == "abc"
+
+
+def test_session_start_does_not_print(capsys):
+    from nano_wait.telemetry import TelemetrySession
+
+    session = TelemetrySession(enabled=True, capacity=4)
+    session.start()
+    session.stop()
+    assert capsys.readouterr().out == ""
+
+
+def test_global_writer_follows_overridden_path(tmp_path):
+    usage.WRITER.record("session_start", "6.0.0")
+    usage.WRITER.flush()
+    assert json.loads((tmp_path / "usage.jsonl").read_text())["event"] == "session_start"
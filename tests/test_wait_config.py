@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from nano_wait.clock import VirtualClock
+from nano_wait.core import PROFILES, WaitConfig, finalize_wait, get_engine
+from nano_wait.hooks import add_hook, remove_hook
+from nano_wait.nano_wait import wait
+from nano_wait.providers import ContextProvider, ProviderRegistry
+
+
+class _Wifi:
+    def read(self, ssid=None):
+        return 5.0
+
+
+@pytest.fixture
+def fixed_providers():
+    registry = ProviderRegistry(wifi=_Wifi())
+    registry.register(ContextProvider("cpu", lambda o: 8.0, weight=0.3))
+    registry.register(ContextProvider("memory", lambda o: 8.0, weight=0.2))
+    registry.register(ContextProvider("wifi", lambda o: 5.0, weight=0.5, requires="ssid", neutral=5.0))
+    return registry
+
+
+def test_configure_does_not_touch_the_engine(fixed_providers):
+    nw = get_engine()
+    before = nw.profile
+    config = nw.configure("rpa", speed="fast", providers=fixed_providers, learning_key="k")
+    assert isinstance(config, WaitConfig)
+    assert config.profile is PROFILES["rpa"] and nw.profile is before
+    assert nw.apply_profile(1.0, config) == 2.0
+    assert nw.apply_profile(1.0, "ci") == 0.5
+    with pytest.raises(Exception):
+        config.profile = PROFILES["ci"]
+
+
+def test_concurrent_profiles_do_not_leak(fixed_providers):
+    nw = get_engine()
+    reports = []
+    hook = add_hook(lambda report: reports.append((threading.current_thread().name, report)))
+    expected_profile = {"t-ci": "ci", "t-rpa": "rpa"}
+    context = nw.snapshot_context(config=nw.configure(providers=fixed_providers))
+
+    def worker(profile):
+        config = nw.configure(profile, speed="ultra", clock=VirtualClock(), providers=fixed_providers)
+        for _ in range(50):
+            wait(1.0, config=config)
+
+    threads = [threading.Thread(target=worker, args=(p,), name=f"t-{p}") for p in ("ci", "rpa")]
+    try:
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+    finally:
+        remove_hook(hook)
+
+    waits = [(name, r) for name, r in reports if r.kind == "wait" and name in expected_profile]
+    assert len(waits) == 100
+    for name, report in waits:
+        profile = expected_profile[name]
+        assert report.info["profile"] == profile
+        raw = nw.compute_wait(1.0, 6.0, context, PROFILES[profile])
+        assert report.info["interval"] == finalize_wait(raw, 1.0, report.info["bias"], cap=True)
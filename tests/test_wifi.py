@@ -0,0 +1,52 @@
+import threading
+import time
+
+from nano_wait.wifi import NEUTRAL_SCORE, WifiSignalProvider, read_proc_wireless
+
+PROC_SAMPLE = """Inter-| sta-|   Quality        |   Discarded packets               | Missed | WE
+ face | tus | link level noise |  nwid  crypt   frag  retry   misc | beacon | 22
+ wlan0: 0000   54.  -45.  -256        0      0      0      0      0        0
+"""
+
+
+def test_read_proc_wireless_uses_signal_level(tmp_path):
+    path = tmp_path / "wireless"
+    path.write_text(PROC_SAMPLE)
+    assert read_proc_wireless(str(path)) == 5.5
+
+
+def test_read_proc_wireless_without_interfaces(tmp_path):
+    path = tmp_path / "wireless"
+    path.write_text("\n".join(PROC_SAMPLE.splitlines()[:2]))
+    assert read_proc_wireless(str(path)) is None
+    assert read_proc_wireless(str(tmp_path / "missing")) is None
+
+
+def test_linux_probe_prefers_proc(tmp_path):
+    path = tmp_path / "wireless"
+    path.write_text(PROC_SAMPLE)
+    provider = WifiSignalProvider("linux", proc_path=str(path))
+    assert provider.probe() == 5.5
+
+
+def test_read_never_blocks_and_caches_result():
+    release = threading.Event()
+    calls = []
+
+    def slow_probe(ssid):
+        calls.append(ssid)
+        release.wait(5)
+        return 8.0
+
+    provider = WifiSignalProvider("linux", ttl=60, probe=slow_probe)
+    start = time.monotonic()
+    assert provider.read("office") == NEUTRAL_SCORE
+    assert provider.read("office") == NEUTRAL_SCORE
+    assert time.monotonic() - start < 0.1
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while provider.read("office") != 8.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert provider.read("office") == 8.0
+    assert calls == ["office"]